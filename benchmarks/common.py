@@ -0,0 +1,108 @@
+"""
+Shared helpers for the benchmark scripts: percentiles, result files
+and comparison against a previous run.
+"""
+import json
+import os
+import subprocess
+from datetime import datetime
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def percentile(values: list, pct: float) -> float:
+    """
+    Get a percentile using linear interpolation.
+
+    Args:
+        values: Samples
+        pct: Percentile (0-100)
+
+    Returns:
+        Percentile value (0 if there are no samples)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize_ms(samples: list) -> dict:
+    """Summarize durations (seconds) as milliseconds."""
+    if not samples:
+        return {'count': 0, 'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+    return {
+        'count': len(samples),
+        'mean': round(sum(samples) / len(samples) * 1000, 2),
+        'p50': round(percentile(samples, 50) * 1000, 2),
+        'p95': round(percentile(samples, 95) * 1000, 2),
+        'p99': round(percentile(samples, 99) * 1000, 2),
+        'max': round(max(samples) * 1000, 2),
+    }
+
+
+def git_revision() -> str:
+    """Get the current git commit (short hash), or 'unknown'."""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(RESULTS_DIR), stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return 'unknown'
+
+
+def save_results(name: str, results: dict, path: str = None) -> str:
+    """
+    Write benchmark results as JSON.
+
+    Args:
+        name: Benchmark name (used in the default file name)
+        results: Results dict
+        path: Output file (defaults to benchmarks/results/<name>_<timestamp>_<commit>.json)
+
+    Returns:
+        Path of the written file
+    """
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        path = os.path.join(RESULTS_DIR, f"{name}_{stamp}_{results.get('revision', 'unknown')}.json")
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+    return path
+
+
+def compare_results(current: dict, baseline_path: str, metrics: list) -> list:
+    """
+    Compare selected metrics against a previous results file.
+
+    Args:
+        current: Current results dict
+        baseline_path: Path to a previous results JSON
+        metrics: Dotted metric paths (e.g. 'latency_ms.p95')
+
+    Returns:
+        List of (metric, baseline, current, change_pct) tuples
+    """
+    with open(baseline_path, 'r') as f:
+        baseline = json.load(f)
+
+    def lookup(data: dict, dotted: str):
+        for part in dotted.split('.'):
+            if not isinstance(data, dict) or part not in data:
+                return None
+            data = data[part]
+        return data
+
+    rows = []
+    for metric in metrics:
+        old, new = lookup(baseline, metric), lookup(current, metric)
+        if old is None or new is None:
+            continue
+        change = round((new - old) / old * 100, 1) if old else 0.0
+        rows.append((metric, old, new, change))
+    return rows
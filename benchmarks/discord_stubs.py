@@ -0,0 +1,148 @@
+"""
+Minimal stand-ins for the Discord objects the ticket handlers touch.
+Every API-like call sleeps for a configurable latency and records how
+long it took, so per-stage timings can be reported.
+"""
+import asyncio
+import itertools
+import time
+
+_ids = itertools.count(10_000)
+
+
+class CallRecorder:
+    """Collects (call name -> durations) for stub API calls."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.timings = {}
+
+    async def call(self, name: str) -> None:
+        """Simulate one Discord API round trip."""
+        started = time.perf_counter()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.timings.setdefault(name, []).append(time.perf_counter() - started)
+
+
+class StubUser:
+    def __init__(self, index: int):
+        self.id = next(_ids)
+        self.name = f"bench_user_{index}"
+        self.discriminator = '0'
+        self.mention = f"<@{self.id}>"
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class StubResponse:
+    """interaction.response"""
+
+    def __init__(self, recorder: CallRecorder):
+        self.recorder = recorder
+        self._done = False
+        self.embed = None
+        self.sent_at = None
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def defer(self, **kwargs) -> None:
+        await self.recorder.call('interaction.defer')
+        self._done = True
+
+    async def send_message(self, *args, **kwargs) -> None:
+        await self.recorder.call('interaction.send_message')
+        self._done = True
+        self.embed = kwargs.get('embed')
+        self.sent_at = time.perf_counter()
+
+
+class StubFollowup:
+    """interaction.followup - records when the user sees the result."""
+
+    def __init__(self, recorder: CallRecorder, edits: list = None):
+        self.recorder = recorder
+        self.edits = edits
+        self.messages = []
+        self.sent_at = None
+
+    async def send(self, *args, **kwargs):
+        await self.recorder.call('followup.send')
+        self.messages.append(kwargs.get('embed'))
+        if self.sent_at is None:
+            self.sent_at = time.perf_counter()
+        return StubMessage(self.recorder, self.edits)
+
+
+class StubMessage:
+    def __init__(self, recorder: CallRecorder, edits: list = None):
+        self.id = next(_ids)
+        self.recorder = recorder
+        self.edits = edits
+
+    async def edit(self, **kwargs) -> 'StubMessage':
+        await self.recorder.call('message.edit')
+        if self.edits is not None:
+            self.edits.append((time.perf_counter(), kwargs.get('embed')))
+        return self
+
+
+class StubInteraction:
+    def __init__(self, index: int, recorder: CallRecorder):
+        self.recorder = recorder
+        self.edits = []  # (perf_counter, embed) per edit of the acknowledgement
+        self.user = StubUser(index)
+        self.response = StubResponse(recorder)
+        self.followup = StubFollowup(recorder, self.edits)
+        self.message = StubMessage(recorder)
+
+    async def edit_original_response(self, **kwargs) -> StubMessage:
+        await self.recorder.call('interaction.edit_original_response')
+        self.edits.append((time.perf_counter(), kwargs.get('embed')))
+        return StubMessage(self.recorder)
+
+
+class StubThread:
+    def __init__(self, name: str, recorder: CallRecorder):
+        self.id = next(_ids)
+        self.name = name
+        self.recorder = recorder
+        self.jump_url = f"https://discord.com/channels/0/{self.id}"
+
+    async def add_user(self, user) -> None:
+        await self.recorder.call('thread.add_user')
+
+    async def send(self, *args, **kwargs) -> StubMessage:
+        await self.recorder.call('thread.send')
+        return StubMessage(self.recorder)
+
+    async def edit(self, **kwargs) -> 'StubThread':
+        await self.recorder.call('thread.edit')
+        return self
+
+
+class StubChannel:
+    def __init__(self, channel_id: int, recorder: CallRecorder):
+        self.id = channel_id
+        self.recorder = recorder
+        self.guild = None
+
+    async def create_thread(self, name: str, **kwargs) -> StubThread:
+        await self.recorder.call('channel.create_thread')
+        return StubThread(name, self.recorder)
+
+    async def send(self, *args, **kwargs) -> StubMessage:
+        await self.recorder.call('channel.send')
+        return StubMessage(self.recorder)
+
+
+class StubBot:
+    """Just enough of commands.Bot for notify_staff."""
+
+    def __init__(self, channel_ids: list, recorder: CallRecorder):
+        self.channels = {channel_id: StubChannel(channel_id, recorder) for channel_id in channel_ids}
+
+    def get_channel(self, channel_id: int):
+        return self.channels.get(channel_id)
@@ -0,0 +1,123 @@
+"""
+FAQ search micro-benchmark.
+
+Compares the inverted-index BM25 engine (utils.faq_search) with a linear
+scan over faq_cache on synthetic FAQ sets of increasing size, including
+the cost of an incremental update after a small edit.
+
+Usage:
+    python -m benchmarks.faq_search --sizes 100 1000 5000 --queries 200
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import summarize_ms, git_revision, save_results
+from utils.faq_search import FAQSearchEngine, tokenize
+
+VOCABULARY = (
+    'order shipping delivery refund payment invoice account password login email address '
+    'tracking package courier delay damaged defect return exchange warranty voucher discount '
+    'promo card transfer bank wallet cancel change size color stock restock preorder bundle '
+    'membership points reward subscription store pickup schedule weekend holiday receipt tax '
+    'verification phone number otp security privacy data report complaint support agent'
+).split()
+
+
+def make_faq(count: int, rng: random.Random) -> list:
+    """Generate synthetic FAQ records."""
+    records = []
+    for idx in range(count):
+        label = ' '.join(rng.choice(VOCABULARY) for _ in range(rng.randint(3, 7)))
+        text = ' '.join(rng.choice(VOCABULARY) for _ in range(rng.randint(20, 60)))
+        records.append({'trigger_id': f'faq_{idx}', 'button_label': label.capitalize() + '?', 'response_text': text})
+    return records
+
+
+def linear_search(records: list, query: str, limit: int = 5) -> list:
+    """Baseline: tokenize every record on every query and rank by term overlap."""
+    terms = set(tokenize(query))
+    scored = []
+    for record in records:
+        tokens = tokenize(record.get('button_label', '')) + tokenize(record.get('response_text', ''))
+        score = sum(1 for token in tokens if token in terms)
+        if score:
+            scored.append((score, record))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return scored[:limit]
+
+
+def time_calls(func, queries: list) -> list:
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        func(query)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def run(sizes: list, query_count: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    results = {}
+    for size in sizes:
+        records = make_faq(size, rng)
+        queries = [' '.join(rng.choice(VOCABULARY) for _ in range(rng.randint(2, 5))) for _ in range(query_count)]
+
+        engine = FAQSearchEngine()
+        started = time.perf_counter()
+        engine.update(records)
+        build = time.perf_counter() - started
+
+        # Edit 1% of the entries and time the incremental update
+        edited = [dict(record) for record in records]
+        for record in rng.sample(edited, max(1, size // 100)):
+            record['response_text'] += ' updated ' + rng.choice(VOCABULARY)
+        started = time.perf_counter()
+        engine.update(edited)
+        incremental = time.perf_counter() - started
+
+        indexed = summarize_ms(time_calls(lambda query: engine.search(query, 5), queries))
+        linear = summarize_ms(time_calls(lambda query: linear_search(edited, query, 5), queries))
+        results[str(size)] = {
+            'build_ms': round(build * 1000, 2),
+            'incremental_update_ms': round(incremental * 1000, 2),
+            'indexed_search_ms': indexed,
+            'linear_scan_ms': linear,
+            'speedup_p50': round(linear['p50'] / indexed['p50'], 1) if indexed['p50'] else None,
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark FAQ search against a linear scan.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000], help='FAQ set sizes')
+    parser.add_argument('--queries', type=int, default=200, help='Queries per size')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--output', help='Results JSON path (default: benchmarks/results/)')
+    args = parser.parse_args()
+
+    sizes = run(args.sizes, args.queries, args.seed)
+    results = {
+        'benchmark': 'faq_search',
+        'revision': git_revision(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': {'queries': args.queries, 'seed': args.seed},
+        'sizes': sizes,
+    }
+
+    print(f"\nFAQ search @ {results['revision']} (p50 / p95 ms per query)")
+    for size, row in sizes.items():
+        print(f"  {size:>6} FAQ: indexed {row['indexed_search_ms']['p50']:>7} / {row['indexed_search_ms']['p95']:<7} "
+              f"linear {row['linear_scan_ms']['p50']:>8} / {row['linear_scan_ms']['p95']:<8} "
+              f"x{row['speedup_p50']}  (build {row['build_ms']} ms, 1% update {row['incremental_update_ms']} ms)")
+
+    path = save_results('faq_search', results, args.output)
+    print(f"\nResults saved to {path}")
+
+
+if __name__ == '__main__':
+    main()
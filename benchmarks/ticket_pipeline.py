@@ -0,0 +1,241 @@
+"""
+End-to-end ticket pipeline benchmark.
+
+Drives the real SupportModal.on_submit -> ticket worker pool ->
+save_lead_async -> notify_staff path with stub Discord objects and the fake
+Sheets backend, then reports throughput, latency to the user's
+acknowledgement, latency until the acknowledgement links the ticket thread
+and per-stage timings.
+
+Usage:
+    python -m benchmarks.ticket_pipeline --tickets 200 --concurrency 20
+    python -m benchmarks.ticket_pipeline --compare benchmarks/results/<previous>.json
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import summarize_ms, git_revision, save_results, compare_results
+
+COMPARE_METRICS = [
+    'throughput.tickets_per_minute',
+    'latency_ms.p50', 'latency_ms.p95', 'latency_ms.p99',
+    'thread_ready_ms.p50', 'thread_ready_ms.p95',
+    'stages_ms.save_lead.p95', 'stages_ms.notify_staff.p95',
+    'sheets.calls_per_ticket',
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark the ticket submission pipeline offline.')
+    parser.add_argument('--tickets', type=int, default=200, help='Tickets to submit')
+    parser.add_argument('--concurrency', type=int, default=20, help='Submissions in flight at once')
+    parser.add_argument('--sheets-latency', type=float, default=0.2, help='Seconds per fake Sheets call')
+    parser.add_argument('--discord-latency', type=float, default=0.05, help='Seconds per stub Discord call')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Injected Sheets 500 error rate (0-1)')
+    parser.add_argument('--write-quota', type=int, default=0, help='Simulated Sheets writes per minute (0 = unlimited)')
+    parser.add_argument('--drain-timeout', type=float, default=60.0, help='Max seconds to wait for the journal to reach Sheets')
+    parser.add_argument('--output', help='Results JSON path (default: benchmarks/results/)')
+    parser.add_argument('--compare', help='Previous results JSON to compare against')
+    return parser.parse_args()
+
+
+def configure_environment(args: argparse.Namespace, db_dir: str) -> None:
+    """Point the bot at the fake Sheets backend and a throwaway local database (before config is imported)."""
+    os.environ['SHEETS_BACKEND'] = 'fake'
+    os.environ['STORAGE_BACKEND'] = 'memory'
+    os.environ['LOCAL_DB_FILE'] = os.path.join(db_dir, 'bench.db')
+    os.environ['FAQ_SNAPSHOT_FILE'] = os.path.join(db_dir, 'faq_snapshot.json')
+    os.environ['FAKE_SHEETS_LATENCY'] = str(args.sheets_latency)
+    os.environ['FAKE_SHEETS_WRITE_QUOTA'] = str(args.write_quota)
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict:
+    """Submit tickets through the real handlers and collect timings."""
+    from config import SUPPORT_CHANNEL_ID, STAFF_NOTIFICATION_CHANNEL_ID, LEADS_TAB_NAME
+    from benchmarks.discord_stubs import CallRecorder, StubBot, StubInteraction
+    from handlers import commands as commands_module
+    from handlers import modals
+    from handlers.database import init_db_manager
+    from utils.fake_sheets import get_fake_backend
+    import main
+
+    main.load_json_cache()
+    recorder = CallRecorder(args.discord_latency)
+    commands_module.bot = StubBot([SUPPORT_CHANNEL_ID, STAFF_NOTIFICATION_CHANNEL_ID], recorder)
+
+    fake = get_fake_backend()
+    startup_started = time.perf_counter()
+    db = init_db_manager()
+    db.start_initialization()
+    db.start_background_tasks()
+    await db.wait_until_ready()
+    startup = time.perf_counter() - startup_started
+    # Inject errors only once startup is done (a failed startup has nothing to measure)
+    fake.error_rate = args.error_rate
+    sheets_before = dict(fake.stats)
+
+    # Time the handler stages by wrapping the real functions
+    stages = {'save_lead': [], 'notify_staff': []}
+    original_save = db.save_lead_async
+    original_notify = modals.notify_staff
+
+    async def timed_save(*a, **kw):
+        started = time.perf_counter()
+        try:
+            return await original_save(*a, **kw)
+        finally:
+            stages['save_lead'].append(time.perf_counter() - started)
+
+    async def timed_notify(*a, **kw):
+        started = time.perf_counter()
+        try:
+            return await original_notify(*a, **kw)
+        finally:
+            stages['notify_staff'].append(time.perf_counter() - started)
+
+    db.save_lead_async = timed_save
+    modals.notify_staff = timed_notify
+
+    latencies = []
+    thread_latencies = []
+    submissions = []
+    failures = 0
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def submit(index: int):
+        nonlocal failures
+        async with semaphore:
+            modal = modals.SupportModal()
+            modal.name_input._value = f"Bench User {index}"
+            modal.order_id_input._value = f"BENCH-{index:06d}"
+            modal.issue_type._value = "Benchmark"
+            modal.description._value = "Synthetic ticket submitted by the pipeline benchmark."
+            interaction = StubInteraction(index, recorder)
+
+            started = time.perf_counter()
+            await modal.on_submit(interaction)
+            acknowledged_at = interaction.response.sent_at or interaction.followup.sent_at
+            if acknowledged_at is None:
+                failures += 1
+                return
+            latencies.append(acknowledged_at - started)
+            submissions.append((started, interaction))
+
+    try:
+        run_started = time.perf_counter()
+        await asyncio.gather(*(submit(index) for index in range(args.tickets)))
+        # Acknowledged tickets are saved and threaded by the worker pool
+        await modals.ticket_workers.join()
+        wall = time.perf_counter() - run_started
+
+        for started, interaction in submissions:
+            linked_at = next((
+                edited_at for edited_at, embed in interaction.edits
+                if embed.title.startswith('✅') and any(field.name == '🔗 Ticket Thread' for field in embed.fields)
+            ), None)
+            if linked_at is None:
+                failures += 1
+                continue
+            thread_latencies.append(linked_at - started)
+
+        # Time until every journaled row has reached Sheets (injected errors are retried)
+        drain_started = time.perf_counter()
+        while db.journal.pending_count() and time.perf_counter() - drain_started < args.drain_timeout:
+            try:
+                await db.flush_journal()
+            except Exception:
+                await asyncio.sleep(0.1)
+        drain = time.perf_counter() - drain_started
+    finally:
+        db.save_lead_async = original_save
+        modals.notify_staff = original_notify
+
+    sheets_calls = {key: fake.stats[key] - sheets_before.get(key, 0) for key in fake.stats}
+    completed = len(thread_latencies)
+    discord_stages = {name: summarize_ms(samples) for name, samples in sorted(recorder.timings.items())}
+
+    return {
+        'benchmark': 'ticket_pipeline',
+        'revision': git_revision(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': {
+            'tickets': args.tickets,
+            'concurrency': args.concurrency,
+            'sheets_latency': args.sheets_latency,
+            'discord_latency': args.discord_latency,
+            'error_rate': args.error_rate,
+            'write_quota': args.write_quota,
+        },
+        'startup_ms': round(startup * 1000, 2),
+        'startup_timeline_ms': {name: round(elapsed * 1000, 2) for name, elapsed in db.startup_timeline},
+        'throughput': {
+            'completed': completed,
+            'failed': failures,
+            'wall_seconds': round(wall, 3),
+            'tickets_per_second': round(completed / wall, 2) if wall else 0.0,
+            'tickets_per_minute': round(completed / wall * 60, 1) if wall else 0.0,
+        },
+        'latency_ms': summarize_ms(latencies),
+        'thread_ready_ms': summarize_ms(thread_latencies),
+        'ticket_queue': modals.ticket_workers.get_stats(),
+        'stages_ms': {
+            'save_lead': summarize_ms(stages['save_lead']),
+            'notify_staff': summarize_ms(stages['notify_staff']),
+            **discord_stages,
+        },
+        'sheets': {
+            **sheets_calls,
+            'calls_per_ticket': round((sheets_calls['reads'] + sheets_calls['writes']) / completed, 3) if completed else 0.0,
+            'drain_ms': round(drain * 1000, 2),
+            'rows_in_leads_tab': len(fake.tabs.get(LEADS_TAB_NAME, [])) - 1,
+        },
+        'scheduler': db.get_scheduler_stats(),
+    }
+
+
+def print_report(results: dict) -> None:
+    """Print a short human-readable summary."""
+    throughput = results['throughput']
+    latency = results['latency_ms']
+    print(f"\nTicket pipeline @ {results['revision']}")
+    print(f"  completed {throughput['completed']} / failed {throughput['failed']} in {throughput['wall_seconds']}s "
+          f"-> {throughput['tickets_per_minute']} tickets/min")
+    thread_ready = results['thread_ready_ms']
+    queue = results['ticket_queue']
+    print(f"  acknowledgement latency ms: p50 {latency['p50']}  p95 {latency['p95']}  p99 {latency['p99']}  max {latency['max']}")
+    print(f"  thread link latency ms:     p50 {thread_ready['p50']}  p95 {thread_ready['p95']}  p99 {thread_ready['p99']}  max {thread_ready['max']}")
+    print(f"  ticket queue: peak {queue['peak_depth']}/{queue['max_queue']}, {queue['workers']} workers at "
+          f"{queue['utilization']:.0%}, {queue['retries']} retries, avg wait {queue['avg_wait_ms']} ms")
+    print("  stages (p50 / p95 ms):")
+    for name, stage in results['stages_ms'].items():
+        print(f"    {name:<26} {stage['p50']:>9} / {stage['p95']:<9} (n={stage['count']})")
+    sheets = results['sheets']
+    print(f"  sheets: {sheets['reads']} reads, {sheets['writes']} writes, "
+          f"{sheets['calls_per_ticket']} calls/ticket, drain {sheets['drain_ms']} ms")
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as db_dir:
+        configure_environment(args, db_dir)
+        results = asyncio.run(run_benchmark(args))
+
+    print_report(results)
+    path = save_results('ticket_pipeline', results, args.output)
+    print(f"\nResults saved to {path}")
+
+    if args.compare:
+        print(f"\nCompared with {args.compare}:")
+        for metric, old, new, change in compare_results(results, args.compare, COMPARE_METRICS):
+            print(f"  {metric:<32} {old:>10} -> {new:<10} ({change:+.1f}%)")
+
+
+if __name__ == '__main__':
+    main()
@@ -24,6 +24,7 @@ disable_console_logging()
 # Import bot components
 from config import DISCORD_TOKEN, PREFIX, DEBUG_MODE, GOOGLE_SHEETS_ID
 from utils.logger import bot_logger
+from utils.blocking_guard import enable_loop_debug
 from handlers.database import get_db_manager, init_db_manager
 
 # Global variables
@@ -156,6 +157,7 @@ def run_bot_thread():
         # Create new event loop for this thread
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        enable_loop_debug(loop)
         
         # Import and setup bot - reimport to get fresh instance
         import importlib
@@ -170,10 +172,11 @@ def run_bot_thread():
         
         bot_instance = bot
         
-        # Initialize database
+        # Initialize database (Sheets connects in the background once the loop runs)
         try:
             db_manager = init_db_manager()
-            print(f"{Fore.GREEN}✓ Database connected successfully{Style.RESET_ALL}")
+            db_manager.start_initialization(loop)
+            print(f"{Fore.GREEN}✓ Database ready{Style.RESET_ALL}")
         except Exception as e:
             print(f"{Fore.RED}✗ Database connection failed: {e}{Style.RESET_ALL}")
             bot_running = False
@@ -532,8 +535,8 @@ def add_faq():
         # Append row
         faq_sheet.append_row([trigger_id, button_label, response_text])
         
-        # Refresh cache
-        db.reload_faq_cache()
+        # Refresh cache (the revision check could miss our own write)
+        db.reload_faq_cache(check_revision=False)
         
         print(f"\n{Fore.GREEN}✓ FAQ added successfully!{Style.RESET_ALL}")
     except Exception as e:
@@ -581,8 +584,8 @@ def delete_faq():
                     # Delete row (index + 2 because: +1 for header, +1 for 0-based to 1-based)
                     faq_sheet.delete_rows(idx + 2)
                     
-                    # Refresh cache
-                    db.reload_faq_cache()
+                    # Refresh cache (the revision check could miss our own write)
+                    db.reload_faq_cache(check_revision=False)
                     
                     print(f"\n{Fore.GREEN}✓ FAQ deleted successfully!{Style.RESET_ALL}")
             else:
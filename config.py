@@ -12,6 +12,13 @@ PREFIX = os.getenv('PREFIX', '!')
 # Google Sheets Configuration
 GOOGLE_SHEETS_ID = os.getenv('GOOGLE_SHEETS_ID')
 CREDENTIALS_FILE = os.getenv('CREDENTIALS_FILE', 'credentials.json')
+SHEETS_BACKEND = os.getenv('SHEETS_BACKEND', 'google')  # 'google' or 'fake' (in-process stand-in for offline tests/benchmarks)
+
+# Fake Sheets Backend (only used when SHEETS_BACKEND=fake)
+FAKE_SHEETS_LATENCY = float(os.getenv('FAKE_SHEETS_LATENCY', 0.2))  # Seconds added to every simulated API call
+FAKE_SHEETS_ERROR_RATE = float(os.getenv('FAKE_SHEETS_ERROR_RATE', 0))  # Probability (0-1) of an injected 500 error
+FAKE_SHEETS_READ_QUOTA = int(os.getenv('FAKE_SHEETS_READ_QUOTA', 0))  # Simulated read requests per minute (0 = unlimited)
+FAKE_SHEETS_WRITE_QUOTA = int(os.getenv('FAKE_SHEETS_WRITE_QUOTA', 0))  # Simulated write requests per minute (0 = unlimited)
 
 # Channel Configuration
 SUPPORT_CHANNEL_ID = int(os.getenv('SUPPORT_CHANNEL_ID', 0))
@@ -22,15 +29,45 @@ LOGS_CHANNEL_ID = int(os.getenv('LOGS_CHANNEL_ID', 0))
 FAQ_TAB_NAME = os.getenv('FAQ_TAB_NAME', 'FAQ')
 LEADS_TAB_NAME = os.getenv('LEADS_TAB_NAME', 'Leads')
 ANALYTICS_TAB_NAME = os.getenv('ANALYTICS_TAB_NAME', 'Analytics')
+FAQ_VIEWS_TAB_NAME = os.getenv('FAQ_VIEWS_TAB_NAME', 'FAQ Views')  # Hourly FAQ view counts (created on first flush)
 
 # Bot Configuration
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 DEBUG_MODE = os.getenv('DEBUG_MODE', 'False').lower() == 'true'
 
+# Storage Backend ('sqlite' = persistent local store, 'memory' = rebuilt from Sheets on every start)
+STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'sqlite')
+REPLICATION_INTERVAL = float(os.getenv('REPLICATION_INTERVAL', 10))  # Seconds between status mirrors to Sheets
+FAQ_SYNC_INTERVAL = float(os.getenv('FAQ_SYNC_INTERVAL', 300))  # Seconds between FAQ pulls from Sheets
+FAQ_CACHE_TTL = float(os.getenv('FAQ_CACHE_TTL', 120))  # Seconds before a FAQ read triggers a background refresh
+STATUS_BATCH_WINDOW = float(os.getenv('STATUS_BATCH_WINDOW', 2))  # Seconds status changes are buffered into one batch_update
+FAQ_VIEWS_FLUSH_INTERVAL = float(os.getenv('FAQ_VIEWS_FLUSH_INTERVAL', 300))  # Seconds between writing FAQ view counts to the FAQ Views tab
+
+# Lead Write Journal (batched appends to the Leads tab)
+LEADS_FLUSH_INTERVAL = float(os.getenv('LEADS_FLUSH_INTERVAL', 5))  # Seconds between flushes
+LEADS_FLUSH_BATCH_SIZE = int(os.getenv('LEADS_FLUSH_BATCH_SIZE', 20))  # Flush early once this many rows are pending
+
+# Ticket Processing (acknowledge first, then save + create thread in a worker pool)
+TICKET_WORKERS = int(os.getenv('TICKET_WORKERS', 4))  # Tickets processed concurrently
+TICKET_QUEUE_SIZE = int(os.getenv('TICKET_QUEUE_SIZE', 100))  # Submissions that may wait before new ones are refused
+TICKET_MAX_ATTEMPTS = int(os.getenv('TICKET_MAX_ATTEMPTS', 3))  # Attempts per ticket before the user is told it failed
+TICKET_RETRY_DELAY = float(os.getenv('TICKET_RETRY_DELAY', 1))  # Seconds before the first retry (doubles each retry)
+
+# Leads Index (resident lookup table for the Leads tab)
+LEADS_INDEX_SYNC_INTERVAL = float(os.getenv('LEADS_INDEX_SYNC_INTERVAL', 60))  # Seconds between tail syncs
+LEADS_INDEX_FULL_RELOAD_INTERVAL = float(os.getenv('LEADS_INDEX_FULL_RELOAD_INTERVAL', 1800))  # Seconds between full reloads
+
+# Sheets API Quota (requests per minute per quota bucket; calls queue instead of failing with 429)
+SHEETS_READ_QUOTA_PER_MINUTE = int(os.getenv('SHEETS_READ_QUOTA_PER_MINUTE', 60))
+SHEETS_WRITE_QUOTA_PER_MINUTE = int(os.getenv('SHEETS_WRITE_QUOTA_PER_MINUTE', 60))
+SHEETS_MAX_RETRIES = int(os.getenv('SHEETS_MAX_RETRIES', 5))  # Requeues after a 429/5xx before giving up
+
 # Paths
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 LOGS_DIR = os.path.join(BASE_DIR, 'logs')
 DATA_DIR = os.path.join(BASE_DIR, 'data')
+LOCAL_DB_FILE = os.getenv('LOCAL_DB_FILE', os.path.join(DATA_DIR, 'cs_bot.db'))
+FAQ_SNAPSHOT_FILE = os.getenv('FAQ_SNAPSHOT_FILE', os.path.join(DATA_DIR, 'faq_snapshot.json'))  # Warm-start copy of the FAQ
 
 # Ensure directories exist
 os.makedirs(LOGS_DIR, exist_ok=True)
@@ -1,13 +1,17 @@
+import asyncio
 import discord
+from discord import app_commands
 from discord.ext import commands
-from discord.ui import View, Button
+from discord.ui import View, Button, Select
 from handlers.database import get_db_manager
-from handlers.modals import SupportModal
+from handlers.modals import SupportModal, ticket_workers
 from utils.logger import event_logger
+from utils.faq_render import FAQRenderCache, FAQ_BUTTON_LIMIT
 import pytz
 from datetime import datetime
 
 bot = None  # Global bot instance for use in modals.py
+faq_renderer = FAQRenderCache()  # Rendered FAQ embeds/buttons, rebuilt once per FAQ version
 
 class SupportCommands(commands.Cog):
     """Commands for support system."""
@@ -64,14 +68,23 @@ class SupportCommands(commands.Cog):
     
     @commands.command(
         name='faq',
-        description='Display FAQ list',
-        help='Display all frequently asked questions'
+        description='Display FAQ list or search it',
+        help='Display all frequently asked questions, or search them: !faq <question>'
     )
-    async def faq_list(self, ctx: commands.Context) -> None:
-        """Command to display FAQ list."""
+    async def faq_list(self, ctx: commands.Context, *, query: str = None) -> None:
+        """Command to display FAQ list (or search it when a query is given)."""
         try:
             db = get_db_manager()
-            faq_data = db.get_faq_data(refresh=True)
+            # Only waits while the first FAQ pull is still running
+            if db.faq_cache is None:
+                await db.wait_until_ready(timeout=10)
+            
+            if query:
+                await self.send_faq_search_results(ctx, db, query)
+                return
+            
+            # Served from memory; a stale cache is refreshed in the background
+            faq_data = db.get_faq_data()
             
             if not faq_data:
                 embed = discord.Embed(
@@ -82,33 +95,122 @@ class SupportCommands(commands.Cog):
                 await ctx.send(embed=embed, delete_after=15)
                 return
             
-            # Create embed for FAQ
+            # Prebuilt list embed and buttons for the current FAQ version;
+            # larger FAQ sets are paged through a select menu instead
+            artifacts = faq_renderer.get(db.faq_index)
+            if len(artifacts) > FAQ_BUTTON_LIMIT:
+                view = FAQBrowserView(artifacts)
+                await ctx.send(embed=view.current_page.embed, view=view)
+            else:
+                await ctx.send(embed=artifacts.list_embed, view=FAQView(artifacts))
+            event_logger.info(f"FAQ list displayed for {ctx.author}")
+            
+        except Exception as e:
+            event_logger.error(f"Error in faq command: {str(e)}")
+            await ctx.send("❌ Failed to load FAQ.", delete_after=10)
+    
+    async def send_faq_search_results(self, ctx: commands.Context, db, query: str) -> None:
+        """Send the top FAQ matches for a free-text query."""
+        results = db.search_faq(query, limit=5)
+        
+        if not results:
             embed = discord.Embed(
-                title="📖 Frequently Asked Questions",
-                description="Click button to view answer",
-                color=discord.Color.green()
+                title="🔍 FAQ Search",
+                description=f"No FAQ matches **{query[:100]}**. Use `{ctx.prefix}faq` to browse all FAQ.",
+                color=discord.Color.orange()
             )
+            await ctx.send(embed=embed, delete_after=30)
+            return
+        
+        embed = discord.Embed(
+            title="🔍 FAQ Search",
+            description=f"Top matches for **{query[:100]}** - click a button to view the answer",
+            color=discord.Color.green()
+        )
+        for idx, faq in enumerate(results, 1):
+            answer = str(faq.get('response_text', ''))
+            embed.add_field(
+                name=f"{idx}. {str(faq.get('button_label', f'FAQ {idx}'))[:80]}",
+                value=answer[:150] + "..." if len(answer) > 150 else answer or "-",
+                inline=False
+            )
+        
+        artifacts = faq_renderer.get(db.faq_index)
+        positions = [artifacts.position_of(faq) for faq in results]
+        await ctx.send(embed=embed, view=FAQView(artifacts, [position for position in positions if position >= 0]))
+        event_logger.info(f"FAQ search by {ctx.author}: '{query}' ({len(results)} results)")
+    
+    @app_commands.command(name='faq', description='Look up a frequently asked question')
+    @app_commands.describe(question='Start typing a question or keyword')
+    async def faq_slash(self, interaction: discord.Interaction, question: str) -> None:
+        """Slash command to show one FAQ answer (picked via autocomplete or free text)."""
+        try:
+            await interaction.response.defer(ephemeral=True)
             
-            # Limit to 25 buttons (Discord UI limit)
-            limited_faq = faq_data[:24]
-            
-            for idx, faq in enumerate(limited_faq, 1):
-                button_label = faq.get('button_label', f'FAQ {idx}')[:80]
-                embed.add_field(
-                    name=f"{idx}. {button_label}",
-                    value="Click button to view answer",
-                    inline=False
+            db = get_db_manager()
+            # Only waits while the first FAQ pull is still running
+            if db.faq_cache is None:
+                await db.wait_until_ready(timeout=10)
+            db.get_faq_data()
+            artifacts = faq_renderer.get(db.faq_index)
+            
+            # Autocomplete fills in the trigger_id; anything else typed is searched
+            record = db.find_faq_by_trigger(question)
+            if record is None:
+                results = db.search_faq(question, limit=1)
+                record = results[0] if results else None
+            position = artifacts.position_of(record) if record is not None else -1
+            
+            if position < 0:
+                embed = discord.Embed(
+                    title="📖 FAQ",
+                    description=f"No FAQ matches **{question[:100]}**. Use `/faq` and pick a suggestion, or `!faq` to browse.",
+                    color=discord.Color.orange()
                 )
+                await interaction.followup.send(embed=embed, ephemeral=True)
+                return
             
-            # Create view with FAQ buttons
-            view = FAQView(faq_data[:24])
+            await interaction.followup.send(embed=artifacts.answer_embed(position), ephemeral=True)
+            db.record_faq_view(record.get('trigger_id', ''))
+            event_logger.info(f"FAQ viewed by {interaction.user} via /faq: {record.get('button_label', question)}")
             
-            await ctx.send(embed=embed, view=view)
-            event_logger.info(f"FAQ list displayed for {ctx.author}")
+        except Exception as e:
+            event_logger.error(f"Error in /faq command: {str(e)}")
+            error_embed = discord.Embed(
+                title="❌ Error",
+                description="Failed to load FAQ. Please try again.",
+                color=discord.Color.red()
+            )
+            try:
+                if interaction.response.is_done():
+                    await interaction.followup.send(embed=error_embed, ephemeral=True)
+                else:
+                    await interaction.response.send_message(embed=error_embed, ephemeral=True)
+            except:
+                pass
+
+    @faq_slash.autocomplete('question')
+    async def faq_slash_autocomplete(self, interaction: discord.Interaction, current: str) -> list:
+        """Suggest FAQ for what has been typed so far (prefix index, no scan of the FAQ cache)."""
+        try:
+            db = get_db_manager()
+            artifacts = faq_renderer.get(db.faq_index)
+            if artifacts.prefix_index_ready:
+                prefix_index = artifacts.prefix_index
+            else:
+                # First keystroke after a reload builds the index - keep that off the event loop
+                prefix_index = await asyncio.to_thread(lambda: artifacts.prefix_index)
+            choices = []
+            for position in prefix_index.complete(current, limit=25):
+                record = artifacts.records[position]
+                label = str(record.get('button_label', '')) or f'FAQ {position + 1}'
+                trigger_id = str(record.get('trigger_id', '')) or label
+                choices.append(app_commands.Choice(name=label[:100], value=trigger_id[:100]))
+            return choices
             
         except Exception as e:
-            event_logger.error(f"Error in faq command: {str(e)}")
-            await ctx.send("❌ Failed to load FAQ.", delete_after=10)
+            event_logger.error(f"Error in /faq autocomplete: {str(e)}")
+            return []
     
     @commands.command(
         name='reload',
@@ -121,7 +223,10 @@ class SupportCommands(commands.Cog):
         """Admin command to reload data from Sheets."""
         try:
             db = get_db_manager()
-            db.reload_faq_cache()
+            # Explicit forced refresh (async, does not block other interactions);
+            # skip the revision check, Drive metadata can lag behind sheet edits
+            if not await db.refresh_faq_cache(check_revision=False):
+                raise RuntimeError("Google Sheets could not be read, still serving the cached FAQ")
             
             embed = discord.Embed(
                 title="✅ Data Reloaded",
@@ -151,7 +256,7 @@ class SupportCommands(commands.Cog):
         """Admin command to display statistics."""
         try:
             db = get_db_manager()
-            leads = db.get_all_leads(limit=100)
+            leads = await db.get_all_leads_async(limit=100)
             
             # Calculate statistics
             total_leads = len(leads)
@@ -179,6 +284,100 @@ class SupportCommands(commands.Cog):
                 inline=True
             )
             
+            # Sheets request queue (per priority lane)
+            scheduler_stats = db.get_scheduler_stats()
+            queue_lines = [
+                f"`{lane}`: {lane_stats['queued']} queued, avg wait {lane_stats['avg_wait_ms']:.0f} ms"
+                for lane, lane_stats in scheduler_stats['lanes'].items()
+            ]
+            queue_lines.append(
+                f"Retries: {scheduler_stats['rate_limited']} × 429, {scheduler_stats['server_errors']} × 5xx, "
+                f"{scheduler_stats['exhausted']} gave up"
+            )
+            embed.add_field(
+                name="🚦 Sheets Queue",
+                value="\n".join(queue_lines),
+                inline=False
+            )
+            
+            handle_stats = db.get_handle_cache_stats()
+            embed.add_field(
+                name="🗂️ Sheets Handle Cache",
+                value=(
+                    f"{handle_stats['hits']} hits, {handle_stats['misses']} misses, "
+                    f"{handle_stats['invalidations']} invalidations\n"
+                    f"Metadata calls saved: {handle_stats['metadata_calls_saved']}"
+                ),
+                inline=False
+            )
+            
+            # Ticket worker pool (acknowledged tickets waiting for save + thread)
+            ticket_stats = ticket_workers.get_stats()
+            embed.add_field(
+                name="🎟️ Ticket Queue",
+                value=(
+                    f"{ticket_stats['queue_depth']}/{ticket_stats['max_queue']} queued (peak {ticket_stats['peak_depth']}), "
+                    f"{ticket_stats['busy_workers']}/{ticket_stats['workers']} workers busy, "
+                    f"utilization {ticket_stats['utilization']:.0%}\n"
+                    f"Processed: {ticket_stats['processed']}, failed: {ticket_stats['failed']}, "
+                    f"retries: {ticket_stats['retries']}, refused: {ticket_stats['rejected']}\n"
+                    f"Avg wait {ticket_stats['avg_wait_ms']:.0f} ms, avg processing {ticket_stats['avg_process_ms']:.0f} ms"
+                ),
+                inline=False
+            )
+            
+            # Ticket state machine (take/close decisions answered from memory)
+            state_stats = db.get_ticket_state_stats()
+            lock_stats = state_stats['locks']
+            embed.add_field(
+                name="🎫 Ticket States",
+                value=(
+                    f"{state_stats['tracked']} tracked: "
+                    + ", ".join(f"{status} {count}" for status, count in state_stats['statuses'].items())
+                    + f"\nTransitions: {state_stats['transitions']} applied, {state_stats['rejected']} rejected, "
+                    f"{state_stats['pending_writes']} waiting to be saved\n"
+                    f"Contention: {lock_stats['conflicts']} lost race(s), {lock_stats['contended']} lock wait(s) "
+                    f"(avg {lock_stats['avg_wait_ms']:.0f} ms)"
+                    + (", hot: " + ", ".join(f"#{number} ({hits})" for number, hits in lock_stats['hot_tickets'])
+                       if lock_stats['hot_tickets'] else "")
+                ),
+                inline=False
+            )
+            
+            # FAQ cache health
+            faq_stats = db.get_faq_cache_stats()
+            faq_age = f"{faq_stats['age_seconds']:.0f}s" if faq_stats['age_seconds'] is not None else "never loaded"
+            embed.add_field(
+                name="📖 FAQ Cache",
+                value=(
+                    f"{faq_stats['entries']} entries (v{faq_stats['version']}), age {faq_age}\n"
+                    f"Hit ratio: {faq_stats['hit_ratio']:.0%}, last refresh {faq_stats['last_refresh_ms']:.0f} ms\n"
+                    f"Reloads: {faq_stats['reloads_performed']} performed, {faq_stats['reloads_skipped']} skipped (unchanged)"
+                ),
+                inline=False
+            )
+            view_stats = db.get_faq_view_stats()
+            embed.add_field(
+                name="👀 FAQ Views",
+                value=(
+                    f"{view_stats['total_views']} since start, {view_stats['flushed_views']} written to Sheets "
+                    f"({view_stats['pending_counters']} counter(s) pending)"
+                ),
+                inline=False
+            )
+            render_stats = faq_renderer.get_stats()
+            embed.add_field(
+                name="🧱 FAQ Render Cache",
+                value=(
+                    f"{render_stats['builds']} builds (last {render_stats['last_build_ms']:.1f} ms), "
+                    f"{render_stats['hit_ratio']:.0%} reused\n"
+                    f"Answers: {render_stats['answer_builds']} rendered, {render_stats['answer_hit_ratio']:.0%} reused\n"
+                    f"Browser pages: {render_stats['page_builds']} rendered, {render_stats['page_hits']} reused\n"
+                    f"Autocomplete index: {render_stats['prefix_builds']} builds (last {render_stats['last_prefix_build_ms']:.1f} ms)"
+                ),
+                inline=False
+            )
+            
             embed.set_footer(text=f"Bot Prefix: {ctx.prefix}")
             
             await ctx.send(embed=embed)
@@ -349,6 +548,9 @@ class SupportMenuView(View):
             await interaction.response.defer()
             
             db = get_db_manager()
+            # Only waits while the first FAQ pull is still running
+            if db.faq_cache is None:
+                await db.wait_until_ready(timeout=10)
             faq_data = db.get_faq_data()
             
             if not faq_data:
@@ -360,15 +562,13 @@ class SupportMenuView(View):
                 await interaction.followup.send(embed=embed, ephemeral=True)
                 return
             
-            # Send FAQ list
-            embed = discord.Embed(
-                title="📖 FAQ List",
-                description="Select the FAQ you want to view:",
-                color=discord.Color.green()
-            )
-            
-            view = FAQView(faq_data[:24])
-            await interaction.followup.send(embed=embed, view=view, ephemeral=True)
+            # Send FAQ list (prebuilt for the current FAQ version)
+            artifacts = faq_renderer.get(db.faq_index)
+            if len(artifacts) > FAQ_BUTTON_LIMIT:
+                view = FAQBrowserView(artifacts)
+                await interaction.followup.send(embed=view.current_page.embed, view=view, ephemeral=True)
+            else:
+                await interaction.followup.send(embed=artifacts.menu_embed, view=FAQView(artifacts), ephemeral=True)
             
         except Exception as e:
             event_logger.error(f"Error in view_faq button: {str(e)}")
@@ -418,41 +618,36 @@ class SupportMenuView(View):
 class FAQView(View):
     """View to display FAQ buttons."""
     
-    def __init__(self, faq_data: list):
+    def __init__(self, artifacts, positions: list = None):
         super().__init__(timeout=600)
-        self.faq_data = faq_data
+        self.artifacts = artifacts
         
-        # Add buttons for each FAQ (max 25)
-        for idx, faq in enumerate(faq_data[:24]):
-            button_label = faq.get('button_label', f'FAQ {idx + 1}')[:80]
-            trigger_id = str(faq.get('trigger_id', f'faq_{idx}'))
-            
+        # Add buttons for each FAQ (max 24, specs are prebuilt per FAQ version)
+        if positions is None:
+            specs = artifacts.buttons
+        else:
+            specs = [artifacts.button_for(position) for position in positions[:FAQ_BUTTON_LIMIT]]
+        for spec in specs:
             button = Button(
-                label=button_label,
+                label=spec.label,
                 style=discord.ButtonStyle.secondary,
-                custom_id=f"faq_{trigger_id}_{idx}"
+                custom_id=spec.custom_id
             )
-            button.callback = self.create_faq_callback(faq)
+            button.callback = self.create_faq_callback(spec.position)
             self.add_item(button)
     
-    def create_faq_callback(self, faq: dict):
+    def create_faq_callback(self, position: int):
         """Create callback for FAQ button."""
         async def faq_callback(interaction: discord.Interaction) -> None:
             try:
                 await interaction.response.defer(ephemeral=True)
                 
-                question = faq.get('button_label', 'Question')
-                answer = faq.get('response_text', 'Answer not available.')
-                
-                embed = discord.Embed(
-                    title=f"❓ {question}",
-                    description=answer,
-                    color=discord.Color.green()
-                )
-                
-                embed.set_footer(text="FAQ Support Bot")
+                embed = self.artifacts.answer_embed(position)
+                record = self.artifacts.records[position]
+                question = record.get('button_label', 'Question')
                 
                 await interaction.followup.send(embed=embed, ephemeral=True)
+                get_db_manager().record_faq_view(record.get('trigger_id', ''))
                 event_logger.info(f"FAQ viewed by {interaction.user}: {question}")
                 
             except Exception as e:
@@ -461,6 +656,78 @@ class FAQView(View):
         return faq_callback
 
 
+class FAQBrowserView(View):
+    """Paginated FAQ browser: one select menu per page plus prev/next buttons."""
+    
+    def __init__(self, artifacts, page: int = 0):
+        super().__init__(timeout=600)
+        # Pages are rendered lazily and shared by every browser on this FAQ version;
+        # the view itself only tracks which page its message shows
+        self.artifacts = artifacts
+        self.current_page = artifacts.page(page)
+        
+        self.faq_select = Select(
+            placeholder="Choose a question...",
+            custom_id="faq_browser_select",
+            options=list(self.current_page.options),
+            row=0
+        )
+        self.faq_select.callback = self.select_faq
+        self.add_item(self.faq_select)
+        
+        self.first_button = Button(label="⏮", style=discord.ButtonStyle.secondary, custom_id="faq_browser_first", row=1)
+        self.prev_button = Button(label="◀ Prev", style=discord.ButtonStyle.secondary, custom_id="faq_browser_prev", row=1)
+        self.page_button = Button(style=discord.ButtonStyle.secondary, custom_id="faq_browser_page", disabled=True, row=1)
+        self.next_button = Button(label="Next ▶", style=discord.ButtonStyle.secondary, custom_id="faq_browser_next", row=1)
+        self.last_button = Button(label="⏭", style=discord.ButtonStyle.secondary, custom_id="faq_browser_last", row=1)
+        
+        self.first_button.callback = self.create_page_callback(lambda: 0)
+        self.prev_button.callback = self.create_page_callback(lambda: self.current_page.number - 1)
+        self.next_button.callback = self.create_page_callback(lambda: self.current_page.number + 1)
+        self.last_button.callback = self.create_page_callback(lambda: self.artifacts.page_count - 1)
+        for button in (self.first_button, self.prev_button, self.page_button, self.next_button, self.last_button):
+            self.add_item(button)
+        
+        self.update_controls()
+    
+    def update_controls(self) -> None:
+        """Point the select menu and buttons at the current page."""
+        number = self.current_page.number
+        last = self.artifacts.page_count - 1
+        self.faq_select.options = list(self.current_page.options)
+        self.page_button.label = f"{number + 1}/{last + 1}"
+        self.first_button.disabled = self.prev_button.disabled = number == 0
+        self.next_button.disabled = self.last_button.disabled = number == last
+    
+    def create_page_callback(self, target):
+        """Create callback for a page navigation button."""
+        async def page_callback(interaction: discord.Interaction) -> None:
+            try:
+                self.current_page = self.artifacts.page(target())
+                self.update_controls()
+                await interaction.response.edit_message(embed=self.current_page.embed, view=self)
+                
+            except Exception as e:
+                event_logger.error(f"Error in FAQ page callback: {str(e)}")
+        
+        return page_callback
+    
+    async def select_faq(self, interaction: discord.Interaction) -> None:
+        """Send the answer for the selected FAQ."""
+        try:
+            position = int(self.faq_select.values[0])
+            embed = self.artifacts.answer_embed(position)
+            record = self.artifacts.records[position]
+            question = record.get('button_label', 'Question')
+            
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            get_db_manager().record_faq_view(record.get('trigger_id', ''))
+            event_logger.info(f"FAQ viewed by {interaction.user}: {question}")
+            
+        except Exception as e:
+            event_logger.error(f"Error in FAQ select callback: {str(e)}")
+
+
 async def setup(bot: commands.Bot) -> None:
     """Setup cog."""
     await bot.add_cog(SupportCommands(bot))
@@ -5,43 +5,159 @@ from google.oauth2.service_account import Credentials
 from datetime import datetime
 import pytz
 import asyncio
-from config import GOOGLE_SHEETS_ID, CREDENTIALS_FILE, FAQ_TAB_NAME, LEADS_TAB_NAME, ANALYTICS_TAB_NAME
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from config import (
+    GOOGLE_SHEETS_ID, CREDENTIALS_FILE, SHEETS_BACKEND, FAQ_TAB_NAME, LEADS_TAB_NAME, ANALYTICS_TAB_NAME,
+    FAQ_VIEWS_TAB_NAME,
+    LOCAL_DB_FILE, FAQ_SNAPSHOT_FILE, LEADS_FLUSH_INTERVAL, LEADS_FLUSH_BATCH_SIZE,
+    LEADS_INDEX_SYNC_INTERVAL, LEADS_INDEX_FULL_RELOAD_INTERVAL,
+    REPLICATION_INTERVAL, FAQ_SYNC_INTERVAL, FAQ_CACHE_TTL, STATUS_BATCH_WINDOW, FAQ_VIEWS_FLUSH_INTERVAL,
+    SHEETS_READ_QUOTA_PER_MINUTE, SHEETS_WRITE_QUOTA_PER_MINUTE, SHEETS_MAX_RETRIES
+)
 from utils.logger import db_logger
+from utils.journal import WriteJournal
+from utils.leads_index import LeadsIndex, LEAD_COLUMNS, STATUS_COLUMN
+from utils.ticket_counter import TicketNumberAllocator
+from utils.ticket_state import TicketStateStore, TicketStateMachine, TicketRecord, TicketLocks, InvalidTicketTransition, PENDING
+from utils.storage import create_storage_backend, FAQ_COLUMNS
+from utils.fake_sheets import get_fake_backend
+from utils.faq_index import FAQIndex
+from utils.faq_search import FAQSearchEngine
+from utils.faq_snapshot import FAQSnapshot, save_snapshot, load_snapshot
+from utils.faq_metrics import FAQViewCounter, FAQ_VIEW_COLUMNS
+from utils.blocking_guard import check_blocking_call
+from utils.sheets_scheduler import (
+    SheetsRequestScheduler, READ, WRITE,
+    PRIORITY_TICKET_WRITE, PRIORITY_STATUS, PRIORITY_REPORTING
+)
+
+class _ScheduledClientManager(gspread_asyncio.AsyncioGspreadClientManager):
+    """Client manager that leaves pacing and 429/5xx retries to SheetsRequestScheduler."""
+    
+    async def handle_gspread_error(self, e, method, args, kwargs):
+        # Quota (429) and server (5xx) errors go back to the scheduler so the request is
+        # requeued in its lane and every retry is charged a token (the library would retry forever)
+        raise e
 
 class GoogleSheetsManager:
     """Manager for Google Sheets integration with async support."""
     
     def __init__(self):
-        """Initialize Google Sheets connection (sync fallback)."""
+        """
+        Set up local state only (no network calls).
+        
+        Sheets auth, spreadsheet open and FAQ priming run in the background
+        via start_initialization(); the sync client connects on first use.
+        """
         try:
+            self._created_at = time.monotonic()
+            self.startup_timeline = [('manager_created', 0.0)]
+            
             self.scope = [
                 'https://spreadsheets.google.com/feeds',
                 'https://www.googleapis.com/auth/drive'
             ]
             
-            # Authenticate using service account (sync for backward compatibility)
-            credentials = ServiceAccountCredentials.from_json_keyfile_name(
-                CREDENTIALS_FILE, 
-                self.scope
-            )
-            self.client = gspread.authorize(credentials)
+            # Offline stand-in for tests and benchmarks (no credentials, no quota burned)
+            self.fake_backend = get_fake_backend() if SHEETS_BACKEND == 'fake' else None
+            if self.fake_backend is not None:
+                db_logger.warning("Using fake in-process Sheets backend (SHEETS_BACKEND=fake)")
+            elif not os.path.exists(CREDENTIALS_FILE):
+                raise FileNotFoundError(CREDENTIALS_FILE)
+            
+            # Sync gspread client/spreadsheet (CLI and legacy sync paths) - connected lazily
+            self.client = None
+            self._spreadsheet = None
+            self._sync_connect_lock = threading.Lock()
             
-            # Open spreadsheet
-            self.spreadsheet = self.client.open_by_key(GOOGLE_SHEETS_ID)
+            # Every Sheets call (sync and async) is paced by one quota-aware scheduler
+            self.scheduler = SheetsRequestScheduler(
+                SHEETS_READ_QUOTA_PER_MINUTE, SHEETS_WRITE_QUOTA_PER_MINUTE, max_retries=SHEETS_MAX_RETRIES
+            )
             
             # Initialize async client manager
             self.async_manager = None
             self.async_client = None
             
-            # Ticket number cache for performance
-            self.last_ticket_number = 0
-            self.ticket_cache_time = None
+            # Background initialization (auth, spreadsheet open, FAQ priming)
+            self._init_task = None
+            self.ready = False
             
-            db_logger.info("Successfully connected to Google Sheets")
+            # Cached async spreadsheet/worksheet handles (dropped on re-auth or missing tab)
+            self._async_spreadsheet = None
+            self._async_worksheets = {}
+            self.handle_cache_stats = {'hits': 0, 'misses': 0, 'invalidations': 0, 'metadata_calls_saved': 0}
+            
+            # Local system of record for leads/FAQ; Sheets is kept in sync as a mirror
+            self.storage = create_storage_backend()
+            self._storage_hydrated = False
+            self._replication_task = None
+            self._replication_event = None
+            self._status_waiters = {}  # ticket_number -> futures resolved when the status batch commits
+            
+            # Ticket numbers come from a local atomic counter (seeded once from the sheet)
+            self.ticket_allocator = TicketNumberAllocator(LOCAL_DB_FILE)
+            
+            # Ticket thread/status table used to restore persistent ticket views on restart
+            self.ticket_states = TicketStateStore(LOCAL_DB_FILE)
+            
+            # Authoritative ticket status for take/close decisions (transitions persisted in the background)
+            self.tickets = TicketStateMachine(self.ticket_states.open_tickets())
+            self.ticket_locks = TicketLocks()  # Serializes Discord side effects per ticket
+            self._ticket_state_writes = {}  # ticket_number -> status waiting to be persisted
+            self._ticket_state_task = None
+            self._ticket_state_event = None
+            
+            # Write-ahead journal: new rows are committed locally, then flushed to Sheets in batches
+            self.journal = WriteJournal(LOCAL_DB_FILE)
+            # Leads entries that may already be in the sheet (left over from a crash, or the
+            # append response was lost); checked against the sheet before they are re-sent
+            self._journal_unconfirmed = {
+                entry_id for entry_id, _, _ in self.journal.get_pending(LEADS_TAB_NAME)
+            }
+            self._journal_flush_task = None
+            self._journal_flush_event = None
+            self._journal_flush_lock = None
+            
+            # FAQ view counters (in memory, drained into the journal every FAQ_VIEWS_FLUSH_INTERVAL)
+            self.faq_views = FAQViewCounter()
+            self._faq_views_task = None
             
-            # Cache FAQ data on startup
+            # Resident Leads index (loaded once, then synced incrementally)
+            self.leads_index = LeadsIndex()
+            self._leads_index_lock = None
+            self._leads_index_task = None
+            self._leads_index_load_task = None
+            
+            # FAQ cache plus its lookup index (rebuilt and swapped as a whole on every reload)
             self.faq_cache = None
-            self.reload_faq_cache()
+            self.faq_version = 0
+            self.faq_index = FAQIndex([])
+            self.faq_search = FAQSearchEngine()
+            
+            # Stale-while-revalidate: reads never wait, one background refresh once older than FAQ_CACHE_TTL
+            self._faq_loaded_at = None
+            self._faq_refresh_task = None
+            self.faq_cache_stats = {
+                'hits': 0, 'stale_hits': 0, 'misses': 0,
+                'refreshes': 0, 'refresh_failures': 0,
+                'last_refresh_ms': 0.0, 'total_refresh_ms': 0.0,
+                'reloads_performed': 0, 'reloads_skipped': 0,
+            }
+            
+            # Change detection: spreadsheet revision and FAQ content hash of the last applied sync
+            self._faq_revision = None
+            self._faq_content_hash = None
+            
+            # Serve the last local FAQ copy until the background pull reconciles it with Sheets
+            self._load_local_faq()
+            
+            self.record_startup_event('local_state_ready')
             
         except FileNotFoundError:
             db_logger.error(f"Credentials file '{CREDENTIALS_FILE}' not found!")
@@ -50,6 +166,103 @@ class GoogleSheetsManager:
             db_logger.error(f"Error initializing Google Sheets: {str(e)}")
             raise
     
+    @property
+    def spreadsheet(self):
+        """Sync gspread spreadsheet (authorizes and opens it on first use)."""
+        if self._spreadsheet is None:
+            with self._sync_connect_lock:
+                if self._spreadsheet is None:
+                    self._connect_sync()
+        return self._spreadsheet
+    
+    def _connect_sync(self):
+        """Authorize the sync client and open the spreadsheet."""
+        check_blocking_call("sync Sheets authorization")
+        if self.fake_backend is not None:
+            self.client = self.fake_backend.client()
+        else:
+            # Authenticate using service account (sync for backward compatibility)
+            credentials = ServiceAccountCredentials.from_json_keyfile_name(
+                CREDENTIALS_FILE, 
+                self.scope
+            )
+            self.client = gspread.authorize(credentials)
+        
+        self._spreadsheet = self.scheduler.run_sync(
+            self.client.open_by_key, GOOGLE_SHEETS_ID, kind=READ, priority=PRIORITY_REPORTING
+        )
+        db_logger.info("Successfully connected to Google Sheets (sync client)")
+    
+    def record_startup_event(self, name: str):
+        """Add an entry to the startup timeline (seconds since the manager was created)."""
+        self.startup_timeline.append((name, time.monotonic() - self._created_at))
+    
+    def format_startup_timeline(self) -> str:
+        """Format the startup timeline for logging."""
+        return " -> ".join(f"{name} +{elapsed * 1000:.0f}ms" for name, elapsed in self.startup_timeline)
+    
+    def start_initialization(self, loop: asyncio.AbstractEventLoop = None) -> asyncio.Task:
+        """
+        Start background initialization (idempotent).
+        
+        Args:
+            loop: Loop to run on (defaults to the running loop; pass it when the loop is not running yet)
+            
+        Returns:
+            Initialization task
+        """
+        if self._init_task is None:
+            loop = loop or asyncio.get_running_loop()
+            self._init_task = loop.create_task(self.initialize())
+        return self._init_task
+    
+    async def initialize(self) -> bool:
+        """
+        Authorize, open the spreadsheet and prime the FAQ cache concurrently with the Discord login.
+        
+        Returns:
+            True if Sheets is reachable and the FAQ cache was primed
+        """
+        try:
+            await self._get_async_client()
+            self.record_startup_event('sheets_authorized')
+            
+            await self._get_async_spreadsheet(PRIORITY_TICKET_WRITE)
+            self.record_startup_event('spreadsheet_opened')
+            
+            # Keeps serving the local FAQ copy if the pull fails
+            primed = await self.refresh_faq_cache()
+            self.record_startup_event('faq_primed' if primed else 'faq_prime_failed')
+            
+            self.ready = True
+            db_logger.info("Successfully connected to Google Sheets")
+            return True
+            
+        except Exception as e:
+            db_logger.error(f"Error initializing Google Sheets: {str(e)}")
+            self.record_startup_event('sheets_unavailable')
+            return False
+        finally:
+            db_logger.info(f"Startup timeline: {self.format_startup_timeline()}")
+    
+    async def wait_until_ready(self, timeout: float = None) -> bool:
+        """
+        Wait for background initialization (returns at once when it already finished).
+        
+        Args:
+            timeout: Max seconds to wait (None waits until it finishes)
+            
+        Returns:
+            True if Sheets is ready, False if initialization failed or timed out
+        """
+        task = self.start_initialization()
+        if task.done():
+            return task.result()
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            return False
+    
     def _get_creds(self):
         """Get credentials for async client."""
         creds = Credentials.from_service_account_file(CREDENTIALS_FILE)
@@ -63,41 +276,480 @@ class GoogleSheetsManager:
     async def _get_async_client(self):
         """Get or create async gspread client."""
         if self.async_manager is None:
-            self.async_manager = gspread_asyncio.AsyncioGspreadClientManager(self._get_creds)
+            if self.fake_backend is not None:
+                self.async_manager = self.fake_backend.async_manager()
+            else:
+                # gspread_delay=0: the scheduler's token buckets do the pacing
+                self.async_manager = _ScheduledClientManager(self._get_creds, gspread_delay=0)
         
-        if self.async_client is None:
-            self.async_client = await self.async_manager.authorize()
+        # authorize() is cheap: it returns the cached client until credentials need refreshing
+        client = await self.async_manager.authorize()
+        if client is not self.async_client:
+            if self.async_client is not None:
+                db_logger.info("Async Sheets client re-authorized, dropping cached handles")
+                self.invalidate_handle_cache()
+            self.async_client = client
         
         return self.async_client
     
-    def reload_faq_cache(self):
-        """Reload FAQ cache from Sheets."""
+    async def _get_async_spreadsheet(self, priority: int = PRIORITY_STATUS):
+        """Get the cached async spreadsheet handle (opens it on first use)."""
+        client = await self._get_async_client()
+        
+        if self._async_spreadsheet is not None:
+            self.handle_cache_stats['hits'] += 1
+            self.handle_cache_stats['metadata_calls_saved'] += 1  # open_by_key()
+            return self._async_spreadsheet
+        
+        self.handle_cache_stats['misses'] += 1
+        self._async_spreadsheet = await self.scheduler.run(
+            client.open_by_key, GOOGLE_SHEETS_ID, kind=READ, priority=priority
+        )
+        return self._async_spreadsheet
+    
+    async def _get_async_worksheet(self, tab_name: str, priority: int = PRIORITY_STATUS, header: list = None):
+        """
+        Get a cached async worksheet handle.
+        
+        Args:
+            tab_name: Worksheet (tab) name
+            priority: Scheduler lane for the metadata lookup on a cache miss
+            header: Create the tab with this header row if it does not exist
+            
+        Returns:
+            AsyncioGspreadWorksheet
+        """
+        await self._get_async_client()
+        
+        worksheet = self._async_worksheets.get(tab_name)
+        if worksheet is not None:
+            self.handle_cache_stats['hits'] += 1
+            # Without the cache every lookup would reopen the spreadsheet as well
+            self.handle_cache_stats['metadata_calls_saved'] += 2  # open_by_key() + worksheet()
+            return worksheet
+        
+        self.handle_cache_stats['misses'] += 1
+        spreadsheet = await self._get_async_spreadsheet(priority)
         try:
-            faq_sheet = self.spreadsheet.worksheet(FAQ_TAB_NAME)
-            # Specify expected headers to avoid duplicate header error
-            self.faq_cache = faq_sheet.get_all_records(expected_headers=['trigger_id', 'button_label', 'response_text'])
-            db_logger.info(f"FAQ cache reloaded. Total FAQ: {len(self.faq_cache)}")
+            worksheet = await self.scheduler.run(spreadsheet.worksheet, tab_name, kind=READ, priority=priority)
+        except gspread.exceptions.WorksheetNotFound:
+            # Tab list may be stale (tab renamed or added) - refresh metadata once and retry
+            self.invalidate_handle_cache()
+            spreadsheet = await self._get_async_spreadsheet(priority)
+            worksheets = await self.scheduler.run(spreadsheet.worksheets, kind=READ, priority=priority)
+            worksheet = next((ws for ws in worksheets if ws.title == tab_name), None)
+            if worksheet is None:
+                if header is None:
+                    raise
+                worksheet = await self.scheduler.run(
+                    spreadsheet.add_worksheet, tab_name, rows=1, cols=len(header), kind=WRITE, priority=priority
+                )
+                await self.scheduler.run(worksheet.append_row, list(header), kind=WRITE, priority=priority)
+                db_logger.info(f"Created worksheet '{tab_name}'")
+        
+        self._async_worksheets[tab_name] = worksheet
+        return worksheet
+    
+    def invalidate_handle_cache(self, tab_name: str = None):
+        """
+        Drop cached async handles.
+        
+        Args:
+            tab_name: Only drop this worksheet handle (drops everything if None)
+        """
+        if tab_name is None:
+            self._async_spreadsheet = None
+            self._async_worksheets = {}
+        else:
+            self._async_worksheets.pop(tab_name, None)
+        self.handle_cache_stats['invalidations'] += 1
+    
+    def _check_missing_worksheet(self, error: Exception, tab_name: str):
+        """Invalidate a cached worksheet handle if an API error says the tab no longer exists."""
+        if isinstance(error, gspread.exceptions.WorksheetNotFound) or 'Unable to parse range' in str(error):
+            db_logger.warning(f"Worksheet '{tab_name}' not found, dropping cached handle")
+            self.invalidate_handle_cache(tab_name)
+    
+    def get_handle_cache_stats(self) -> dict:
+        """
+        Get handle cache counters.
+        
+        Returns:
+            Dict with hits, misses, invalidations and metadata_calls_saved
+        """
+        return dict(self.handle_cache_stats)
+    
+    def get_scheduler_stats(self) -> dict:
+        """
+        Get Sheets request scheduler statistics.
+        
+        Returns:
+            Dict with per-lane queue depth and wait times, tokens left and retry counters
+        """
+        return self.scheduler.get_stats()
+    
+    def reload_faq_cache(self, check_revision: bool = True):
+        """
+        Reload FAQ cache from Sheets (blocking - CLI and forced sync reloads).
+        
+        Args:
+            check_revision: Skip the download if the spreadsheet revision is unchanged
+                (pass False right after writing the FAQ tab - Drive metadata can lag)
+        """
+        started = time.monotonic()
+        try:
+            revision = self._read_faq_revision_sync()
+            if check_revision and not self._faq_revision_changed(revision):
+                self._record_faq_refresh(started, True)
+                return
+            
+            faq_sheet = self.scheduler.run_sync(
+                self.spreadsheet.worksheet, FAQ_TAB_NAME, kind=READ, priority=PRIORITY_REPORTING
+            )
+            values = self.scheduler.run_sync(faq_sheet.get_all_values, kind=READ, priority=PRIORITY_REPORTING)
+            self._apply_faq_values(values, revision)
+            self._record_faq_refresh(started, True)
         except Exception as e:
+            self._record_faq_refresh(started, False)
             db_logger.error(f"Error reloading FAQ cache: {str(e)}")
-            self.faq_cache = []
+            # Keep serving the current copy; fall back to the local store if there is none
+            if self.faq_cache is None:
+                self._set_faq_cache(self.storage.get_faq())
+            if self.faq_cache:
+                db_logger.warning(f"Serving {len(self.faq_cache)} FAQ from local storage")
+    
+    def _load_local_faq(self):
+        """Prime the FAQ cache from the on-disk snapshot, falling back to the local store."""
+        started = time.perf_counter()
+        try:
+            snapshot = load_snapshot(FAQ_SNAPSHOT_FILE)
+        except Exception as e:
+            db_logger.warning(f"Ignoring FAQ snapshot {FAQ_SNAPSHOT_FILE}: {str(e)}")
+            snapshot = None
+        
+        if snapshot is not None:
+            # Tokenizing for search is deferred to the first search to keep startup fast
+            self._set_faq_cache(snapshot.records, index_search=False)
+            # A background sync at the same revision/content can then skip the download or rebuild
+            self._faq_revision = snapshot.revision
+            self._faq_content_hash = snapshot.content_hash
+            self.record_startup_event('faq_snapshot_loaded')
+            db_logger.info(
+                f"FAQ served from snapshot: {len(snapshot.records)} entries "
+                f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+            )
+            return
+        
+        stored_faq = self.storage.get_faq()
+        if stored_faq:
+            self._set_faq_cache(stored_faq)
+            self.record_startup_event('faq_local_store_loaded')
+    
+    def _save_faq_snapshot(self, records: list, content_hash: str, revision):
+        """Persist the FAQ cache for the next warm start (failures only cost the warm start)."""
+        try:
+            started = time.perf_counter()
+            size = save_snapshot(FAQ_SNAPSHOT_FILE, FAQSnapshot(records, content_hash, revision))
+            db_logger.debug(
+                f"FAQ snapshot saved: {len(records)} entries, {size} bytes "
+                f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+            )
+        except Exception as e:
+            db_logger.warning(f"Could not save FAQ snapshot: {str(e)}")
+    
+    def _read_faq_revision_sync(self):
+        """Spreadsheet modifiedTime from Drive metadata (None if it cannot be read)."""
+        try:
+            check_blocking_call("Drive get_lastUpdateTime")
+            return self.spreadsheet.get_lastUpdateTime()
+        except Exception as e:
+            db_logger.warning(f"Could not read spreadsheet revision, checking FAQ content instead: {str(e)}")
+            return None
+    
+    async def _read_faq_revision(self):
+        """Async variant of _read_faq_revision_sync (the Drive call runs in a worker thread)."""
+        try:
+            spreadsheet = await self._get_async_spreadsheet(PRIORITY_REPORTING)
+            return await asyncio.to_thread(spreadsheet.ss.get_lastUpdateTime)
+        except Exception as e:
+            db_logger.warning(f"Could not read spreadsheet revision, checking FAQ content instead: {str(e)}")
+            return None
+    
+    def _faq_revision_changed(self, revision) -> bool:
+        """
+        Cheap pre-check before downloading the FAQ tab.
+        
+        The revision covers the whole spreadsheet (ticket writes also change it), so an
+        unchanged revision means the FAQ tab is unchanged but not the other way round.
+        
+        Args:
+            revision: Current spreadsheet modifiedTime, or None if unknown
+            
+        Returns:
+            False if the FAQ fetch can be skipped
+        """
+        if revision is None or revision != self._faq_revision or self.faq_cache is None:
+            return True
+        self._faq_loaded_at = time.monotonic()
+        self._log_faq_reload_skipped('spreadsheet revision unchanged')
+        return False
+    
+    def _apply_faq_values(self, values: list, revision) -> bool:
+        """
+        Apply a downloaded FAQ tab unless its content hash matches the current cache.
+        
+        Args:
+            values: Raw FAQ tab values (header row first)
+            revision: Spreadsheet revision the values were read at
+            
+        Returns:
+            True if the cache and index were rebuilt
+        """
+        content_hash = hashlib.sha256(
+            json.dumps(values, ensure_ascii=False, default=str).encode('utf-8')
+        ).hexdigest()
+        self._faq_revision = revision
+        self._faq_loaded_at = time.monotonic()
+        
+        if content_hash == self._faq_content_hash and self.faq_cache is not None:
+            self._log_faq_reload_skipped('content hash unchanged')
+            return False
+        
+        records = self._faq_records_from_values(values)
+        self._set_faq_cache(records)
+        self.storage.replace_faq(records)
+        self._faq_content_hash = content_hash
+        self._save_faq_snapshot(records, content_hash, revision)
+        self.faq_cache_stats['reloads_performed'] += 1
+        db_logger.info(
+            f"FAQ synced from Sheets. Total FAQ: {len(records)} "
+            f"({self.faq_cache_stats['reloads_performed']} reloads performed, "
+            f"{self.faq_cache_stats['reloads_skipped']} skipped)"
+        )
+        return True
+    
+    def _log_faq_reload_skipped(self, reason: str):
+        """Count and log a FAQ reload that was skipped by change detection."""
+        self.faq_cache_stats['reloads_skipped'] += 1
+        db_logger.info(
+            f"FAQ unchanged ({reason}), reload skipped "
+            f"({self.faq_cache_stats['reloads_performed']} reloads performed, "
+            f"{self.faq_cache_stats['reloads_skipped']} skipped)"
+        )
+    
+    def _set_faq_cache(self, records: list, index_search: bool = True):
+        """
+        Build a new FAQ index and swap it in together with the cache.
+        
+        Args:
+            records: FAQ records in sheet order
+            index_search: Update the search index now (False defers it to the first search)
+        """
+        self.faq_version += 1
+        index = FAQIndex(records, self.faq_version)
+        for trigger_id, first_position, duplicate_position in index.duplicates:
+            db_logger.warning(
+                f"Duplicate FAQ trigger_id '{trigger_id}': FAQ #{duplicate_position + 1} "
+                f"is shadowed by FAQ #{first_position + 1}"
+            )
+        if index_search:
+            self._update_faq_search(index)
+        
+        # Single attribute assignments: readers see either the old or the new snapshot
+        self.faq_index = index
+        self.faq_cache = list(index.records)
+    
+    def _update_faq_search(self, index: FAQIndex):
+        """Bring the search index up to an FAQ index version (only changed entries are re-tokenized)."""
+        added, removed = self.faq_search.update(index.records, index.version)
+        if added or removed:
+            db_logger.info(f"FAQ search index updated to v{index.version}: +{added} / -{removed} entries")
+    
+    async def pull_faq_from_sheets(self, check_revision: bool = True) -> bool:
+        """
+        Pull the FAQ tab into the cache and local store (async, used by the replicator).
+        
+        Skips the download when the spreadsheet revision is unchanged and the
+        rebuild when the downloaded content is unchanged.
+        
+        Args:
+            check_revision: Skip the download if the spreadsheet revision is unchanged
+                (pass False for forced reloads - Drive metadata can lag behind edits)
+        
+        Returns:
+            True if the cache and index were rebuilt
+        """
+        revision = await self._read_faq_revision()
+        if check_revision and not self._faq_revision_changed(revision):
+            return False
+        
+        faq_sheet = await self._get_async_worksheet(FAQ_TAB_NAME, PRIORITY_REPORTING)
+        try:
+            values = await self.scheduler.run(faq_sheet.get_all_values, kind=READ, priority=PRIORITY_REPORTING)
+        except Exception as e:
+            self._check_missing_worksheet(e, FAQ_TAB_NAME)
+            raise
+        
+        return self._apply_faq_values(values, revision)
+    
+    @staticmethod
+    def _faq_records_from_values(values: list) -> list:
+        """Convert raw FAQ tab values (header row first) to FAQ records."""
+        if not values:
+            return []
+        header = [str(cell).strip() for cell in values[0]]
+        positions = {column: header.index(column) for column in FAQ_COLUMNS if column in header}
+        
+        records = []
+        for row in values[1:]:
+            if not any(str(cell).strip() for cell in row):
+                continue
+            records.append({
+                column: row[idx] if idx < len(row) else ''
+                for column, idx in positions.items()
+            })
+        return records
     
     def get_faq_data(self, refresh: bool = False) -> list:
         """
-        Get FAQ data from cache or Sheets.
+        Get FAQ data from cache (stale-while-revalidate).
+        
+        Reads are served from memory; once the cache is older than FAQ_CACHE_TTL
+        a single background refresh is started and the current copy is returned.
         
         Args:
-            refresh: If True, refresh from Sheets
+            refresh: If True, reload from Sheets synchronously (CLI / legacy callers)
             
         Returns:
             List of FAQ records
         """
-        if refresh or self.faq_cache is None:
+        if refresh:
             self.reload_faq_cache()
+        elif self.faq_cache is None:
+            self.faq_cache_stats['misses'] += 1
+            if not self._schedule_faq_refresh():
+                # No event loop (CLI thread) - load synchronously
+                self.reload_faq_cache()
+        elif self.get_faq_cache_age() > FAQ_CACHE_TTL:
+            self.faq_cache_stats['stale_hits'] += 1
+            if not self._schedule_faq_refresh():
+                self.reload_faq_cache()
+        else:
+            self.faq_cache_stats['hits'] += 1
         return self.faq_cache if self.faq_cache else []
     
+    def get_faq_cache_age(self) -> float:
+        """Seconds since the FAQ cache was last loaded from Sheets (inf if never)."""
+        if self._faq_loaded_at is None:
+            return float('inf')
+        return time.monotonic() - self._faq_loaded_at
+    
+    def _schedule_faq_refresh(self, check_revision: bool = True) -> bool:
+        """
+        Start a background FAQ refresh unless one is already running.
+        
+        Args:
+            check_revision: Passed on to pull_faq_from_sheets
+        
+        Returns:
+            False if there is no running event loop to refresh on
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if self._faq_refresh_task is None or self._faq_refresh_task.done():
+            self._faq_refresh_task = loop.create_task(self._refresh_faq(check_revision))
+        return True
+    
+    async def refresh_faq_cache(self, check_revision: bool = True) -> bool:
+        """
+        Refresh the FAQ cache from Sheets now (joins a refresh that is already running).
+        
+        Args:
+            check_revision: Skip the download if the spreadsheet revision is unchanged.
+                A forced refresh (False) waits for a running refresh and then downloads
+                the FAQ tab again, since that refresh may have skipped it.
+        
+        Returns:
+            True if the cache was refreshed, False if Sheets could not be read
+        """
+        if not check_revision and self._faq_refresh_task is not None and not self._faq_refresh_task.done():
+            await asyncio.shield(self._faq_refresh_task)
+        self._schedule_faq_refresh(check_revision)
+        return await asyncio.shield(self._faq_refresh_task)
+    
+    async def _refresh_faq(self, check_revision: bool = True) -> bool:
+        """Single-flight FAQ refresh task."""
+        started = time.monotonic()
+        try:
+            await self.pull_faq_from_sheets(check_revision)
+            self._record_faq_refresh(started, True)
+            return True
+        except Exception as e:
+            self._record_faq_refresh(started, False)
+            db_logger.error(f"Error refreshing FAQ cache: {str(e)}")
+            return False
+    
+    def _record_faq_refresh(self, started: float, success: bool):
+        """Update refresh counters and durations."""
+        duration_ms = (time.monotonic() - started) * 1000
+        stats = self.faq_cache_stats
+        if success:
+            stats['refreshes'] += 1
+            stats['last_refresh_ms'] = duration_ms
+            stats['total_refresh_ms'] += duration_ms
+        else:
+            stats['refresh_failures'] += 1
+    
+    def get_faq_cache_stats(self) -> dict:
+        """
+        Get FAQ cache metrics.
+        
+        Returns:
+            Dict with entries, version, age, hit ratio and refresh durations
+        """
+        stats = self.faq_cache_stats
+        reads = stats['hits'] + stats['stale_hits'] + stats['misses']
+        age = self.get_faq_cache_age()
+        return {
+            'entries': len(self.faq_index),
+            'version': self.faq_version,
+            'age_seconds': round(age, 1) if age != float('inf') else None,
+            'ttl_seconds': FAQ_CACHE_TTL,
+            'hits': stats['hits'],
+            'stale_hits': stats['stale_hits'],
+            'misses': stats['misses'],
+            'hit_ratio': round(stats['hits'] / reads, 3) if reads else 0.0,
+            'refreshes': stats['refreshes'],
+            'refresh_failures': stats['refresh_failures'],
+            'last_refresh_ms': round(stats['last_refresh_ms'], 1),
+            'avg_refresh_ms': round(stats['total_refresh_ms'] / stats['refreshes'], 1) if stats['refreshes'] else 0.0,
+            'refreshing': self._faq_refresh_task is not None and not self._faq_refresh_task.done(),
+            'reloads_performed': stats['reloads_performed'],
+            'reloads_skipped': stats['reloads_skipped'],
+        }
+    
+    def search_faq(self, query: str, limit: int = 5) -> list:
+        """
+        Free-text FAQ search (BM25 over button_label and response_text).
+        
+        Args:
+            query: User's question
+            limit: Maximum number of results
+            
+        Returns:
+            List of FAQ records, best match first
+        """
+        self.get_faq_data()
+        index = self.faq_index
+        if self.faq_search.version != index.version:
+            self._update_faq_search(index)
+        return [record for _, record in self.faq_search.search(query, limit)]
+    
     def find_faq_by_trigger(self, trigger_id: str) -> dict:
         """
-        Find FAQ by trigger_id.
+        Find FAQ by trigger_id (O(1) lookup in the FAQ index).
         
         Args:
             trigger_id: FAQ trigger button ID
@@ -105,91 +757,69 @@ class GoogleSheetsManager:
         Returns:
             FAQ record or None if not found
         """
-        faq_data = self.get_faq_data()
-        for faq in faq_data:
-            if str(faq.get('trigger_id', '')).strip().lower() == str(trigger_id).strip().lower():
-                return faq
-        return None
+        if self.faq_cache is None:
+            self.get_faq_data()
+        return self.faq_index.get(trigger_id)
     
     def get_next_ticket_number(self) -> int:
-        """Get next ticket number (sync fallback for compatibility)."""
+        """
+        Get next ticket number (sync fallback for compatibility).
+        
+        Raises:
+            Exception: If the allocator could not be seeded from the Leads tab
+                (never guess a number - it could reuse an existing ticket's)
+        """
         try:
-            leads_sheet = self.spreadsheet.worksheet(LEADS_TAB_NAME)
-            all_records = leads_sheet.get_all_records()
-            if not all_records:
-                return 1
-            max_number = 0
-            for record in all_records:
-                try:
-                    ticket_num = int(record.get('ticket_number', 0) or 0)
-                    max_number = max(max_number, ticket_num)
-                except:
-                    pass
-            return max_number + 1
+            if not self.ticket_allocator.is_seeded():
+                leads_sheet = self.scheduler.run_sync(
+                    self.spreadsheet.worksheet, LEADS_TAB_NAME, kind=READ, priority=PRIORITY_TICKET_WRITE
+                )
+                all_records = self.scheduler.run_sync(
+                    leads_sheet.get_all_records, kind=READ, priority=PRIORITY_TICKET_WRITE
+                )
+                max_number = 0
+                for record in all_records:
+                    try:
+                        ticket_num = int(record.get('ticket_number', 0) or 0)
+                        max_number = max(max_number, ticket_num)
+                    except:
+                        pass
+                self.ticket_allocator.seed(max(max_number, self.storage.max_ticket_number()))
+            return self.ticket_allocator.next()
         except Exception as e:
             db_logger.error(f"Error getting next ticket number: {str(e)}")
-            return 1
+            raise
     
     async def get_next_ticket_number_async(self) -> int:
         """
-        Get next ticket number (async optimized with caching).
+        Get next ticket number from the local allocator (no network call once seeded).
         
         Returns:
             Ticket number
         """
-        try:
-            # Check cache (valid for 5 seconds)
-            if self.ticket_cache_time:
-                time_diff = (datetime.now() - self.ticket_cache_time).total_seconds()
-                if time_diff < 5 and self.last_ticket_number > 0:
-                    new_number = self.last_ticket_number + 1
-                    self.last_ticket_number = new_number
-                    return new_number
-            
-            # Get async client
-            client = await self._get_async_client()
-            spreadsheet = await client.open_by_key(GOOGLE_SHEETS_ID)
-            leads_sheet = await spreadsheet.worksheet(LEADS_TAB_NAME)
-            
-            # Optimize: Only get last 10 rows instead of all records
-            # This drastically reduces API response time
-            all_values = await leads_sheet.get_all_values()
-            
-            if len(all_values) <= 1:  # Only header or empty
-                self.last_ticket_number = 1
-                self.ticket_cache_time = datetime.now()
-                return 1
-            
-            # Get last 10 rows (or all if less than 10)
-            last_rows = all_values[-10:]
-            max_number = 0
-            
-            # Ticket number is in column 2 (index 1)
-            for row in last_rows:
-                try:
-                    if len(row) > 1:
-                        ticket_num = int(row[1])
-                        max_number = max(max_number, ticket_num)
-                except:
-                    pass
-            
-            new_number = max_number + 1
-            self.last_ticket_number = new_number
-            self.ticket_cache_time = datetime.now()
-            
-            return new_number
-            
-        except Exception as e:
-            db_logger.error(f"Error getting next ticket number (async): {str(e)}")
-            # Fallback: increment cache or start from 1
-            if self.last_ticket_number > 0:
-                return self.last_ticket_number + 1
-            return 1
+        await self._ensure_ticket_allocator_seeded()
+        
+        # Synchronous local increment - concurrent coroutines cannot interleave here
+        return self.ticket_allocator.next()
+    
+    async def _ensure_ticket_allocator_seeded(self):
+        """Seed the allocator from the sheet's highest ticket_number the first time it is used."""
+        if self.ticket_allocator.is_seeded():
+            return
+        
+        # Index covers every sheet row plus rows still in the journal
+        await self._ensure_leads_index()
+        value = self.ticket_allocator.seed(
+            max(self.leads_index.max_ticket_number(), self.storage.max_ticket_number())
+        )
+        db_logger.info(f"Ticket number allocator seeded at #{value}")
     
     def save_lead(self, discord_tag: str, name: str, order_id: str, 
                   issue_type: str, status: str = "PENDING") -> tuple:
         """
-        Save lead data to Leads tab (DEPRECATED - use async version).
+        Save lead data (DEPRECATED - use async version).
+        
+        Writes to the local store and journal; the bot's flusher appends it to Sheets.
         
         Args:
             discord_tag: User's Discord tag
@@ -202,8 +832,6 @@ class GoogleSheetsManager:
             Tuple (success: bool, ticket_number: int)
         """
         try:
-            leads_sheet = self.spreadsheet.worksheet(LEADS_TAB_NAME)
-            
             # Get next ticket number
             ticket_number = self.get_next_ticket_number()
             
@@ -214,8 +842,8 @@ class GoogleSheetsManager:
             # Prepare data in order: timestamp, ticket_number, discord_tag, name, order_id, issue_type, status
             row_data = [timestamp, ticket_number, discord_tag, name, order_id, issue_type, status]
             
-            # Append to sheet
-            leads_sheet.append_row(row_data)
+            journal_id = self._store_new_lead(row_data)
+            self.leads_index.add_pending(journal_id, row_data)
             db_logger.info(f"New lead saved: #{ticket_number} {name} ({order_id})")
             return (True, ticket_number)
             
@@ -224,28 +852,28 @@ class GoogleSheetsManager:
             return (False, 0)
     
     async def save_lead_async(self, discord_tag: str, name: str, order_id: str, 
-                              issue_type: str, status: str = "PENDING") -> tuple:
+                              issue_type: str, status: str = "PENDING", ticket_number: int = None) -> tuple:
         """
         Save lead data to Leads tab (async optimized).
         
+        The row is committed to the local store and write journal and
+        acknowledged immediately; the background flusher appends it to Sheets in a batch.
+        
         Args:
             discord_tag: User's Discord tag
             name: User's name
             order_id: User's order ID
             issue_type: Issue type
             status: Ticket status
+            ticket_number: Number already handed to the user (allocated here if None)
             
         Returns:
             Tuple (success: bool, ticket_number: int)
         """
         try:
-            # Get ticket number from cache first (faster)
-            ticket_number = await self.get_next_ticket_number_async()
-            
-            # Get async client
-            client = await self._get_async_client()
-            spreadsheet = await client.open_by_key(GOOGLE_SHEETS_ID)
-            leads_sheet = await spreadsheet.worksheet(LEADS_TAB_NAME)
+            # Allocate ticket number locally (no Sheets call)
+            if ticket_number is None:
+                ticket_number = await self.get_next_ticket_number_async()
             
             # Format timestamp
             tz = pytz.timezone('Asia/Jakarta')
@@ -254,8 +882,14 @@ class GoogleSheetsManager:
             # Prepare data in order: timestamp, ticket_number, discord_tag, name, order_id, issue_type, status
             row_data = [timestamp, ticket_number, discord_tag, name, order_id, issue_type, status]
             
-            # Append to sheet (async)
-            await leads_sheet.append_row(row_data)
+            # Durable local write - the ticket is safe once this returns
+            journal_id = self._store_new_lead(row_data)
+            self.leads_index.add_pending(journal_id, row_data)
+            
+            # Flush early when a burst fills the batch, otherwise wait for the interval
+            self._ensure_journal_flusher()
+            if self.journal.pending_count(LEADS_TAB_NAME) >= LEADS_FLUSH_BATCH_SIZE:
+                self._journal_flush_event.set()
             
             # Log in background (non-blocking)
             asyncio.create_task(self._log_save_success(ticket_number, name, order_id))
@@ -266,6 +900,29 @@ class GoogleSheetsManager:
             db_logger.error(f"Error saving lead (async): {str(e)}")
             return (False, 0)
     
+    def _store_new_lead(self, row_data: list) -> int:
+        """
+        Write a new lead to local storage and the write journal as one unit.
+        
+        Both are committed in a single transaction when they share a database
+        file; otherwise (memory backend) the lead is removed again if journaling fails.
+        
+        Args:
+            row_data: Lead row values in Leads column order
+            
+        Returns:
+            Journal entry ID
+        """
+        if getattr(self.storage, 'db_path', None) == self.journal.db_path:
+            return self.storage.add_lead_journaled(row_data, LEADS_TAB_NAME)
+        
+        self.storage.add_lead(row_data)
+        try:
+            return self.journal.append(LEADS_TAB_NAME, row_data)
+        except Exception:
+            self.storage.delete_lead(row_data[1])
+            raise
+    
     async def _log_save_success(self, ticket_number: int, name: str, order_id: str):
         """Background task to log save success."""
         try:
@@ -273,10 +930,237 @@ class GoogleSheetsManager:
         except:
             pass
     
+    def start_background_tasks(self):
+        """Start background workers (must be called from the bot's event loop)."""
+        self._ensure_journal_flusher()
+        
+        if self._leads_index_task is None or self._leads_index_task.done():
+            self._leads_index_task = asyncio.create_task(self._leads_index_sync_loop())
+        
+        self._ensure_replicator()
+        
+        if self._faq_views_task is None or self._faq_views_task.done():
+            self._faq_views_task = asyncio.create_task(self._faq_views_flush_loop())
+        
+        # Replay rows left unflushed by a previous run
+        pending = self.journal.pending_count()
+        if pending:
+            db_logger.info(f"Replaying {pending} unflushed journal row(s) to Sheets")
+            self._journal_flush_event.set()
+    
+    def _ensure_journal_flusher(self):
+        """Start the journal flusher task if it is not running."""
+        if self._journal_flush_task is None or self._journal_flush_task.done():
+            self._journal_flush_event = asyncio.Event()
+            if self._journal_flush_lock is None:
+                self._journal_flush_lock = asyncio.Lock()
+            self._journal_flush_task = asyncio.create_task(self._journal_flush_loop())
+    
+    async def _journal_flush_loop(self):
+        """Flush the journal every LEADS_FLUSH_INTERVAL seconds or when a batch fills up."""
+        while True:
+            try:
+                await asyncio.wait_for(self._journal_flush_event.wait(), timeout=LEADS_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._journal_flush_event.clear()
+            
+            try:
+                await self.flush_journal()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Rows stay in the journal and are retried on the next cycle
+                db_logger.error(f"Error flushing write journal: {str(e)}")
+    
+    async def flush_journal(self) -> int:
+        """
+        Append all pending journal rows to Sheets (one multi-row append per tab).
+        
+        Returns:
+            Number of rows flushed
+        """
+        if self._journal_flush_lock is None:
+            self._journal_flush_lock = asyncio.Lock()
+        
+        # A replay must not duplicate rows: refresh the index tail first (no read on the normal path)
+        if self._journal_unconfirmed:
+            await self.sync_leads_index()
+        
+        async with self._journal_flush_lock:
+            self._drop_journaled_duplicates()
+            pending = self.journal.get_pending()
+            if not pending:
+                return 0
+            
+            # Group rows by tab, keeping journal order
+            batches = {}
+            for entry_id, tab_name, row_data in pending:
+                batches.setdefault(tab_name, []).append((entry_id, row_data))
+            
+            flushed = 0
+            for tab_name, entries in batches.items():
+                # Ticket rows take the top lane; analytics rows are reporting traffic
+                priority = PRIORITY_TICKET_WRITE if tab_name == LEADS_TAB_NAME else PRIORITY_REPORTING
+                header = FAQ_VIEW_COLUMNS if tab_name == FAQ_VIEWS_TAB_NAME else None
+                worksheet = await self._get_async_worksheet(tab_name, priority, header=header)
+                entry_ids = [entry_id for entry_id, _ in entries]
+                if tab_name == LEADS_TAB_NAME:
+                    # Until mark_flushed, a failure may hide a successful append
+                    self._journal_unconfirmed.update(entry_ids)
+                try:
+                    response = await self.scheduler.run(
+                        worksheet.append_rows, [row_data for _, row_data in entries],
+                        kind=WRITE, priority=priority
+                    )
+                except Exception as e:
+                    self._check_missing_worksheet(e, tab_name)
+                    raise
+                
+                # Only drop rows from the journal after Sheets accepted them
+                self.journal.mark_flushed(entry_ids)
+                self._journal_unconfirmed.difference_update(entry_ids)
+                flushed += len(entries)
+                
+                if tab_name == LEADS_TAB_NAME:
+                    start_row = self._get_appended_start_row(response)
+                    if start_row:
+                        self.leads_index.mark_flushed(entry_ids, start_row)
+                elif tab_name == FAQ_VIEWS_TAB_NAME:
+                    self.faq_views.mark_flushed([row_data for _, row_data in entries])
+            
+            db_logger.info(f"Flushed {flushed} journal row(s) to Sheets")
+            return flushed
+    
+    def _drop_journaled_duplicates(self):
+        """Remove unconfirmed Leads journal entries whose ticket number is already in the sheet."""
+        if not self._journal_unconfirmed or not self.leads_index.loaded:
+            return
+        
+        duplicates = [
+            entry_id
+            for entry_id, _, row_data in self.journal.get_pending(LEADS_TAB_NAME)
+            if entry_id in self._journal_unconfirmed and self.leads_index.in_sheet(row_data[1])
+        ]
+        if duplicates:
+            self.journal.mark_flushed(duplicates)
+            self.leads_index.drop_pending(duplicates)
+            db_logger.warning(f"Skipped {len(duplicates)} journal row(s) already present in the Leads tab")
+        # Everything else was checked against the sheet and is safe to send
+        self._journal_unconfirmed.clear()
+    
+    @staticmethod
+    def _get_appended_start_row(response) -> int:
+        """Get the first row number written by an append_rows call (e.g. 'Leads!A12:G14' -> 12)."""
+        try:
+            updated_range = response['updates']['updatedRange']
+            match = re.search(r'![A-Z]+(\d+)', updated_range)
+            return int(match.group(1)) if match else 0
+        except Exception:
+            return 0
+    
+    async def _leads_index_sync_loop(self):
+        """Load the Leads index once, then keep it in sync in the background."""
+        last_full_reload = time.monotonic()
+        while True:
+            try:
+                if not self.leads_index.loaded:
+                    await self._ensure_leads_index()
+                    await self._ensure_ticket_allocator_seeded()
+                    last_full_reload = time.monotonic()
+                
+                await asyncio.sleep(LEADS_INDEX_SYNC_INTERVAL)
+                
+                # Periodic full reload picks up rows edited or deleted by hand in Sheets
+                if time.monotonic() - last_full_reload >= LEADS_INDEX_FULL_RELOAD_INTERVAL:
+                    await self.load_leads_index()
+                    last_full_reload = time.monotonic()
+                else:
+                    await self.sync_leads_index()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                db_logger.error(f"Error syncing leads index: {str(e)}")
+                await asyncio.sleep(LEADS_INDEX_SYNC_INTERVAL)
+    
+    async def load_leads_index(self):
+        """Rebuild the Leads index from a full download of the Leads tab."""
+        if self._leads_index_lock is None:
+            self._leads_index_lock = asyncio.Lock()
+        if self._journal_flush_lock is None:
+            self._journal_flush_lock = asyncio.Lock()
+        
+        # Hold the flush lock so journal rows cannot move into the sheet mid-load
+        async with self._leads_index_lock, self._journal_flush_lock:
+            leads_sheet = await self._get_async_worksheet(LEADS_TAB_NAME)
+            try:
+                all_values = await self.scheduler.run(
+                    leads_sheet.get_all_values, kind=READ, priority=PRIORITY_STATUS
+                )
+            except Exception as e:
+                self._check_missing_worksheet(e, LEADS_TAB_NAME)
+                raise
+            self.leads_index.load(all_values)
+            
+            # Pull rows that exist only in Sheets (first run, memory backend, manual additions)
+            imported = self.storage.import_leads(self.leads_index.sheet_rows())
+            if imported:
+                db_logger.info(f"Imported {imported} lead(s) from Sheets into local storage")
+            
+            # Rows still in the journal are known locally but not in the sheet yet
+            for entry_id, _, row_data in self.journal.get_pending(LEADS_TAB_NAME):
+                self.leads_index.add_pending(entry_id, row_data)
+            
+            db_logger.info(f"Leads index loaded: {len(self.leads_index)} lead(s)")
+    
+    async def sync_leads_index(self) -> int:
+        """
+        Fetch only the rows added to the Leads tab since the last sync.
+        
+        Returns:
+            Number of new rows indexed
+        """
+        if not self.leads_index.loaded:
+            await self._ensure_leads_index()
+            return 0
+        
+        async with self._leads_index_lock, self._journal_flush_lock:
+            leads_sheet = await self._get_async_worksheet(LEADS_TAB_NAME)
+            
+            start_row = self.leads_index.known_row_count + 1
+            last_column = chr(ord('A') + len(LEAD_COLUMNS) - 1)
+            try:
+                rows = await self.scheduler.run(
+                    leads_sheet.get, f"A{start_row}:{last_column}", kind=READ, priority=PRIORITY_STATUS
+                )
+            except gspread.exceptions.APIError as e:
+                # Nothing past the last known row yet
+                if 'exceeds grid limits' in str(e):
+                    return 0
+                self._check_missing_worksheet(e, LEADS_TAB_NAME)
+                raise
+            added = self.leads_index.add_rows(start_row, list(rows))
+            
+            if added:
+                self.storage.import_leads(list(rows))
+                db_logger.info(f"Leads index synced: {added} new row(s)")
+            return added
+    
+    async def _ensure_leads_index(self):
+        """Wait for the initial Leads index load if it has not happened yet."""
+        if self.leads_index.loaded:
+            return
+        # Concurrent callers share a single in-flight load
+        if self._leads_index_load_task is None or self._leads_index_load_task.done():
+            self._leads_index_load_task = asyncio.create_task(self.load_leads_index())
+        await asyncio.shield(self._leads_index_load_task)
+    
     def update_lead_status(self, order_id: str, new_status: str) -> bool:
         """
         Update lead status by order_id (DEPRECATED - use async version).
         
+        Updates the local store; the bot's replicator mirrors it to Sheets.
+        
         Args:
             order_id: Order ID to update
             new_status: New status (PENDING, IN_PROGRESS, RESOLVED, CLOSED)
@@ -285,16 +1169,9 @@ class GoogleSheetsManager:
             True if successful, False if failed
         """
         try:
-            leads_sheet = self.spreadsheet.worksheet(LEADS_TAB_NAME)
-            
-            # Find row with order_id
-            all_records = leads_sheet.get_all_records()
-            for idx, record in enumerate(all_records, start=2):  # start=2 because header is in row 1
-                if str(record.get('order_id', '')).strip() == str(order_id).strip():
-                    # Column 7 = status (timestamp, ticket_number, discord_tag, name, order_id, issue_type, status)
-                    leads_sheet.update_cell(idx, 7, new_status)
-                    db_logger.info(f"Lead status {order_id} updated to {new_status}")
-                    return True
+            if self.storage.update_lead_status(order_id, new_status):
+                db_logger.info(f"Lead status {order_id} updated to {new_status}")
+                return True
             
             db_logger.warning(f"Order ID {order_id} not found")
             return False
@@ -307,6 +1184,9 @@ class GoogleSheetsManager:
         """
         Update lead status by order_id (async optimized).
         
+        The local store is updated immediately; the replicator mirrors the
+        change to the Leads tab in the next status batch.
+        
         Args:
             order_id: Order ID to update
             new_status: New status (PENDING, IN_PROGRESS, RESOLVED, CLOSED)
@@ -314,35 +1194,93 @@ class GoogleSheetsManager:
         Returns:
             True if successful, False if failed
         """
+        return await self.queue_lead_status_update(order_id, new_status) is not None
+    
+    async def queue_lead_status_update(self, order_id: str, new_status: str):
+        """
+        Update lead status locally and queue it for the next batched Sheets write.
+        
+        Updates to the same ticket inside one STATUS_BATCH_WINDOW collapse to the
+        final status and every changed row is sent in a single batch_update.
+        
+        Args:
+            order_id: Order ID to update
+            new_status: New status (PENDING, IN_PROGRESS, RESOLVED, CLOSED)
+            
+        Returns:
+            Future resolving to True once the batch carrying this change commits
+            to Sheets (False if the batch failed - it is retried in the background),
+            or None if the lead was not found or the local update failed
+        """
         try:
-            # Get async client
-            client = await self._get_async_client()
-            spreadsheet = await client.open_by_key(GOOGLE_SHEETS_ID)
-            leads_sheet = await spreadsheet.worksheet(LEADS_TAB_NAME)
-            
-            # Get all values (more efficient than get_all_records)
-            all_values = await leads_sheet.get_all_values()
-            
-            if len(all_values) <= 1:  # Only header or empty
-                db_logger.warning(f"Order ID {order_id} not found (empty sheet)")
-                return False
-            
-            # Find row with order_id (order_id is column 5, index 4)
-            for idx, row in enumerate(all_values[1:], start=2):  # Skip header
-                if len(row) > 4 and str(row[4]).strip() == str(order_id).strip():
-                    # Column 7 = status (index 6)
-                    await leads_sheet.update_cell(idx, 7, new_status)
-                    
-                    # Log in background
-                    asyncio.create_task(self._log_status_update(order_id, new_status))
-                    return True
+            await self._ensure_storage_hydrated()
             
-            db_logger.warning(f"Order ID {order_id} not found")
-            return False
+            updated = self.storage.update_lead_status(order_id, new_status)
+            if not updated:
+                # Row may have been added by hand in Sheets since the last sync
+                await self.sync_leads_index()
+                updated = self.storage.update_lead_status(order_id, new_status)
+            
+            if not updated:
+                db_logger.warning(f"Order ID {order_id} not found")
+                return None
+            
+            # No await between the local update and registering the waiter,
+            # so the replicator cannot snapshot one without the other
+            lead = self.storage.get_lead(order_id)
+            future = asyncio.get_running_loop().create_future()
+            self._status_waiters.setdefault(int(lead['ticket_number']), []).append(future)
+            self._wake_replicator()
+            
+            # Log in background
+            asyncio.create_task(self._log_status_update(order_id, new_status))
+            return future
             
         except Exception as e:
             db_logger.error(f"Error updating lead status (async): {str(e)}")
-            return False
+            return None
+    
+    async def queue_ticket_status_update(self, ticket_number: int, new_status: str):
+        """
+        Update one ticket's lead status locally and queue it for the next batched Sheets write.
+        
+        Unlike queue_lead_status_update, the row is picked by ticket number, so
+        several tickets on the same order never overwrite each other.
+        
+        Args:
+            ticket_number: Ticket number to update
+            new_status: New status
+            
+        Returns:
+            Future resolving to True once the batch carrying this change commits
+            to Sheets (False if the batch failed - it is retried in the background),
+            or None if the lead was not found or the local update failed
+        """
+        try:
+            await self._ensure_storage_hydrated()
+            
+            updated = self.storage.update_ticket_status(ticket_number, new_status)
+            if not updated:
+                # Row may have been added by hand in Sheets since the last sync
+                await self.sync_leads_index()
+                updated = self.storage.update_ticket_status(ticket_number, new_status)
+            
+            if not updated:
+                db_logger.warning(f"Ticket #{ticket_number} not found")
+                return None
+            
+            # No await between the local update and registering the waiter,
+            # so the replicator cannot snapshot one without the other
+            future = asyncio.get_running_loop().create_future()
+            self._status_waiters.setdefault(int(ticket_number), []).append(future)
+            self._wake_replicator()
+            
+            db_logger.info(f"Ticket #{ticket_number} status updated to {new_status}")
+            return future
+            
+        except Exception as e:
+            db_logger.error(f"Error updating ticket status (async): {str(e)}")
+            return None
     
     async def _log_status_update(self, order_id: str, new_status: str):
         """Background task to log status update."""
@@ -351,9 +1289,139 @@ class GoogleSheetsManager:
         except:
             pass
     
+    def record_ticket_thread(self, ticket_number: int, user_id: int, order_id: str, thread_id: int) -> None:
+        """
+        Remember a new ticket's thread so its buttons keep working after a restart.
+        
+        Args:
+            ticket_number: Ticket number
+            user_id: Discord ID of the user who opened the ticket
+            order_id: Order ID from the form
+            thread_id: Ticket thread ID
+            
+        Raises:
+            sqlite3.Error: If the ticket could not be stored (the caller retries the step)
+        """
+        self.ticket_states.add(ticket_number, user_id, order_id, thread_id, PENDING)
+        self.tickets.track(TicketRecord(ticket_number, user_id, order_id, thread_id, PENDING))
+    
+    async def get_ticket_state(self, ticket_number: int, user_id: int, order_id: str, thread_id: int) -> TicketRecord:
+        """
+        Get a ticket from the state machine, adopting it if it is not tracked yet.
+        
+        Tracked tickets are answered from memory. Others are read from the local
+        ticket state table, then from the Leads data (tickets created before the
+        table existed).
+        
+        Args:
+            ticket_number: Ticket number
+            user_id: Discord ID of the user who opened the ticket
+            order_id: Order ID of the ticket
+            thread_id: Ticket thread ID
+            
+        Returns:
+            Tracked TicketRecord
+        """
+        record = self.tickets.get(ticket_number)
+        if record is not None:
+            return record
+        
+        record = self.ticket_states.get(ticket_number)
+        if record is None:
+            await self._ensure_storage_hydrated()
+            lead = self.storage.get_lead_by_ticket_number(ticket_number)
+            status = lead.get('status') if lead and lead.get('status') else PENDING
+            self.ticket_states.add(ticket_number, user_id, order_id, thread_id, status)
+            record = TicketRecord(ticket_number, user_id, order_id, thread_id, status)
+        return self.tickets.track(record)
+    
+    def transition_ticket(self, ticket_number: int, new_status: str, expected: str = None, actor: int = None) -> str:
+        """
+        Apply a validated status change in memory and persist it in the background.
+        
+        The ticket state table and the Leads status (and through it the Leads tab)
+        are written by a background task, so the caller never waits on disk or Sheets.
+        
+        Args:
+            ticket_number: Tracked ticket number
+            new_status: Requested status
+            expected: Status the caller acted on (compare-and-set; losing counts as contention)
+            actor: Discord ID of the member making the change
+            
+        Returns:
+            The previous status
+            
+        Raises:
+            InvalidTicketTransition: If the status moved on or the change is not allowed
+        """
+        try:
+            previous = self.tickets.transition(ticket_number, new_status, expected=expected, actor=actor)
+        except InvalidTicketTransition as rejected:
+            if expected is not None and rejected.current != expected:
+                self.ticket_locks.record_conflict(ticket_number)
+            raise
+        
+        # Later changes to the same ticket overwrite earlier unwritten ones
+        self._ticket_state_writes[ticket_number] = new_status
+        if self._ticket_state_task is None or self._ticket_state_task.done():
+            self._ticket_state_event = asyncio.Event()
+            self._ticket_state_task = asyncio.create_task(self._ticket_state_write_loop())
+        self._ticket_state_event.set()
+        return previous
+    
+    async def _ticket_state_write_loop(self):
+        """Persist accepted ticket transitions to the state table and the Leads data."""
+        while True:
+            await self._ticket_state_event.wait()
+            self._ticket_state_event.clear()
+            
+            writes, self._ticket_state_writes = self._ticket_state_writes, {}
+            try:
+                await asyncio.to_thread(self.ticket_states.set_statuses, writes)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                db_logger.error(f"Error persisting ticket states: {str(e)}")
+                # Keep anything newer that arrived meanwhile, retry the rest shortly
+                for ticket_number, status in writes.items():
+                    self._ticket_state_writes.setdefault(ticket_number, status)
+                await asyncio.sleep(1)
+                self._ticket_state_event.set()
+                continue
+            
+            for ticket_number, status in writes.items():
+                # Local store now, Leads tab in the next status batch
+                await self.queue_ticket_status_update(ticket_number, status)
+    
+    def get_open_tickets(self) -> list:
+        """
+        Get tickets whose views must be restored at startup (in memory, no Sheets call).
+        
+        Returns:
+            List of TicketRecord, newest first
+        """
+        return self.tickets.open_tickets()
+    
+    def get_ticket_state_stats(self) -> dict:
+        """
+        Get ticket state machine metrics.
+        
+        Returns:
+            Dict with tracked tickets per status, accepted/rejected transitions,
+            unwritten changes and per-ticket lock contention
+        """
+        return {
+            'tracked': len(self.tickets),
+            'statuses': self.tickets.count_by_status(),
+            'transitions': self.tickets.stats['transitions'],
+            'rejected': self.tickets.stats['rejected'],
+            'pending_writes': len(self._ticket_state_writes),
+            'locks': self.ticket_locks.get_stats(),
+        }
+    
     async def find_lead_by_order_id_async(self, order_id: str) -> dict:
         """
-        Find specific lead by order_id (async optimized - no full table scan).
+        Find specific lead by order_id (served from local storage).
         
         Args:
             order_id: Order ID to find
@@ -362,42 +1430,238 @@ class GoogleSheetsManager:
             Lead record dict or None if not found
         """
         try:
-            # Get async client
-            client = await self._get_async_client()
-            spreadsheet = await client.open_by_key(GOOGLE_SHEETS_ID)
-            leads_sheet = await spreadsheet.worksheet(LEADS_TAB_NAME)
+            await self._ensure_storage_hydrated()
             
-            # Find the cell containing the order_id (column 5)
-            try:
-                cell = await leads_sheet.find(str(order_id).strip())
-                if cell and cell.col == 5:  # order_id is in column 5
-                    # Get the entire row
-                    row_values = await leads_sheet.row_values(cell.row)
-                    
-                    # Map to dict with column names
-                    if len(row_values) >= 7:
-                        return {
-                            'timestamp': row_values[0] if len(row_values) > 0 else '',
-                            'ticket_number': row_values[1] if len(row_values) > 1 else '',
-                            'discord_tag': row_values[2] if len(row_values) > 2 else '',
-                            'name': row_values[3] if len(row_values) > 3 else '',
-                            'order_id': row_values[4] if len(row_values) > 4 else '',
-                            'issue_type': row_values[5] if len(row_values) > 5 else '',
-                            'status': row_values[6] if len(row_values) > 6 else '',
-                        }
-            except:
-                # Cell not found
-                pass
+            lead = self.storage.get_lead(order_id)
+            if lead is None:
+                # One targeted fetch of rows added in Sheets since the last sync
+                await self.sync_leads_index()
+                lead = self.storage.get_lead(order_id)
             
-            return None
+            return lead
             
         except Exception as e:
             db_logger.error(f"Error finding lead by order_id (async): {str(e)}")
             return None
     
+    async def _ensure_storage_hydrated(self):
+        """Import the Leads tab once if the local store starts out empty."""
+        if self._storage_hydrated:
+            return
+        if self.storage.count_leads() == 0:
+            # First run or memory backend: the index load imports every sheet row
+            await self._ensure_leads_index()
+        self._storage_hydrated = True
+    
+    def _ensure_replicator(self):
+        """Start the Sheets replicator task if it is not running."""
+        if self._replication_task is None or self._replication_task.done():
+            self._replication_event = asyncio.Event()
+            self._replication_task = asyncio.create_task(self._replication_loop())
+    
+    def _wake_replicator(self):
+        """Ask the replicator to mirror pending changes now instead of waiting for the interval."""
+        try:
+            self._ensure_replicator()
+            self._replication_event.set()
+        except RuntimeError:
+            # No running event loop (CLI thread) - the bot's replicator picks it up on its next cycle
+            pass
+    
+    async def _replication_loop(self):
+        """Keep the Leads and FAQ tabs in sync with local storage."""
+        last_faq_pull = time.monotonic()
+        while True:
+            try:
+                await asyncio.wait_for(self._replication_event.wait(), timeout=REPLICATION_INTERVAL)
+                # Woken by a status change: keep the batch open so rapid clicks share one write
+                await asyncio.sleep(STATUS_BATCH_WINDOW)
+            except asyncio.TimeoutError:
+                pass
+            self._replication_event.clear()
+            
+            try:
+                await self.replicate_lead_statuses()
+                
+                # Admins edit the FAQ in Sheets, so FAQ flows Sheets -> local
+                if time.monotonic() - last_faq_pull >= FAQ_SYNC_INTERVAL:
+                    last_faq_pull = time.monotonic()
+                    await self.refresh_faq_cache()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Unsynced rows stay flagged and are retried on the next cycle
+                db_logger.error(f"Error replicating to Sheets: {str(e)}")
+    
+    async def replicate_lead_statuses(self) -> int:
+        """
+        Mirror locally changed lead statuses to the Leads tab in one batch_update.
+        
+        Returns:
+            Number of leads mirrored
+        """
+        # Snapshot waiters together with the unsynced rows (no await in between):
+        # storage holds one row per ticket, so repeated updates are already collapsed
+        waiters = self._status_waiters
+        self._status_waiters = {}
+        leads = self.storage.get_unsynced_leads()
+        
+        try:
+            done = {}
+            if leads:
+                await self._ensure_leads_index()
+                done = await self._write_lead_statuses_to_sheet(leads)
+        except Exception:
+            self._resolve_status_waiters(waiters, {ticket_number: False for ticket_number in waiters})
+            raise
+        
+        retry = set()
+        for lead in leads:
+            ticket_number = int(lead['ticket_number'])
+            if ticket_number in done:
+                self.storage.mark_lead_synced(ticket_number, lead['status'])
+            else:
+                retry.add(ticket_number)
+        self._resolve_status_waiters(waiters, done, retry)
+        return sum(1 for committed in done.values() if committed)
+    
+    def _resolve_status_waiters(self, waiters: dict, done: dict, retry: set = frozenset()):
+        """
+        Resolve status futures after a batch.
+        
+        Args:
+            waiters: ticket_number -> futures snapshotted with the batch
+            done: ticket_number -> True if committed, False if not mirrored
+            retry: Tickets left for the next batch (their futures keep waiting)
+        """
+        for ticket_number, futures in waiters.items():
+            if ticket_number in retry:
+                self._status_waiters.setdefault(ticket_number, []).extend(futures)
+                continue
+            for future in futures:
+                if not future.done():
+                    future.set_result(done.get(ticket_number, True))
+    
+    async def _write_lead_statuses_to_sheet(self, leads: list) -> dict:
+        """
+        Write lead statuses to their Leads rows (located through the Leads index).
+        
+        Args:
+            leads: Lead dicts from local storage
+            
+        Returns:
+            Dict of ticket_number -> True if committed, False if the row does not exist
+            (tickets missing from the dict are retried in the next batch)
+        """
+        records = {}
+        for lead in leads:
+            records[int(lead['ticket_number'])] = self.leads_index.get_by_ticket_number(lead['ticket_number'])
+        if any(record is None for record in records.values()):
+            await self.sync_leads_index()
+            for ticket_number, record in records.items():
+                if record is None:
+                    records[ticket_number] = self.leads_index.get_by_ticket_number(ticket_number)
+        
+        if self._journal_flush_lock is None:
+            self._journal_flush_lock = asyncio.Lock()
+        
+        done = {}
+        updates = []
+        async with self._journal_flush_lock:
+            for lead in leads:
+                ticket_number = int(lead['ticket_number'])
+                record = records[ticket_number]
+                new_status = lead['status']
+                
+                if record is None:
+                    db_logger.warning(f"Ticket #{ticket_number} not found in Leads tab, status not mirrored")
+                    done[ticket_number] = False
+                elif record.row_number is None:
+                    # Row still in the journal: rewrite it there so the flushed row carries the new status
+                    values = list(record.values)
+                    values[STATUS_COLUMN - 1] = new_status
+                    if self.journal.update_pending(record.journal_id, values):
+                        self.leads_index.set_status(record, new_status)
+                        done[ticket_number] = True
+                    # Otherwise it was flushed without a known row number - retry after the next index sync
+                else:
+                    updates.append((ticket_number, record, new_status))
+        
+        if not updates:
+            return done
+        
+        status_column = chr(ord('A') + STATUS_COLUMN - 1)
+        leads_sheet = await self._get_async_worksheet(LEADS_TAB_NAME)
+        try:
+            await self.scheduler.run(
+                leads_sheet.batch_update,
+                [{'range': f"{status_column}{record.row_number}", 'values': [[new_status]]}
+                 for _, record, new_status in updates],
+                kind=WRITE, priority=PRIORITY_STATUS
+            )
+        except Exception as e:
+            self._check_missing_worksheet(e, LEADS_TAB_NAME)
+            raise
+        
+        for ticket_number, record, new_status in updates:
+            self.leads_index.set_status(record, new_status)
+            done[ticket_number] = True
+        db_logger.info(f"Mirrored {len(updates)} status change(s) to Sheets in one batch")
+        return done
+    
+    def record_faq_view(self, trigger_id: str):
+        """Count a FAQ view for the FAQ Views tab (in-memory increment, no I/O)."""
+        self.faq_views.record(trigger_id)
+    
+    async def _faq_views_flush_loop(self):
+        """Move FAQ view counts into the write journal every FAQ_VIEWS_FLUSH_INTERVAL seconds."""
+        while True:
+            await asyncio.sleep(FAQ_VIEWS_FLUSH_INTERVAL)
+            try:
+                self.flush_faq_views()
+            except Exception as e:
+                db_logger.error(f"Error flushing FAQ view counts: {str(e)}")
+    
+    def flush_faq_views(self) -> int:
+        """
+        Journal the FAQ view counts collected since the last flush.
+        
+        The journal flusher appends them to the FAQ Views tab in one append_rows call,
+        as rows [hour, trigger_id, views] (the tab is created on first use).
+        
+        Returns:
+            Number of (hour, trigger_id) rows journaled
+        """
+        rows = self.faq_views.drain()
+        if not rows:
+            return 0
+        try:
+            self.journal.append_many(FAQ_VIEWS_TAB_NAME, rows)
+        except Exception:
+            self.faq_views.restore(rows)
+            raise
+        db_logger.info(
+            f"Journaled {sum(row[2] for row in rows)} FAQ view(s) as {len(rows)} FAQ Views row(s)"
+        )
+        return len(rows)
+    
+    def get_faq_view_stats(self) -> dict:
+        """
+        Get FAQ view counter totals.
+        
+        Returns:
+            Dict with total views, views written to Sheets and counters pending
+        """
+        return {
+            'total_views': self.faq_views.total_views,
+            'flushed_views': self.faq_views.total_flushed,
+            'pending_counters': self.faq_views.pending(),
+            'flush_interval': FAQ_VIEWS_FLUSH_INTERVAL,
+        }
+    
     def log_analytics(self, total_tickets: int, unresolved_queries: int) -> bool:
         """
-        Log analytics data.
+        Log analytics data (stored locally, appended to the Analytics tab by the journal flusher).
         
         Args:
             total_tickets: Total tickets today
@@ -407,12 +1671,11 @@ class GoogleSheetsManager:
             True if successful, False if failed
         """
         try:
-            analytics_sheet = self.spreadsheet.worksheet(ANALYTICS_TAB_NAME)
-            
             date_str = datetime.now().strftime('%Y-%m-%d')
             row_data = [date_str, total_tickets, unresolved_queries]
             
-            analytics_sheet.append_row(row_data)
+            self.storage.add_analytics(row_data)
+            self.journal.append(ANALYTICS_TAB_NAME, row_data)
             db_logger.info(f"Analytics data logged: {total_tickets} tickets, {unresolved_queries} unresolved")
             return True
             
@@ -420,9 +1683,21 @@ class GoogleSheetsManager:
             db_logger.error(f"Error logging analytics: {str(e)}")
             return False
     
+    async def get_all_leads_async(self, limit: int = 50) -> list:
+        """
+        Async variant of get_all_leads (the local query runs in a worker thread).
+        
+        Args:
+            limit: Maximum number of records to retrieve
+            
+        Returns:
+            List of lead records
+        """
+        return await asyncio.to_thread(self.get_all_leads, limit)
+    
     def get_all_leads(self, limit: int = 50) -> list:
         """
-        Get all leads data (for reporting).
+        Get all leads data (for reporting, served from local storage).
         
         Args:
             limit: Maximum number of records to retrieve
@@ -431,9 +1706,7 @@ class GoogleSheetsManager:
             List of lead records
         """
         try:
-            leads_sheet = self.spreadsheet.worksheet(LEADS_TAB_NAME)
-            all_records = leads_sheet.get_all_records()
-            return all_records[-limit:] if len(all_records) > limit else all_records
+            return self.storage.get_recent_leads(limit)
             
         except Exception as e:
             db_logger.error(f"Error getting leads: {str(e)}")
@@ -2,13 +2,14 @@ import discord
 from discord.ext import commands
 from handlers.database import get_db_manager
 from utils.logger import event_logger, bot_logger
-from config import LOGS_CHANNEL_ID
+from config import LOGS_CHANNEL_ID, DISCORD_GUILD_ID
 
 class Events(commands.Cog):
     """Event handlers for bot."""
     
     def __init__(self, bot):
         self.bot = bot
+        self.app_commands_synced = False
     
     @commands.Cog.listener()
     async def on_ready(self) -> None:
@@ -25,16 +26,37 @@ class Events(commands.Cog):
             )
             await self.bot.change_presence(activity=activity, status=discord.Status.online)
             
+            # Register slash commands (once per process - on_ready also fires on reconnects)
+            if not self.app_commands_synced:
+                await self.sync_app_commands()
+            
             # Initialize database
             try:
                 db = get_db_manager()
-                bot_logger.info("✅ Database (Google Sheets) connected")
+                db.start_initialization()
+                db.start_background_tasks()
+                db.record_startup_event('discord_ready')
+                bot_logger.info(f"✅ Database background tasks started ({db.format_startup_timeline()})")
             except Exception as e:
                 bot_logger.error(f"❌ Failed to connect database: {str(e)}")
             
         except Exception as e:
             event_logger.error(f"Error di on_ready: {str(e)}")
     
+    async def sync_app_commands(self) -> None:
+        """Sync slash commands (to DISCORD_GUILD_ID when set, where they appear immediately)."""
+        try:
+            if DISCORD_GUILD_ID:
+                guild = discord.Object(id=DISCORD_GUILD_ID)
+                self.bot.tree.copy_global_to(guild=guild)
+                synced = await self.bot.tree.sync(guild=guild)
+            else:
+                synced = await self.bot.tree.sync()
+            self.app_commands_synced = True
+            bot_logger.info(f"✅ Synced {len(synced)} slash command(s)")
+        except Exception as e:
+            bot_logger.error(f"❌ Failed to sync slash commands: {str(e)}")
+    
     @commands.Cog.listener()
     async def on_command_error(self, ctx: commands.Context, error: Exception) -> None:
         """Handle command errors."""
@@ -3,16 +3,40 @@ from discord.ext import commands
 from discord.ui import Modal, TextInput, View, Button
 from handlers.database import get_db_manager
 from utils.logger import event_logger
-from config import STAFF_NOTIFICATION_CHANNEL_ID, SUPPORT_CHANNEL_ID
+from utils.ticket_queue import TicketJob, TicketWorkerPool
+from utils.ticket_state import InvalidTicketTransition, PENDING, IN_PROGRESS, RESOLVED, CLOSED
+from config import (
+    STAFF_NOTIFICATION_CHANNEL_ID, SUPPORT_CHANNEL_ID,
+    TICKET_WORKERS, TICKET_QUEUE_SIZE, TICKET_MAX_ATTEMPTS, TICKET_RETRY_DELAY
+)
 import pytz
 from datetime import datetime
 import asyncio
+import time
+
+# Per-ticket custom_ids: a restored view only answers the buttons of its own ticket
+CLOSE_TICKET_CUSTOM_ID = "ticket_close:{}"
+TAKE_TICKET_CUSTOM_ID = "ticket_take:{}"
+
+# Open tickets whose views are rebuilt per event loop turn at startup
+VIEW_RESTORE_CHUNK = 100
+
+# Thread-side steps a ticket job must finish (recorded in TicketJob.steps_done)
+TICKET_STEPS = ('record_thread', 'add_user', 'thread_messages', 'staff_notification', 'user_confirmation')
 
 class SupportModals(commands.Cog):
     """Cog to handle support modals and views."""
     
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.view_restore_task = None
+    
+    async def cog_load(self) -> None:
+        """Restore the persistent views of open tickets (local state only, no Sheets read)."""
+        tickets = get_db_manager().get_open_tickets()
+        if tickets:
+            # Views are rebuilt in the background while the bot logs in
+            self.view_restore_task = asyncio.create_task(restore_ticket_views(self.bot, tickets))
 
 class SupportModal(Modal):
     """Modal for users to fill support form."""
@@ -58,11 +82,14 @@ class SupportModal(Modal):
         self.add_item(self.description)
     
     async def on_submit(self, interaction: discord.Interaction) -> None:
-        """Handle submission from modal."""
+        """
+        Handle submission from modal.
+        
+        The user is acknowledged as soon as the ticket has a number and is queued;
+        saving and thread creation run in the ticket worker pool, which edits the
+        acknowledgement once the thread is ready.
+        """
         try:
-            # Defer interaction immediately to prevent timeout (critical for slow operations)
-            await interaction.response.defer(ephemeral=True)
-            
             # Get data from input
             name = self.name_input.value.strip()
             order_id = self.order_id_input.value.strip()
@@ -70,60 +97,53 @@ class SupportModal(Modal):
             description = self.description.value.strip()
             discord_tag = f"{interaction.user.name}#{interaction.user.discriminator}"
             
-            # Save to database (async for better performance)
-            db = get_db_manager()
-            success, ticket_number = await db.save_lead_async(
-                discord_tag=discord_tag,
-                name=name,
-                order_id=order_id,
-                issue_type=issue_type,
-                status="PENDING"
-            )
-            
-            if success:
-                # Confirm to user
-                confirm_embed = discord.Embed(
-                    title="✅ Ticket Created Successfully",
-                    description="Our support team will contact you soon.",
-                    color=discord.Color.green()
-                )
-                confirm_embed.add_field(name="🎫 Ticket Number", value=f"#{ticket_number}", inline=False)
-                confirm_embed.add_field(name="Order ID", value=order_id, inline=False)
-                confirm_embed.add_field(name="Issue", value=issue_type, inline=False)
-                confirm_embed.add_field(
-                    name="Status",
-                    value="⏳ Waiting for Support Team",
-                    inline=False
-                )
-                
-                # Notify staff and create thread
-                thread = await notify_staff(
-                    user=interaction.user,
-                    name=name,
-                    order_id=order_id,
-                    issue_type=issue_type,
-                    description=description,
-                    discord_tag=discord_tag,
-                    ticket_number=ticket_number
-                )
-                
-                # Redirect user to their ticket thread
-                if thread:
-                    confirm_embed.add_field(
-                        name="🔗 Ticket Thread",
-                        value=f"[Click here to open your ticket]({thread.jump_url})",
-                        inline=False
-                    )
-                
-                await interaction.followup.send(embed=confirm_embed, ephemeral=True)
-                event_logger.info(f"New ticket created by {discord_tag}: #{ticket_number}")
-            else:
+            if not (name and order_id and issue_type and description):
                 error_embed = discord.Embed(
-                    title="❌ An Error Occurred",
-                    description="Failed to save data. Please try again.",
+                    title="❌ Incomplete Form",
+                    description="Please fill in every field and try again.",
                     color=discord.Color.red()
                 )
-                await interaction.followup.send(embed=error_embed, ephemeral=True)
+                await interaction.response.send_message(embed=error_embed, ephemeral=True)
+                return
+            
+            if ticket_workers.full():
+                await interaction.response.send_message(embed=build_busy_embed(), ephemeral=True)
+                event_logger.warning(f"Ticket queue full, submission from {discord_tag} refused")
+                return
+            
+            db = get_db_manager()
+            if not db.ticket_allocator.is_seeded():
+                # First ticket ever: seeding the allocator may read the Leads tab
+                await interaction.response.defer(ephemeral=True)
+            ticket_number = await db.get_next_ticket_number_async()
+            
+            payload = {
+                'interaction': interaction,
+                'user': interaction.user,
+                'name': name,
+                'order_id': order_id,
+                'issue_type': issue_type,
+                'description': description,
+                'discord_tag': discord_tag,
+                'ack_message': None,
+            }
+            job = TicketJob(ticket_number, payload)
+            
+            # Acknowledge before queueing so the worker always has a message to edit
+            ack_embed = build_ticket_embed(job, thread=None, pending=True)
+            if interaction.response.is_done():
+                payload['ack_message'] = await interaction.followup.send(embed=ack_embed, ephemeral=True, wait=True)
+            else:
+                await interaction.response.send_message(embed=ack_embed, ephemeral=True)
+            
+            try:
+                ticket_workers.submit(job)
+            except asyncio.QueueFull:
+                await edit_acknowledgement(job, build_busy_embed())
+                event_logger.warning(f"Ticket queue full, ticket #{ticket_number} from {discord_tag} refused")
+                return
+            
+            event_logger.info(f"Ticket #{ticket_number} queued for {discord_tag}")
                 
         except Exception as e:
             event_logger.error(f"Error submitting modal: {str(e)}")
@@ -133,11 +153,146 @@ class SupportModal(Modal):
                 color=discord.Color.red()
             )
             try:
-                await interaction.followup.send(embed=error_embed, ephemeral=True)
+                if interaction.response.is_done():
+                    await interaction.followup.send(embed=error_embed, ephemeral=True)
+                else:
+                    await interaction.response.send_message(embed=error_embed, ephemeral=True)
             except:
                 pass
 
 
+def build_ticket_embed(job: TicketJob, thread=None, pending: bool = False) -> discord.Embed:
+    """
+    Build the user's ephemeral ticket message.
+    
+    Args:
+        job: Ticket job
+        thread: Ticket thread to link, if it exists
+        pending: True while the ticket is still being processed
+        
+    Returns:
+        Ticket embed
+    """
+    payload = job.payload
+    if pending:
+        embed = discord.Embed(
+            title="📨 Ticket Received",
+            description="We are creating your ticket thread, this message will update in a moment.",
+            color=discord.Color.blurple()
+        )
+    else:
+        embed = discord.Embed(
+            title="✅ Ticket Created Successfully",
+            description="Our support team will contact you soon.",
+            color=discord.Color.green()
+        )
+    embed.add_field(name="🎫 Ticket Number", value=f"#{job.ticket_number}", inline=False)
+    embed.add_field(name="Order ID", value=payload['order_id'], inline=False)
+    embed.add_field(name="Issue", value=payload['issue_type'], inline=False)
+    embed.add_field(
+        name="Status",
+        value="⏳ Creating ticket..." if pending else "⏳ Waiting for Support Team",
+        inline=False
+    )
+    
+    # Redirect user to their ticket thread
+    if thread:
+        embed.add_field(
+            name="🔗 Ticket Thread",
+            value=f"[Click here to open your ticket]({thread.jump_url})",
+            inline=False
+        )
+    return embed
+
+
+def build_busy_embed() -> discord.Embed:
+    """Embed shown when the ticket queue is full."""
+    return discord.Embed(
+        title="⏳ Support Is Busy",
+        description="We are receiving a lot of tickets right now. Please try again in a minute.",
+        color=discord.Color.orange()
+    )
+
+
+async def edit_acknowledgement(job: TicketJob, embed: discord.Embed) -> None:
+    """Replace the user's ephemeral acknowledgement with a new embed."""
+    message = job.payload['ack_message']
+    if message is not None:
+        await message.edit(embed=embed)
+    else:
+        await job.payload['interaction'].edit_original_response(embed=embed)
+
+
+async def process_ticket(job: TicketJob) -> None:
+    """
+    Save a queued ticket and create its thread (run by the ticket worker pool).
+    
+    Steps that already succeeded are skipped when the job is retried.
+    
+    Args:
+        job: Ticket job
+        
+    Raises:
+        RuntimeError: If the lead could not be saved or the thread could not be created
+    """
+    payload = job.payload
+    
+    if not job.saved:
+        db = get_db_manager()
+        success, _ = await db.save_lead_async(
+            discord_tag=payload['discord_tag'],
+            name=payload['name'],
+            order_id=payload['order_id'],
+            issue_type=payload['issue_type'],
+            status="PENDING",
+            ticket_number=job.ticket_number
+        )
+        if not success:
+            raise RuntimeError("lead could not be saved")
+        job.saved = True
+    
+    if job.thread is None or not job.steps_done.issuperset(TICKET_STEPS):
+        async def send_confirmation(thread) -> None:
+            await edit_acknowledgement(job, build_ticket_embed(job, thread=thread))
+        
+        # Notify staff and create thread (a retry reuses the thread and only redoes failed steps);
+        # the user is confirmed as soon as the thread exists
+        job.thread = await notify_staff(
+            user=payload['user'],
+            name=payload['name'],
+            order_id=payload['order_id'],
+            issue_type=payload['issue_type'],
+            description=payload['description'],
+            discord_tag=payload['discord_tag'],
+            ticket_number=job.ticket_number,
+            on_thread_ready=send_confirmation,
+            thread=job.thread,
+            completed=job.steps_done
+        )
+        if job.thread is None:
+            raise RuntimeError("ticket thread could not be created")
+        failed_steps = [step for step in TICKET_STEPS if step not in job.steps_done]
+        if failed_steps:
+            raise RuntimeError(f"ticket steps failed: {', '.join(failed_steps)}")
+    
+    event_logger.info(f"New ticket created by {payload['discord_tag']}: #{job.ticket_number}")
+
+
+async def report_failed_ticket(job: TicketJob, error: Exception) -> None:
+    """Tell the user what happened to a ticket that ran out of retries."""
+    if job.saved:
+        # Saved (with or without a complete thread): staff still see it in the Leads tab
+        await edit_acknowledgement(job, build_ticket_embed(job, thread=job.thread))
+        return
+    
+    error_embed = discord.Embed(
+        title="❌ An Error Occurred",
+        description="Failed to save data. Please try again.",
+        color=discord.Color.red()
+    )
+    await edit_acknowledgement(job, error_embed)
+
+
 async def notify_staff(
     user: discord.User,
     name: str,
@@ -145,9 +300,26 @@ async def notify_staff(
     issue_type: str,
     description: str,
     discord_tag: str,
-    ticket_number: int
+    ticket_number: int,
+    on_thread_ready=None,
+    thread=None,
+    completed: set = None
 ):
-    """Create private thread in support channel and send notification to staff. Return thread object."""
+    """
+    Create private thread in support channel and send notification to staff. Return thread object.
+    
+    Only the thread creation is sequential; once the thread exists, adding the user,
+    the thread messages, the staff notification and on_thread_ready run concurrently.
+    
+    Args:
+        on_thread_ready: Optional coroutine function called with the thread as soon as it
+            exists (used to send the user's confirmation without waiting for the fan-out)
+        thread: Thread created by an earlier attempt (reused instead of creating another)
+        completed: Set of TICKET_STEPS names already done; each step that succeeds is added
+            and steps already in it are skipped
+    """
+    if completed is None:
+        completed = set()
     try:
         from handlers.commands import bot
         import main
@@ -167,22 +339,29 @@ async def notify_staff(
             event_logger.warning("Staff notification channel not found")
             return
         
-        # Create private thread in support channel (only visible to user, staff, and bot)
-        thread_name = f"#{ticket_number} 🎫 {order_id} - {name[:15]}"
-        thread = await support_channel.create_thread(
-            name=thread_name,
-            type=discord.ChannelType.private_thread,
-            reason=f"Support ticket #{ticket_number} for {name}"
-        )
+        timings = {}
+        started = time.perf_counter()
+        
+        if thread is None:
+            # Create private thread in support channel (only visible to user, staff, and bot)
+            thread_name = f"#{ticket_number} 🎫 {order_id} - {name[:15]}"
+            thread = await support_channel.create_thread(
+                name=thread_name,
+                type=discord.ChannelType.private_thread,
+                reason=f"Support ticket #{ticket_number} for {name}"
+            )
+            timings['create_thread'] = time.perf_counter() - started
         
-        # Add user to thread
-        await thread.add_user(user)
+        # Persist the ticket before its buttons are posted so they survive a restart
+        # (a failed write is left out of completed, so the job is retried with this thread)
+        if 'record_thread' not in completed:
+            await asyncio.to_thread(get_db_manager().record_ticket_thread, ticket_number, user.id, order_id, thread.id)
+            completed.add('record_thread')
         
         # Format timestamp
         tz = pytz.timezone('Asia/Jakarta')
         now = datetime.now(tz).strftime('%d/%m/%Y %H:%M:%S')
         
-        # Prepare embeds (can be done in parallel)
         user_embed = discord.Embed(
             title="📋 Your Support Ticket Details",
             description="Your ticket has been created and our support team will assist you soon.",
@@ -217,71 +396,121 @@ async def notify_staff(
         view = UnifiedTicketView(user_id=user.id, order_id=order_id, thread_id=thread.id, ticket_number=ticket_number)
         admin_view = StaffTicketView(user_id=user.id, order_id=order_id, thread_id=thread.id, ticket_number=ticket_number)
         
-        # Send messages to thread (with error handling)
-        try:
-            # Send user embed
-            await thread.send(embed=user_embed)
-            # Send close button view
+        async def send_thread_messages():
+            # Sequential on purpose: the details must appear above the close button
+            if 'thread_details' not in completed:
+                await thread.send(embed=user_embed)
+                completed.add('thread_details')
             await thread.send("You can close this ticket when resolved:", view=view)
-        except Exception as thread_error:
-            event_logger.error(f"Error sending messages to thread: {str(thread_error)}")
         
-        # Get settings from cache (NO DISK READ!)
-        try:
-            bot_settings = main.get_bot_settings()
-            notify_admins = bot_settings.get('notify_admins_on_ticket', True)
-        except:
-            # Fallback to file read if cache not available
-            import json
-            import os
-            notify_admins = True
-            if os.path.exists('bot_settings.json'):
-                try:
-                    with open('bot_settings.json', 'r') as f:
-                        settings = json.load(f)
-                        notify_admins = settings.get('notify_admins_on_ticket', True)
-                except:
-                    pass
-        
-        # Send notification to staff channel
-        if notify_admins:
-            # Get admin roles from cache (NO DISK READ!)
-            try:
-                admin_role_names = main.get_admin_roles()
-            except:
-                # Fallback to file read if cache not available
-                import json
-                import os
-                admin_role_names = []
-                if os.path.exists('admin_roles.json'):
-                    try:
-                        with open('admin_roles.json', 'r') as f:
-                            data = json.load(f)
-                            admin_role_names = data.get('admin_roles', [])
-                    except:
-                        pass
-            
-            admin_mentions = ""
-            
-            if admin_role_names and staff_channel.guild:
-                for role in staff_channel.guild.roles:
-                    if role.name in admin_role_names:
-                        admin_mentions += f"{role.mention} "
-            
-            if admin_mentions:
-                await staff_channel.send(content=f"🔔 {admin_mentions}", embed=staff_embed, view=admin_view)
+        async def send_staff_notification():
+            content = None
+            if get_notify_admins_setting():
+                admin_mentions = get_admin_mentions(staff_channel, main)
+                if admin_mentions:
+                    content = f"🔔 {admin_mentions}"
+            if content:
+                await staff_channel.send(content=content, embed=staff_embed, view=admin_view)
             else:
                 await staff_channel.send(embed=staff_embed, view=admin_view)
-        else:
-            await staff_channel.send(embed=staff_embed, view=admin_view)
+        
+        async def timed(step: str, coro_fn):
+            # Record the outcome so the caller can retry just the failed steps
+            step_started = time.perf_counter()
+            try:
+                await coro_fn()
+                completed.add(step)
+            except Exception as step_error:
+                event_logger.error(f"Error in ticket #{ticket_number} step {step}: {str(step_error)}")
+            finally:
+                timings[step] = time.perf_counter() - step_started
+        
+        # Fan out everything that only depends on the thread (skipping steps an earlier attempt finished)
+        step_functions = {
+            'add_user': lambda: thread.add_user(user),
+            'thread_messages': send_thread_messages,
+            'staff_notification': send_staff_notification,
+        }
+        if on_thread_ready is not None:
+            step_functions['user_confirmation'] = lambda: on_thread_ready(thread)
+        await asyncio.gather(*(
+            timed(step, coro_fn) for step, coro_fn in step_functions.items() if step not in completed
+        ))
+        timings['total'] = time.perf_counter() - started
         
         event_logger.info(f"New ticket created: #{ticket_number} - Order: {order_id} - Private thread: {thread.id}")
+        event_logger.info(
+            f"Ticket #{ticket_number} fan-out timings: "
+            + ", ".join(f"{step} {elapsed * 1000:.0f}ms" for step, elapsed in timings.items())
+        )
         
         return thread
         
     except Exception as e:
         event_logger.error(f"Error notifying staff: {str(e)}")
-        return None
+        # Hand back a thread that was already created so a retry does not open a second one
+        return thread
+
+
+# Saves tickets and creates their threads after the user has been acknowledged
+ticket_workers = TicketWorkerPool(
+    process_ticket,
+    on_failure=report_failed_ticket,
+    workers=TICKET_WORKERS,
+    max_queue=TICKET_QUEUE_SIZE,
+    max_attempts=TICKET_MAX_ATTEMPTS,
+    retry_delay=TICKET_RETRY_DELAY
+)
+
+def get_notify_admins_setting() -> bool:
+    """Whether staff notifications should mention the admin roles."""
+    import main
+    
+    # Get settings from cache (NO DISK READ!)
+    try:
+        bot_settings = main.get_bot_settings()
+        return bot_settings.get('notify_admins_on_ticket', True)
+    except:
+        # Fallback to file read if cache not available
+        import json
+        import os
+        notify_admins = True
+        if os.path.exists('bot_settings.json'):
+            try:
+                with open('bot_settings.json', 'r') as f:
+                    settings = json.load(f)
+                    notify_admins = settings.get('notify_admins_on_ticket', True)
+            except:
+                pass
+        return notify_admins
+
+
+def get_admin_mentions(staff_channel, main) -> str:
+    """Build the admin role mentions for a staff notification."""
+    # Get admin roles from cache (NO DISK READ!)
+    try:
+        admin_role_names = main.get_admin_roles()
+    except:
+        # Fallback to file read if cache not available
+        import json
+        import os
+        admin_role_names = []
+        if os.path.exists('admin_roles.json'):
+            try:
+                with open('admin_roles.json', 'r') as f:
+                    data = json.load(f)
+                    admin_role_names = data.get('admin_roles', [])
+            except:
+                pass
+    
+    admin_mentions = ""
+    
+    if admin_role_names and staff_channel.guild:
+        for role in staff_channel.guild.roles:
+            if role.name in admin_role_names:
+                admin_mentions += f"{role.mention} "
+    
+    return admin_mentions
 
 
 class UnifiedTicketView(View):
@@ -293,66 +522,65 @@ class UnifiedTicketView(View):
         self.order_id = order_id
         self.thread_id = thread_id
         self.ticket_number = ticket_number
+        self.close_ticket.custom_id = CLOSE_TICKET_CUSTOM_ID.format(ticket_number)
     
     @discord.ui.button(
         label="❌ Close Ticket",
-        style=discord.ButtonStyle.danger,
-        custom_id="unified_close_ticket"
+        style=discord.ButtonStyle.danger
     )
     async def close_ticket(self, interaction: discord.Interaction, button: Button) -> None:
         """Close ticket - User or Admin with different access."""
         try:
-            # Check status from database (OPTIMIZED: direct find instead of pulling 1000 records)
+            # Status comes from the in-memory ticket state machine (no Sheets read)
             db = get_db_manager()
-            lead = await db.find_lead_by_order_id_async(self.order_id)
-            ticket_status = lead.get('status') if lead else None
+            await db.get_ticket_state(self.ticket_number, self.user_id, self.order_id, self.thread_id)
             
             # Determine if user or admin clicked
             is_user = interaction.user.id == self.user_id
             
-            # USER: Can only close if status is still PENDING
-            if is_user:
-                if ticket_status == 'IN_PROGRESS':
-                    await interaction.response.send_message(
-                        "❌ Ticket is being handled by staff. Wait for staff to close the ticket.",
-                        ephemeral=True
-                    )
-                    return
-                
-                await interaction.response.defer()
-                
-                # Update status to "Closed" (closed by user)
-                await db.update_lead_status_async(self.order_id, "Closed")
-                
-                close_embed = discord.Embed(
-                    title="✅ Ticket Closed",
-                    description=f"Ticket #{self.ticket_number} has been closed by user.",
-                    color=discord.Color.green()
+            # USER: Can only close if status is still PENDING ("Closed" = closed by user)
+            # ADMIN: Can close anytime ("Resolved" = resolved by admin)
+            new_status = CLOSED if is_user else RESOLVED
+            try:
+                db.transition_ticket(
+                    self.ticket_number, new_status,
+                    expected=PENDING if is_user else None, actor=interaction.user.id
                 )
-                event_logger.info(f"Ticket #{self.ticket_number} closed by user {interaction.user}")
+            except InvalidTicketTransition as rejected:
+                if is_user and rejected.current == IN_PROGRESS:
+                    message = "❌ Ticket is being handled by staff. Wait for staff to close the ticket."
+                else:
+                    message = f"❌ This ticket is already closed (Status: {rejected.current})."
+                await interaction.response.send_message(message, ephemeral=True)
+                return
             
-            # ADMIN: Can close anytime
-            else:
-                await interaction.response.defer()
+            await interaction.response.defer()
+            
+            # One action at a time per ticket (a take may still be joining the thread)
+            async with db.ticket_locks.hold(self.ticket_number):
+                if is_user:
+                    close_embed = discord.Embed(
+                        title="✅ Ticket Closed",
+                        description=f"Ticket #{self.ticket_number} has been closed by user.",
+                        color=discord.Color.green()
+                    )
+                    event_logger.info(f"Ticket #{self.ticket_number} closed by user {interaction.user}")
+                else:
+                    close_embed = discord.Embed(
+                        title="🔒 Ticket Resolved",
+                        description=f"Ticket #{self.ticket_number} has been resolved by {interaction.user.mention}.",
+                        color=discord.Color.green()
+                    )
+                    event_logger.info(f"Ticket #{self.ticket_number} resolved by admin {interaction.user}")
                 
-                # Update status to "Resolved" (resolved by admin)
-                await db.update_lead_status_async(self.order_id, "Resolved")
+                button.disabled = True
+                await interaction.message.edit(view=self)
                 
-                close_embed = discord.Embed(
-                    title="🔒 Ticket Resolved",
-                    description=f"Ticket #{self.ticket_number} has been resolved by {interaction.user.mention}.",
-                    color=discord.Color.green()
-                )
-                event_logger.info(f"Ticket #{self.ticket_number} resolved by admin {interaction.user}")
-            
-            button.disabled = True
-            await interaction.message.edit(view=self)
-            
-            # Archive and lock thread
-            thread = interaction.client.get_channel(self.thread_id)
-            if thread:
-                await thread.send(embed=close_embed)
-                await thread.edit(archived=True, locked=True)
+                # Archive and lock thread
+                thread = interaction.client.get_channel(self.thread_id)
+                if thread:
+                    await thread.send(embed=close_embed)
+                    await thread.edit(archived=True, locked=True)
             
         except Exception as e:
             event_logger.error(f"Error closing ticket: {str(e)}")
@@ -361,8 +589,13 @@ class UnifiedTicketView(View):
                 description="Failed to close ticket. Please try again.",
                 color=discord.Color.red()
             )
-            await interaction.response.defer()
-            await interaction.followup.send(embed=error_embed, ephemeral=True)
+            try:
+                if interaction.response.is_done():
+                    await interaction.followup.send(embed=error_embed, ephemeral=True)
+                else:
+                    await interaction.response.send_message(embed=error_embed, ephemeral=True)
+            except:
+                pass
 
 
 class StaffTicketView(View):
@@ -375,26 +608,33 @@ class StaffTicketView(View):
         self.thread_id = thread_id
         self.ticket_number = ticket_number
         self.staff_member = None  # Track staff who took ticket
+        self.take_ticket.custom_id = TAKE_TICKET_CUSTOM_ID.format(ticket_number)
     
     @discord.ui.button(
         label="✋ Take Ticket",
-        style=discord.ButtonStyle.primary,
-        custom_id="staff_take_ticket"
+        style=discord.ButtonStyle.primary
     )
     async def take_ticket(self, interaction: discord.Interaction, button: Button) -> None:
         """Staff takes the ticket."""
         try:
-            # Check ticket status first (OPTIMIZED: direct find instead of pulling 1000 records)
+            # Status comes from the in-memory ticket state machine (no Sheets read)
             db = get_db_manager()
+            ticket = await db.get_ticket_state(self.ticket_number, self.user_id, self.order_id, self.thread_id)
             
-            # Find specific lead by order_id
-            lead = await db.find_lead_by_order_id_async(self.order_id)
-            ticket_status = lead.get('status') if lead else None
-            
-            # If status is not PENDING, ticket is already handled/closed
-            if ticket_status and ticket_status != 'PENDING':
+            # Compare-and-set PENDING -> IN_PROGRESS before any await: the first click wins
+            try:
+                db.transition_ticket(self.ticket_number, IN_PROGRESS, expected=PENDING, actor=interaction.user.id)
+            except InvalidTicketTransition as rejected:
+                if rejected.current == IN_PROGRESS:
+                    # Lost the race - the winner updates the buttons
+                    taken_by = f" by <@{ticket.taken_by}>" if ticket.taken_by else ""
+                    await interaction.response.send_message(
+                        f"❌ Ticket #{self.ticket_number} has already been taken{taken_by}.",
+                        ephemeral=True
+                    )
+                    return
                 await interaction.response.send_message(
-                    f"❌ This ticket cannot be taken anymore (Status: {ticket_status}).",
+                    f"❌ This ticket cannot be taken anymore (Status: {rejected.current}).",
                     ephemeral=True
                 )
                 button.disabled = True
@@ -404,47 +644,43 @@ class StaffTicketView(View):
             await interaction.response.defer()
             
             staff_member = interaction.user
-            user = await interaction.client.fetch_user(self.user_id)
-            
-            # Update status in database
-            db = get_db_manager()
-            await db.update_lead_status_async(self.order_id, "IN_PROGRESS")
             
-            # Update tracking
-            self.staff_member = staff_member.id
-            
-            # Add staff to thread
-            thread = interaction.client.get_channel(self.thread_id)
-            if thread:
-                await thread.add_user(staff_member)
+            async with db.ticket_locks.hold(self.ticket_number):
+                # Update tracking
+                self.staff_member = staff_member.id
+                
+                # Add staff to thread
+                thread = interaction.client.get_channel(self.thread_id)
+                if thread:
+                    await thread.add_user(staff_member)
+                    
+                    # Send intro message
+                    intro_embed = discord.Embed(
+                        title="👤 Staff Taking Ticket",
+                        description=f"Staff {staff_member.mention} has taken your ticket.",
+                        color=discord.Color.green()
+                    )
+                    intro_embed.add_field(name="📝 Note", 
+                        value="Staff will help you resolve this issue.",
+                        inline=False)
+                    
+                    await thread.send(embed=intro_embed)
                 
-                # Send intro message
-                intro_embed = discord.Embed(
-                    title="👤 Staff Taking Ticket",
-                    description=f"Staff {staff_member.mention} has taken your ticket.",
+                # Update notification
+                confirmation_embed = discord.Embed(
+                    title="✅ Ticket Taken",
+                    description=f"Staff {staff_member.mention} has taken this ticket.",
                     color=discord.Color.green()
                 )
-                intro_embed.add_field(name="📝 Note", 
-                    value="Staff will help you resolve this issue.",
-                    inline=False)
                 
-                await thread.send(embed=intro_embed)
-            
-            # Update notification
-            confirmation_embed = discord.Embed(
-                title="✅ Ticket Taken",
-                description=f"Staff {staff_member.mention} has taken this ticket.",
-                color=discord.Color.green()
-            )
-            
-            # Disable all buttons
-            for item in self.children:
-                item.disabled = True
-            
-            await interaction.message.edit(view=self)
-            await interaction.followup.send(embed=confirmation_embed)
-            
-            event_logger.info(f"Ticket {self.order_id} taken by {staff_member}")
+                # Disable all buttons
+                for item in self.children:
+                    item.disabled = True
+                
+                await interaction.message.edit(view=self)
+                await interaction.followup.send(embed=confirmation_embed)
+                
+                event_logger.info(f"Ticket {self.order_id} taken by {staff_member}")
             
         except Exception as e:
             event_logger.error(f"Error staff taking ticket: {str(e)}")
@@ -453,7 +689,45 @@ class StaffTicketView(View):
                 description="Failed to take ticket. Please try again.",
                 color=discord.Color.red()
             )
-            await interaction.followup.send(embed=error_embed, ephemeral=True)
+            try:
+                if interaction.response.is_done():
+                    await interaction.followup.send(embed=error_embed, ephemeral=True)
+                else:
+                    await interaction.response.send_message(embed=error_embed, ephemeral=True)
+            except:
+                pass
+
+
+async def restore_ticket_views(bot: commands.Bot, tickets: list) -> None:
+    """
+    Re-register the persistent views of open tickets with the bot.
+    
+    Views are built in chunks with a yield between them, so thousands of open
+    tickets never hold the event loop while the bot connects.
+    
+    Args:
+        bot: Bot instance
+        tickets: Open TicketRecord list (newest first, so recent tickets work first)
+    """
+    started = time.perf_counter()
+    try:
+        for offset in range(0, len(tickets), VIEW_RESTORE_CHUNK):
+            for ticket in tickets[offset:offset + VIEW_RESTORE_CHUNK]:
+                bot.add_view(UnifiedTicketView(
+                    user_id=ticket.user_id, order_id=ticket.order_id,
+                    thread_id=ticket.thread_id, ticket_number=ticket.ticket_number
+                ))
+                bot.add_view(StaffTicketView(
+                    user_id=ticket.user_id, order_id=ticket.order_id,
+                    thread_id=ticket.thread_id, ticket_number=ticket.ticket_number
+                ))
+            await asyncio.sleep(0)
+        
+        event_logger.info(
+            f"Restored views for {len(tickets)} open ticket(s) in {(time.perf_counter() - started) * 1000:.0f} ms"
+        )
+    except Exception as e:
+        event_logger.error(f"Error restoring ticket views: {str(e)}")
 
 
 async def setup(bot: commands.Bot) -> None:
@@ -13,6 +13,7 @@ import os
 import json
 from config import DISCORD_TOKEN, PREFIX, DEBUG_MODE, DISCORD_GUILD_ID
 from utils.logger import bot_logger
+from utils.blocking_guard import enable_loop_debug
 from handlers.database import init_db_manager
 
 # Global cache for JSON files (to avoid repeated disk reads)
@@ -109,6 +110,8 @@ async def load_cogs():
 async def main():
     """Main function to run the bot."""
     try:
+        enable_loop_debug(asyncio.get_running_loop())
+        
         bot_logger.info("=" * 50)
         bot_logger.info("🤖 Initializing Discord Customer Support Bot")
         bot_logger.info("=" * 50)
@@ -117,11 +120,12 @@ async def main():
         bot_logger.info("📋 Loading JSON cache...")
         load_json_cache()
         
-        # Initialize database
-        bot_logger.info("📊 Connecting to Google Sheets...")
+        # Initialize database (local state only - Sheets connects in the background)
+        bot_logger.info("📊 Preparing database...")
         try:
             db_manager = init_db_manager()
-            bot_logger.info("✅ Database connected successfully")
+            db_manager.start_initialization()
+            bot_logger.info("✅ Database ready, connecting to Google Sheets in the background")
         except Exception as e:
             bot_logger.error(f"❌ Failed to connect database: {str(e)}")
             bot_logger.error("Please check your credentials.json file")
@@ -0,0 +1,57 @@
+"""
+Shared test setup.
+Every test runs offline: Google Sheets is the in-process fake backend and
+local state lives in a per-test SQLite file.
+"""
+import os
+import sys
+import tempfile
+
+# Configure before config.py is imported anywhere
+_session_dir = tempfile.mkdtemp(prefix='cs_bot_tests_')
+os.environ.update({
+    'SHEETS_BACKEND': 'fake',
+    'STORAGE_BACKEND': 'sqlite',
+    'GOOGLE_SHEETS_ID': 'test-sheet',
+    'LOCAL_DB_FILE': os.path.join(_session_dir, 'session.db'),
+    'FAQ_SNAPSHOT_FILE': os.path.join(_session_dir, 'faq_snapshot.json'),
+    'FAKE_SHEETS_LATENCY': '0',
+    'FAKE_SHEETS_ERROR_RATE': '0',
+    'SHEETS_READ_QUOTA_PER_MINUTE': '6000',
+    'SHEETS_WRITE_QUOTA_PER_MINUTE': '6000',
+    'LOG_LEVEL': 'WARNING',
+})
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+@pytest.fixture
+def fake_sheets():
+    """The shared fake Sheets backend, emptied down to its header rows."""
+    from utils.fake_sheets import get_fake_backend
+
+    backend = get_fake_backend()
+    backend.reset()
+    backend.latency = 0
+    backend.error_rate = 0
+    backend.quotas = {key: 0 for key in backend.quotas}
+    yield backend
+    backend.reset()
+
+
+@pytest.fixture
+def make_db(tmp_path, monkeypatch, fake_sheets):
+    """Factory for GoogleSheetsManager instances on a fresh local database."""
+    import handlers.database as database
+    import utils.storage as storage
+
+    db_file = str(tmp_path / 'bot.db')
+    monkeypatch.setattr(database, 'LOCAL_DB_FILE', db_file)
+    monkeypatch.setattr(database, 'FAQ_SNAPSHOT_FILE', str(tmp_path / 'faq_snapshot.json'))
+    monkeypatch.setattr(storage, 'LOCAL_DB_FILE', db_file)
+
+    def factory():
+        return database.GoogleSheetsManager()
+
+    return factory
@@ -0,0 +1,97 @@
+"""In-process fake Sheets backend: gspread-compatible results, quotas and error injection."""
+import asyncio
+
+import gspread
+import pytest
+
+from config import LEADS_TAB_NAME
+from utils.fake_sheets import FakeSheetsBackend
+from utils.leads_index import LEAD_COLUMNS
+from utils.sheets_scheduler import is_rate_limited
+
+
+def _worksheet(backend, title=LEADS_TAB_NAME):
+    return backend.client().open_by_key('test-sheet').worksheet(title)
+
+
+def test_append_reports_the_updated_range_like_the_api():
+    backend = FakeSheetsBackend(latency=0)
+    worksheet = _worksheet(backend)
+    response = worksheet.append_rows([['a', 1], ['b', 2]])
+
+    assert response['updates']['updatedRange'] == f"{LEADS_TAB_NAME}!A2:B3"
+    assert worksheet.get('A2:B') == [['a', '1'], ['b', '2']]
+    assert worksheet.row_values(1) == list(LEAD_COLUMNS)
+
+
+def test_batch_update_and_find_work_on_a1_ranges():
+    backend = FakeSheetsBackend(latency=0)
+    worksheet = _worksheet(backend)
+    worksheet.append_rows([['2026-01-01', '7', 'user#0', 'Name', 'ORD-7', 'Other', 'PENDING']])
+    worksheet.batch_update([{'range': 'G2', 'values': [['Closed']]}])
+
+    cell = worksheet.find('ORD-7')
+    assert (cell.row, cell.col) == (2, 5)
+    assert worksheet.get_all_records()[0]['status'] == 'Closed'
+    # Numeric strings come back as numbers, as with gspread
+    assert worksheet.get_all_records()[0]['ticket_number'] == 7
+
+
+def test_missing_worksheet_raises_worksheet_not_found():
+    backend = FakeSheetsBackend(latency=0)
+    with pytest.raises(gspread.exceptions.WorksheetNotFound):
+        _worksheet(backend, 'Nope')
+
+
+def test_write_quota_raises_a_429():
+    backend = FakeSheetsBackend(latency=0, write_quota=2)
+    worksheet = _worksheet(backend)
+    worksheet.append_row(['a'])
+    worksheet.append_row(['b'])
+    with pytest.raises(gspread.exceptions.APIError) as error:
+        worksheet.append_row(['c'])
+
+    assert is_rate_limited(error.value)
+    assert backend.stats['rate_limited'] == 1
+    assert len(backend.tabs[LEADS_TAB_NAME]) == 3
+
+
+def test_error_injection_is_reproducible_with_a_seed():
+    def outcomes(seed):
+        backend = FakeSheetsBackend(latency=0, error_rate=0.5, seed=seed)
+        results = []
+        for _ in range(20):
+            try:
+                backend.admit('read')
+                results.append(True)
+            except gspread.exceptions.APIError as error:
+                assert error.response.status_code == 500
+                results.append(False)
+        return results
+
+    first = outcomes(seed=3)
+    assert first == outcomes(seed=3)
+    assert not all(first) and any(first)
+
+
+def test_async_surface_shares_state_with_the_sync_one():
+    backend = FakeSheetsBackend(latency=0)
+
+    async def scenario():
+        client = await backend.async_manager().authorize()
+        spreadsheet = await client.open_by_key('test-sheet')
+        worksheet = await spreadsheet.worksheet(LEADS_TAB_NAME)
+        await worksheet.append_rows([['x'] * len(LEAD_COLUMNS)])
+        return await worksheet.get_all_values()
+
+    values = asyncio.run(scenario())
+    assert values[1] == ['x'] * len(LEAD_COLUMNS)
+    assert _worksheet(backend).get_all_values() == values
+
+
+def test_reset_keeps_only_header_rows():
+    backend = FakeSheetsBackend(latency=0)
+    _worksheet(backend).append_row(['a'])
+    backend.reset()
+    assert backend.tabs[LEADS_TAB_NAME] == [list(LEAD_COLUMNS)]
+    assert backend.stats['writes'] == 0
@@ -0,0 +1,27 @@
+"""FAQ cache: revision-checked and forced refreshes from Sheets."""
+import asyncio
+
+from config import FAQ_TAB_NAME
+
+
+def test_forced_refresh_skips_the_revision_check(make_db, fake_sheets):
+    fake_sheets.tabs[FAQ_TAB_NAME].append(['refund', 'Refunds', 'Refunds take 3 days.'])
+
+    async def scenario():
+        db = make_db()
+        db.start_initialization()
+        await db.wait_until_ready(timeout=5)
+        await db.refresh_faq_cache()
+        loaded = [record['trigger_id'] for record in db.get_faq_data()]
+
+        # Edited in the sheet, but Drive still reports the old revision
+        fake_sheets.tabs[FAQ_TAB_NAME].append(['shipping', 'Shipping', 'We ship nationwide.'])
+        await db.refresh_faq_cache()
+        checked = [record['trigger_id'] for record in db.get_faq_data()]
+        forced = await db.refresh_faq_cache(check_revision=False)
+        return loaded, checked, forced, [record['trigger_id'] for record in db.get_faq_data()]
+
+    loaded, checked, forced, reloaded = asyncio.run(scenario())
+    assert loaded == checked == ['refund']
+    assert forced
+    assert reloaded == ['refund', 'shipping']
@@ -0,0 +1,25 @@
+"""Hash-indexed FAQ lookup."""
+from utils.faq_index import FAQIndex
+
+FAQ = [
+    {'trigger_id': 'Refund_Policy', 'button_label': 'How do I get a refund?', 'response_text': 'Refunds take 3 days.'},
+    {'trigger_id': 'shipping', 'button_label': 'Shipping info', 'response_text': 'We ship nationwide, refund on loss.'},
+    {'trigger_id': 'payment', 'button_label': 'Payment methods', 'response_text': 'Bank transfer or card.'},
+    {'trigger_id': ' refund_policy ', 'button_label': 'Duplicate', 'response_text': 'Shadowed row.'},
+]
+
+
+def test_index_lookup_is_case_and_whitespace_insensitive():
+    index = FAQIndex(FAQ, version=3)
+    assert index.get('refund_policy') is FAQ[0]
+    assert index.get('  REFUND_POLICY ') is FAQ[0]
+    assert index.get('Refund_Policy') is FAQ[0]
+    assert index.get('missing') is None
+    assert index.position_of('payment') == 2
+    assert index.position_of('missing') == -1
+    assert index.version == 3 and len(index) == 4
+
+
+def test_index_keeps_the_first_of_duplicate_triggers():
+    index = FAQIndex(FAQ)
+    assert index.duplicates == (('refund_policy', 0, 3),)
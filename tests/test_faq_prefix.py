@@ -0,0 +1,42 @@
+"""Prefix index for /faq autocomplete, and the /faq command itself."""
+from utils.faq_prefix import FAQPrefixIndex
+
+FAQ = [
+    {'trigger_id': 'Refund_Policy', 'button_label': 'How do I get a refund?', 'response_text': 'Refunds take 3 days.'},
+    {'trigger_id': 'shipping', 'button_label': 'Shipping info', 'response_text': 'We ship nationwide, refund on loss.'},
+    {'trigger_id': 'payment', 'button_label': 'Payment methods', 'response_text': 'Bank transfer or card.'},
+]
+
+
+def test_prefix_index_matches_label_words_and_trigger_ids():
+    prefix_index = FAQPrefixIndex(tuple(FAQ))
+    assert prefix_index.complete('refu') == [0]
+    assert prefix_index.complete('  How   DO ') == [0]
+    assert prefix_index.complete('pay') == [2]
+    assert prefix_index.complete('info') == [1]
+    assert prefix_index.complete('zzz') == []
+    # Nothing typed yet: first FAQ in sheet order
+    assert prefix_index.complete('', limit=2) == [0, 1]
+
+
+def test_prefix_index_respects_the_limit():
+    records = tuple({'trigger_id': f'item_{n}', 'button_label': f'Item {n}', 'response_text': ''} for n in range(40))
+    assert len(FAQPrefixIndex(records).complete('item', limit=25)) == 25
+
+
+def test_faq_slash_command_reports_errors_to_the_user(monkeypatch):
+    import asyncio
+
+    from benchmarks.discord_stubs import CallRecorder, StubInteraction
+    from handlers import commands
+
+    def unavailable():
+        raise RuntimeError('database not ready')
+
+    monkeypatch.setattr(commands, 'bot', None)
+    monkeypatch.setattr(commands, 'get_db_manager', unavailable)
+    interaction = StubInteraction(0, CallRecorder())
+
+    asyncio.run(commands.SupportCommands.faq_slash.callback(commands.SupportCommands(None), interaction, 'refu'))
+
+    assert [embed.title for embed in interaction.followup.messages] == ['❌ Error']
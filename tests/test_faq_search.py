@@ -0,0 +1,37 @@
+"""Ranked free-text FAQ search (BM25 over an inverted index)."""
+from utils.faq_search import FAQSearchEngine, tokenize
+
+FAQ = [
+    {'trigger_id': 'Refund_Policy', 'button_label': 'How do I get a refund?', 'response_text': 'Refunds take 3 days.'},
+    {'trigger_id': 'shipping', 'button_label': 'Shipping info', 'response_text': 'We ship nationwide, refund on loss.'},
+    {'trigger_id': 'payment', 'button_label': 'Payment methods', 'response_text': 'Bank transfer or card.'},
+]
+
+
+def test_tokenize_drops_stopwords_and_punctuation():
+    assert tokenize('How do I get a REFUND?') == ['get', 'refund']
+
+
+def test_search_ranks_label_matches_first():
+    engine = FAQSearchEngine()
+    engine.update(FAQ, version=1)
+    results = engine.search('refund')
+    # Both mention refunds; the one asking about it in the label wins
+    assert [record['trigger_id'] for _, record in results] == ['Refund_Policy', 'shipping']
+    assert results[0][0] > results[1][0]
+    assert engine.search('the and of') == []
+    assert engine.search('bank', limit=1)[0][1] is FAQ[2]
+
+
+def test_search_updates_incrementally_and_ignores_older_versions():
+    engine = FAQSearchEngine()
+    assert engine.update(FAQ, version=1) == (3, 0)
+
+    changed = [FAQ[0], {**FAQ[2], 'response_text': 'Crypto only.'}]
+    assert engine.update(changed, version=2) == (1, 2)
+    assert engine.search('bank') == []
+    assert engine.search('crypto')[0][1]['trigger_id'] == 'payment'
+
+    # A late update from an older cache version must not roll the index back
+    assert engine.update(FAQ, version=1) == (0, 0)
+    assert len(engine) == 2
@@ -0,0 +1,34 @@
+"""On-disk FAQ snapshot."""
+import pytest
+
+from utils.faq_snapshot import FAQSnapshot, load_snapshot, save_snapshot
+
+FAQ = [
+    {'trigger_id': 'Refund_Policy', 'button_label': 'How do I get a refund?', 'response_text': 'Refunds take 3 days.'},
+    {'trigger_id': 'shipping', 'button_label': 'Shipping info', 'response_text': 'We ship nationwide, refund on loss.'},
+    {'trigger_id': 'payment', 'button_label': 'Payment methods', 'response_text': 'Bank transfer or card.'},
+]
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / 'faq_snapshot.json')
+    size = save_snapshot(path, FAQSnapshot(FAQ, content_hash='abc', revision='r1'))
+    assert size == (tmp_path / 'faq_snapshot.json').stat().st_size
+
+    snapshot = load_snapshot(path)
+    assert snapshot.records == FAQ
+    assert (snapshot.content_hash, snapshot.revision) == ('abc', 'r1')
+
+
+def test_snapshot_checksum_detects_corruption(tmp_path):
+    path = tmp_path / 'faq_snapshot.json'
+    save_snapshot(str(path), FAQSnapshot(FAQ))
+    data = path.read_bytes()
+    path.write_bytes(data.replace(b'nationwide', b'NATIONWIDE'))
+
+    with pytest.raises(ValueError, match='checksum'):
+        load_snapshot(str(path))
+
+
+def test_missing_snapshot_loads_as_none(tmp_path):
+    assert load_snapshot(str(tmp_path / 'absent.json')) is None
@@ -0,0 +1,152 @@
+"""Write journal: durability, atomic lead saves and replay without duplicate rows."""
+import asyncio
+
+import pytest
+
+from config import LEADS_TAB_NAME
+from utils.fake_sheets import FakeAsyncWorksheet
+from utils.journal import WriteJournal
+from utils.leads_index import LEAD_COLUMNS
+from utils.storage import SQLiteStorage
+
+
+def _row(ticket_number, order_id='ORD-1'):
+    return ['2026-01-01 10:00:00', ticket_number, 'user#0', 'Name', order_id, 'Other', 'PENDING']
+
+
+def _sheet_ticket_numbers(fake_sheets):
+    return [row[1] for row in fake_sheets.tabs[LEADS_TAB_NAME][1:]]
+
+
+async def _ready(db):
+    db.start_initialization()
+    assert await db.wait_until_ready(timeout=5)
+    return db
+
+
+def test_journal_keeps_pending_rows_across_reopen(tmp_path):
+    path = str(tmp_path / 'journal.db')
+    journal = WriteJournal(path)
+    first = journal.append(LEADS_TAB_NAME, _row(1))
+    journal.append_many('Other', [['a'], ['b']])
+    journal.mark_flushed([first])
+
+    reopened = WriteJournal(path)
+    assert reopened.pending_count(LEADS_TAB_NAME) == 0
+    assert [row for _, _, row in reopened.get_pending()] == [['a'], ['b']]
+
+
+def test_lead_and_journal_entry_roll_back_together(tmp_path, monkeypatch):
+    path = str(tmp_path / 'bot.db')
+    storage = SQLiteStorage(path)
+    journal = WriteJournal(path)
+
+    def broken_insert(conn, tab_name, row_data):
+        raise RuntimeError('disk full')
+
+    monkeypatch.setattr('utils.storage.insert_journal_entry', broken_insert)
+    with pytest.raises(RuntimeError):
+        storage.add_lead_journaled(_row(7), LEADS_TAB_NAME)
+    assert storage.get_lead_by_ticket_number(7) is None
+    assert journal.pending_count() == 0
+
+    monkeypatch.undo()
+    storage.add_lead_journaled(_row(7), LEADS_TAB_NAME)
+    assert storage.get_lead_by_ticket_number(7)['order_id'] == 'ORD-1'
+    assert journal.pending_count(LEADS_TAB_NAME) == 1
+
+
+def test_failed_save_can_be_retried_with_the_same_ticket_number(make_db, monkeypatch):
+    async def scenario():
+        db = await _ready(make_db())
+        calls = []
+
+        def flaky_insert(conn, tab_name, row_data):
+            calls.append(row_data)
+            if len(calls) == 1:
+                raise RuntimeError('journal write failed')
+            return original(conn, tab_name, row_data)
+
+        import utils.storage
+        original = utils.storage.insert_journal_entry
+        monkeypatch.setattr(utils.storage, 'insert_journal_entry', flaky_insert)
+
+        first = await db.save_lead_async('user#0', 'Name', 'ORD-1', 'Other', ticket_number=5)
+        second = await db.save_lead_async('user#0', 'Name', 'ORD-1', 'Other', ticket_number=5)
+        return db, first, second
+
+    db, first, second = asyncio.run(scenario())
+    assert first == (False, 0)
+    assert second == (True, 5)
+    assert db.journal.pending_count(LEADS_TAB_NAME) == 1
+
+
+def test_flush_appends_journaled_leads_in_one_batch(make_db, fake_sheets):
+    async def scenario():
+        db = await _ready(make_db())
+        for index in range(3):
+            await db.save_lead_async(f'user#{index}', 'Name', f'ORD-{index}', 'Other')
+        writes_before = fake_sheets.stats['writes']
+        flushed = await db.flush_journal()
+        return db, flushed, fake_sheets.stats['writes'] - writes_before
+
+    db, flushed, writes = asyncio.run(scenario())
+    assert flushed == 3
+    assert writes == 1
+    assert len(_sheet_ticket_numbers(fake_sheets)) == 3
+    assert db.journal.pending_count() == 0
+    assert db.leads_index.get_by_order_id('ORD-2').row_number == 4
+
+
+def test_replay_after_lost_append_response_does_not_duplicate_rows(make_db, fake_sheets, monkeypatch):
+    original = FakeAsyncWorksheet.append_rows
+
+    async def append_then_drop_response(self, values, **kwargs):
+        await original(self, values, **kwargs)
+        raise ConnectionError('connection reset')
+
+    async def scenario():
+        db = await _ready(make_db())
+        for index in range(2):
+            await db.save_lead_async(f'user#{index}', 'Name', f'ORD-{index}', 'Other')
+
+        monkeypatch.setattr(FakeAsyncWorksheet, 'append_rows', append_then_drop_response)
+        with pytest.raises(ConnectionError):
+            await db.flush_journal()
+        monkeypatch.setattr(FakeAsyncWorksheet, 'append_rows', original)
+
+        # Rows reached the sheet but the journal still has them
+        assert db.journal.pending_count(LEADS_TAB_NAME) == 2
+        await db.save_lead_async('user#2', 'Name', 'ORD-2', 'Other')
+        await db.flush_journal()
+        return db
+
+    db = asyncio.run(scenario())
+    ticket_numbers = _sheet_ticket_numbers(fake_sheets)
+    assert len(ticket_numbers) == len(set(ticket_numbers)) == 3
+    assert db.journal.pending_count() == 0
+    assert db.leads_index.in_sheet(ticket_numbers[-1])
+
+
+def test_restart_replay_skips_rows_already_in_the_sheet(make_db, fake_sheets):
+    async def crash_after_append():
+        db = await _ready(make_db())
+        await db.save_lead_async('user#0', 'Name', 'ORD-0', 'Other')
+        await db.save_lead_async('user#1', 'Name', 'ORD-1', 'Other')
+        # Crash between append_rows and mark_flushed for the first row only
+        _, _, row_data = db.journal.get_pending(LEADS_TAB_NAME)[0]
+        fake_sheets.tabs[LEADS_TAB_NAME].append(list(row_data))
+
+    async def restart():
+        db = await _ready(make_db())
+        assert len(db._journal_unconfirmed) == 2
+        await db.flush_journal()
+        return db
+
+    asyncio.run(crash_after_append())
+    db = asyncio.run(restart())
+    ticket_numbers = _sheet_ticket_numbers(fake_sheets)
+    assert len(ticket_numbers) == len(set(ticket_numbers)) == 2
+    assert db.journal.pending_count() == 0
+    assert not db._journal_unconfirmed
+    assert fake_sheets.tabs[LEADS_TAB_NAME][0] == list(LEAD_COLUMNS)
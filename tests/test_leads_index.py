@@ -0,0 +1,91 @@
+"""Leads index: lookups, journal bookkeeping and tail sync against the sheet."""
+import asyncio
+
+from config import LEADS_TAB_NAME
+from utils.leads_index import LEAD_COLUMNS, LeadsIndex
+
+
+def _row(ticket_number, order_id, discord_tag='user#0', status='PENDING'):
+    return ['2026-01-01 10:00:00', str(ticket_number), discord_tag, 'Name', order_id, 'Other', status]
+
+
+def _loaded_index(*rows):
+    index = LeadsIndex()
+    index.load([list(LEAD_COLUMNS)] + [list(row) for row in rows])
+    return index
+
+
+def test_load_indexes_every_key_and_skips_blank_rows():
+    index = _loaded_index(_row(1, 'ORD-1'), [''] * len(LEAD_COLUMNS), _row(2, ' ORD-2 ', discord_tag='user#1'))
+
+    assert len(index) == 2
+    assert index.known_row_count == 4
+    assert index.get_by_ticket_number(2).row_number == 4
+    # Keys are matched without surrounding whitespace
+    assert index.get_by_order_id('ORD-2').to_dict()['ticket_number'] == '2'
+    assert [record.row_number for record in index.get_by_discord_tag('user#0')] == [2]
+    assert index.max_ticket_number() == 2
+
+
+def test_latest_lead_wins_for_a_repeated_order_id():
+    index = _loaded_index(_row(1, 'ORD-1', status='Closed'), _row(2, 'ORD-1'))
+    assert index.get_by_order_id('ORD-1').to_dict()['ticket_number'] == '2'
+    assert len(index.get_by_discord_tag('user#0')) == 2
+
+
+def test_pending_rows_get_sheet_rows_once_flushed():
+    index = _loaded_index(_row(1, 'ORD-1'))
+    index.add_pending(10, _row(2, 'ORD-2'))
+    index.add_pending(11, _row(3, 'ORD-3'))
+    assert not index.in_sheet(2)
+    assert index.get_by_order_id('ORD-2').row_number is None
+
+    index.mark_flushed([10, 11], start_row=3)
+
+    assert index.in_sheet(2) and index.in_sheet(3)
+    assert index.get_by_order_id('ORD-3').row_number == 4
+    assert index.known_row_count == 4
+    assert [values[1] for values in index.sheet_rows()] == ['1', '2', '3']
+
+
+def test_drop_pending_points_lookups_back_at_the_sheet_row():
+    index = _loaded_index(_row(5, 'ORD-5'))
+    sheet_record = index.get_by_ticket_number(5)
+    # The same ticket was journaled again before the sheet copy was seen
+    index.add_pending(20, _row(5, 'ORD-5'))
+    assert index.get_by_ticket_number(5) is not sheet_record
+
+    index.drop_pending([20])
+
+    assert index.get_by_ticket_number(5) is sheet_record
+    assert index.get_by_order_id('ORD-5') is sheet_record
+    assert index.get_by_discord_tag('user#0') == [sheet_record]
+    assert len(index) == 1
+
+
+def test_sync_reads_only_the_new_tail_of_the_sheet(make_db, fake_sheets):
+    fake_sheets.tabs[LEADS_TAB_NAME].append(_row(1, 'ORD-1'))
+
+    async def scenario():
+        db = make_db()
+        db.start_initialization()
+        await db.wait_until_ready(timeout=5)
+        await db._ensure_leads_index()
+        assert db.leads_index.known_row_count == 2
+
+        # Rows added by someone else directly in the sheet
+        fake_sheets.tabs[LEADS_TAB_NAME].append(_row(2, 'ORD-2'))
+        fake_sheets.tabs[LEADS_TAB_NAME].append(_row(3, 'ORD-3', status='Closed'))
+        reads_before = fake_sheets.stats['reads']
+        added = await db.sync_leads_index()
+        reads = fake_sheets.stats['reads'] - reads_before
+        again = await db.sync_leads_index()
+        return db, added, reads, again
+
+    db, added, reads, again = asyncio.run(scenario())
+    assert added == 2
+    assert reads == 1
+    assert again == 0
+    assert db.leads_index.get_by_order_id('ORD-3').row_number == 4
+    # Synced rows are imported into local storage as well
+    assert db.storage.get_lead_by_ticket_number(3)['status'] == 'Closed'
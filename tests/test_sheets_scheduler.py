@@ -0,0 +1,139 @@
+"""Sheets request scheduler: priority lanes and 429/5xx requeueing."""
+import asyncio
+
+import gspread
+import pytest
+
+from utils.fake_sheets import _api_error
+from utils.sheets_scheduler import (
+    SheetsRequestScheduler, SheetsRetriesExhausted, is_rate_limited, is_server_error,
+    PRIORITY_TICKET_WRITE, PRIORITY_STATUS, PRIORITY_REPORTING, READ, WRITE
+)
+
+
+def test_is_rate_limited_only_matches_429():
+    assert is_rate_limited(_api_error(429, 'Quota exceeded'))
+    assert not is_rate_limited(_api_error(500, 'Internal error'))
+    assert not is_rate_limited(ValueError('nope'))
+
+
+def test_is_server_error_only_matches_5xx():
+    assert is_server_error(_api_error(503, 'Unavailable'))
+    assert not is_server_error(_api_error(429, 'Quota exceeded'))
+    assert not is_server_error(_api_error(400, 'Bad request'))
+    assert not is_server_error(ValueError('nope'))
+
+
+def test_queued_requests_are_granted_by_priority_lane():
+    async def scenario():
+        # 20 tokens/s, starting empty: every request below queues before the first grant
+        scheduler = SheetsRequestScheduler(read_per_minute=1200, write_per_minute=1200)
+        scheduler.buckets[WRITE].pause(0.05)
+        order = []
+
+        async def call(name):
+            order.append(name)
+
+        requests = [
+            ('reporting', PRIORITY_REPORTING), ('status', PRIORITY_STATUS), ('ticket', PRIORITY_TICKET_WRITE),
+            ('reporting', PRIORITY_REPORTING), ('ticket', PRIORITY_TICKET_WRITE),
+        ]
+        await asyncio.gather(*(
+            scheduler.run(call, name, kind=WRITE, priority=priority) for name, priority in requests
+        ))
+        return order, scheduler.get_stats()
+
+    order, stats = asyncio.run(scenario())
+    assert order == ['ticket', 'ticket', 'status', 'reporting', 'reporting']
+    assert stats['lanes']['ticket_write']['requests'] == 2
+    assert stats['lanes']['reporting']['requests'] == 2
+
+
+def test_rate_limited_call_is_requeued_and_succeeds():
+    async def scenario():
+        scheduler = SheetsRequestScheduler(6000, 6000, max_retries=3, backoff_base=0.01)
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise _api_error(429, 'Quota exceeded')
+            return 'ok'
+
+        result = await scheduler.run(call, kind=READ, priority=PRIORITY_STATUS)
+        return result, len(attempts), scheduler.get_stats()
+
+    result, attempts, stats = asyncio.run(scenario())
+    assert result == 'ok'
+    assert attempts == 3
+    assert stats['rate_limited'] == 2
+    assert stats['retries'] == 2
+
+
+def test_exhausted_retries_raise_a_dedicated_error():
+    async def scenario():
+        scheduler = SheetsRequestScheduler(6000, 6000, max_retries=2, backoff_base=0.01)
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            raise _api_error(429, 'Quota exceeded')
+
+        with pytest.raises(SheetsRetriesExhausted) as exhausted:
+            await scheduler.run(call, kind=WRITE)
+        return exhausted.value, len(attempts), scheduler.get_stats()
+
+    error, attempts, stats = asyncio.run(scenario())
+    assert attempts == 3
+    assert (error.kind, error.attempts) == (WRITE, 3)
+    assert is_rate_limited(error.__cause__)
+    assert (stats['retries'], stats['exhausted']) == (2, 1)
+
+
+def test_server_errors_are_requeued_and_charged_a_token():
+    async def scenario():
+        scheduler = SheetsRequestScheduler(6000, 6000, max_retries=3, backoff_base=0.01)
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise _api_error(503, 'Unavailable')
+            return 'ok'
+
+        result = await scheduler.run(call, kind=READ, priority=PRIORITY_STATUS)
+        return result, len(attempts), scheduler.get_stats()
+
+    result, attempts, stats = asyncio.run(scenario())
+    assert result == 'ok'
+    assert attempts == 3
+    # Every attempt went through the bucket, and 5xx does not pause it like a 429
+    assert stats['lanes']['status']['requests'] == 3
+    assert (stats['server_errors'], stats['rate_limited'], stats['retries']) == (2, 0, 2)
+
+
+def test_sync_path_gives_up_with_the_same_error():
+    scheduler = SheetsRequestScheduler(6000, 6000, max_retries=1, backoff_base=0.01)
+
+    def call():
+        raise _api_error(500, 'Internal error')
+
+    with pytest.raises(SheetsRetriesExhausted):
+        scheduler.run_sync(call, kind=READ)
+    assert scheduler.get_stats()['server_errors'] == 1
+
+
+def test_client_errors_are_not_retried():
+    async def scenario():
+        scheduler = SheetsRequestScheduler(6000, 6000, backoff_base=0.01)
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            raise _api_error(400, 'Bad request')
+
+        with pytest.raises(gspread.exceptions.APIError):
+            await scheduler.run(call)
+        return len(attempts), scheduler.get_stats()['retries']
+
+    assert asyncio.run(scenario()) == (1, 0)
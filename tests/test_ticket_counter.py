@@ -0,0 +1,74 @@
+"""Ticket number allocation under concurrency."""
+import asyncio
+import threading
+
+import pytest
+
+from config import LEADS_TAB_NAME
+from utils.sheets_scheduler import SheetsRetriesExhausted
+from utils.ticket_counter import TicketNumberAllocator
+
+
+def test_next_requires_a_seed(tmp_path):
+    allocator = TicketNumberAllocator(str(tmp_path / 'bot.db'))
+    assert not allocator.is_seeded()
+    with pytest.raises(RuntimeError):
+        allocator.next()
+
+
+def test_seed_never_moves_the_sequence_backwards(tmp_path):
+    allocator = TicketNumberAllocator(str(tmp_path / 'bot.db'))
+    assert allocator.seed(10) == 10
+    assert allocator.next() == 11
+    assert allocator.seed(3) == 11
+    assert allocator.next() == 12
+
+
+def test_threads_and_connections_never_share_a_number(tmp_path):
+    path = str(tmp_path / 'bot.db')
+    TicketNumberAllocator(path).seed(0)
+    # Two allocators on one file stand in for two processes
+    allocators = [TicketNumberAllocator(path), TicketNumberAllocator(path)]
+    numbers = []
+    numbers_lock = threading.Lock()
+
+    def allocate(allocator):
+        for _ in range(50):
+            number = allocator.next()
+            with numbers_lock:
+                numbers.append(number)
+
+    threads = [threading.Thread(target=allocate, args=(allocators[i % 2],)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(numbers) == list(range(1, 401))
+
+
+def test_concurrent_submissions_continue_after_the_sheet(make_db, fake_sheets):
+    fake_sheets.tabs[LEADS_TAB_NAME].append(['2026-01-01 10:00:00', '41', 'user#0', 'Name', 'ORD-0', 'Other', 'Closed'])
+
+    async def scenario():
+        db = make_db()
+        db.start_initialization()
+        await db.wait_until_ready(timeout=5)
+        # First callers race on seeding the allocator from the Leads tab
+        return await asyncio.gather(*(db.get_next_ticket_number_async() for _ in range(30)))
+
+    numbers = asyncio.run(scenario())
+    assert sorted(numbers) == list(range(42, 72))
+
+
+def test_sync_allocation_fails_instead_of_guessing(make_db, fake_sheets):
+    fake_sheets.tabs[LEADS_TAB_NAME].append(['2026-01-01 10:00:00', '41', 'user#0', 'Name', 'ORD-0', 'Other', 'Closed'])
+    db = make_db()
+    db.scheduler.max_retries = 0
+    fake_sheets.error_rate = 1.0
+
+    with pytest.raises(SheetsRetriesExhausted):
+        db.get_next_ticket_number()
+
+    fake_sheets.error_rate = 0
+    assert db.get_next_ticket_number() == 42
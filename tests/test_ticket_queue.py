@@ -0,0 +1,160 @@
+"""Ticket worker pool: retries, failure reporting and step-level retry of ticket processing."""
+import asyncio
+
+import pytest
+
+from utils.ticket_queue import TicketJob, TicketWorkerPool
+
+
+def test_failed_job_is_retried_until_it_succeeds():
+    async def scenario():
+        attempts = []
+
+        async def handler(job):
+            attempts.append(job.attempts)
+            if job.attempts < 3:
+                raise RuntimeError('Sheets unavailable')
+
+        pool = TicketWorkerPool(handler, workers=2, max_attempts=3, retry_delay=0.001)
+        pool.submit(TicketJob(1, {}))
+        await pool.join()
+        return attempts, pool.get_stats()
+
+    attempts, stats = asyncio.run(scenario())
+    assert attempts == [1, 2, 3]
+    assert (stats['processed'], stats['failed'], stats['retries']) == (1, 0, 2)
+
+
+def test_exhausted_job_is_reported_once():
+    async def scenario():
+        failures = []
+
+        async def handler(job):
+            raise RuntimeError('still down')
+
+        async def on_failure(job, error):
+            failures.append((job.ticket_number, job.attempts, str(error)))
+
+        pool = TicketWorkerPool(handler, on_failure, workers=1, max_attempts=2, retry_delay=0.001)
+        pool.submit(TicketJob(9, {}))
+        await pool.join()
+        return failures, pool.get_stats()
+
+    failures, stats = asyncio.run(scenario())
+    assert failures == [(9, 2, 'still down')]
+    assert (stats['processed'], stats['failed'], stats['retries']) == (0, 1, 1)
+
+
+def test_full_queue_rejects_new_jobs():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def handler(job):
+            await release.wait()
+
+        pool = TicketWorkerPool(handler, workers=1, max_queue=1)
+        pool.submit(TicketJob(1, {}))
+        await asyncio.sleep(0)  # The worker takes job 1
+        pool.submit(TicketJob(2, {}))
+        assert pool.full()
+        with pytest.raises(asyncio.QueueFull):
+            pool.submit(TicketJob(3, {}))
+        release.set()
+        await pool.join()
+        return pool.get_stats()
+
+    stats = asyncio.run(scenario())
+    assert (stats['submitted'], stats['rejected'], stats['processed']) == (2, 1, 2)
+
+
+def _process_one_ticket(make_db, monkeypatch, bot, recorder, prepare=None):
+    """Run one ticket through a single-worker pool against stub Discord channels."""
+    from benchmarks.discord_stubs import StubInteraction
+    from handlers import commands, modals
+
+    monkeypatch.setattr(commands, 'bot', bot)
+    monkeypatch.setattr(modals, 'get_notify_admins_setting', lambda: False)
+
+    async def scenario():
+        db = make_db()
+        monkeypatch.setattr(modals, 'get_db_manager', lambda: db)
+        db.start_initialization()
+        await db.wait_until_ready(timeout=5)
+        if prepare is not None:
+            prepare(db)
+
+        interaction = StubInteraction(0, recorder)
+        job = TicketJob(await db.get_next_ticket_number_async(), {
+            'interaction': interaction, 'user': interaction.user, 'name': 'Name', 'order_id': 'ORD-1',
+            'issue_type': 'Other', 'description': 'Broken', 'discord_tag': 'user#0', 'ack_message': None,
+        })
+        pool = TicketWorkerPool(modals.process_ticket, modals.report_failed_ticket, workers=1, retry_delay=0.001)
+        pool.submit(job)
+        await pool.join()
+        return db, job, pool.get_stats()
+
+    return asyncio.run(scenario())
+
+
+def test_ticket_retry_reuses_the_thread_and_redoes_only_failed_steps(make_db, monkeypatch):
+    from benchmarks.discord_stubs import CallRecorder, StubBot
+    from config import SUPPORT_CHANNEL_ID, STAFF_NOTIFICATION_CHANNEL_ID
+    from handlers import modals
+
+    recorder = CallRecorder()
+    bot = StubBot([SUPPORT_CHANNEL_ID, STAFF_NOTIFICATION_CHANNEL_ID], recorder)
+
+    staff_channel = bot.channels[STAFF_NOTIFICATION_CHANNEL_ID]
+    original_send = staff_channel.send
+    staff_sends = []
+
+    async def flaky_send(*args, **kwargs):
+        staff_sends.append(kwargs.get('embed'))
+        if len(staff_sends) == 1:
+            raise RuntimeError('Discord 503')
+        return await original_send(*args, **kwargs)
+
+    staff_channel.send = flaky_send
+
+    _, job, stats = _process_one_ticket(make_db, monkeypatch, bot, recorder)
+    calls = {name: len(durations) for name, durations in recorder.timings.items()}
+    assert job.attempts == 2
+    assert (stats['processed'], stats['retries']) == (1, 1)
+    assert job.steps_done.issuperset(modals.TICKET_STEPS)
+    assert len(staff_sends) == 2
+    # Everything that succeeded the first time ran exactly once
+    assert calls['channel.create_thread'] == 1
+    assert calls['thread.add_user'] == 1
+    assert calls['thread.send'] == 2
+    assert calls['interaction.edit_original_response'] == 1
+
+
+def test_failed_ticket_state_write_is_retried_on_the_same_thread(make_db, monkeypatch):
+    import sqlite3
+
+    from benchmarks.discord_stubs import CallRecorder, StubBot
+    from config import SUPPORT_CHANNEL_ID, STAFF_NOTIFICATION_CHANNEL_ID
+    from handlers import modals
+
+    recorder = CallRecorder()
+    bot = StubBot([SUPPORT_CHANNEL_ID, STAFF_NOTIFICATION_CHANNEL_ID], recorder)
+    attempts = []
+
+    def flaky_record(db):
+        original_add = db.ticket_states.add
+
+        def add(*args):
+            attempts.append(args)
+            if len(attempts) == 1:
+                raise sqlite3.OperationalError('database is locked')
+            original_add(*args)
+
+        db.ticket_states.add = add
+
+    db, job, stats = _process_one_ticket(make_db, monkeypatch, bot, recorder, prepare=flaky_record)
+    calls = {name: len(durations) for name, durations in recorder.timings.items()}
+    assert (job.attempts, stats['retries']) == (2, 1)
+    assert job.steps_done.issuperset(modals.TICKET_STEPS)
+    assert attempts[0] == attempts[1]
+    assert calls['channel.create_thread'] == 1
+    assert [record.thread_id for record in db.get_open_tickets()] == [job.thread.id]
@@ -0,0 +1,153 @@
+"""Ticket state: the local state table, the state machine and per-ticket locks."""
+import asyncio
+
+import pytest
+
+from utils.ticket_state import (
+    InvalidTicketTransition, TicketLocks, TicketRecord, TicketStateMachine, TicketStateStore,
+    PENDING, IN_PROGRESS, RESOLVED, CLOSED
+)
+
+
+def _machine(*statuses):
+    return TicketStateMachine([
+        TicketRecord(number, 100 + number, f'ORD-{number}', 1000 + number, status)
+        for number, status in enumerate(statuses, start=1)
+    ])
+
+
+async def _ready_db(make_db):
+    db = make_db()
+    db.start_initialization()
+    await db.wait_until_ready(timeout=5)
+    return db
+
+
+async def _wait_for_status(db, ticket_number, status):
+    """Wait for the background writer to persist a transition."""
+    for _ in range(100):
+        if db.storage.get_lead_by_ticket_number(ticket_number)['status'] == status:
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_state_store_survives_reopen(tmp_path):
+    path = str(tmp_path / 'bot.db')
+    store = TicketStateStore(path)
+    store.add(1, 11, 'ORD-1', 111)
+    store.add(2, 12, 'ORD-2', 112)
+    store.set_statuses({1: CLOSED})
+
+    reopened = TicketStateStore(path)
+    assert reopened.get(1).status == CLOSED
+    assert reopened.get(3) is None
+    assert [record.ticket_number for record in reopened.open_tickets()] == [2]
+
+
+def test_recorded_ticket_is_restored_on_the_next_start(make_db):
+    make_db().record_ticket_thread(4, 14, 'ORD-4', 114)
+
+    tickets = make_db().get_open_tickets()
+    assert [(record.ticket_number, record.thread_id) for record in tickets] == [(4, 114)]
+
+
+def test_allowed_transitions():
+    machine = _machine(PENDING, PENDING)
+    assert machine.transition(1, IN_PROGRESS) == PENDING
+    assert machine.transition(1, RESOLVED) == IN_PROGRESS
+    assert machine.transition(2, CLOSED) == PENDING
+    assert machine.count_by_status() == {PENDING: 0, IN_PROGRESS: 0, RESOLVED: 1, CLOSED: 1}
+    assert machine.stats == {'transitions': 3, 'rejected': 0}
+
+
+@pytest.mark.parametrize('current, requested', [
+    (IN_PROGRESS, CLOSED),
+    (RESOLVED, IN_PROGRESS),
+    (CLOSED, RESOLVED),
+])
+def test_disallowed_transitions_are_rejected(current, requested):
+    machine = _machine(current)
+    assert not machine.can_transition(1, requested)
+    with pytest.raises(InvalidTicketTransition) as rejected:
+        machine.transition(1, requested)
+    assert (rejected.value.current, rejected.value.requested) == (current, requested)
+    assert machine.get(1).status == current
+
+
+def test_open_tickets_are_newest_first():
+    machine = _machine(PENDING, CLOSED, IN_PROGRESS)
+    assert [record.ticket_number for record in machine.open_tickets()] == [3, 1]
+
+
+def test_transition_is_persisted_for_that_ticket_only(make_db):
+    async def scenario():
+        db = await _ready_db(make_db)
+        # Two tickets on the same order
+        for ticket_number in (1, 2):
+            await db.save_lead_async('user#0', 'Name', 'ORD-1', 'Other', ticket_number=ticket_number)
+            db.record_ticket_thread(ticket_number, 10, 'ORD-1', 500 + ticket_number)
+
+        db.transition_ticket(1, IN_PROGRESS)
+        await _wait_for_status(db, 1, IN_PROGRESS)
+        return db
+
+    db = asyncio.run(scenario())
+    assert db.ticket_states.get(1).status == IN_PROGRESS
+    assert db.storage.get_lead_by_ticket_number(1)['status'] == IN_PROGRESS
+    assert db.storage.get_lead_by_ticket_number(2)['status'] == PENDING
+    assert db.ticket_states.get(2).status == PENDING
+
+
+def test_compare_and_set_lets_exactly_one_take_win():
+    machine = _machine(PENDING)
+    machine.transition(1, IN_PROGRESS, expected=PENDING, actor=1)
+    with pytest.raises(InvalidTicketTransition) as lost:
+        machine.transition(1, IN_PROGRESS, expected=PENDING, actor=2)
+    assert lost.value.current == IN_PROGRESS
+    assert machine.get(1).taken_by == 1
+    assert machine.stats['rejected'] == 1
+
+
+def test_ticket_lock_serializes_actions_and_is_released():
+    async def scenario():
+        locks = TicketLocks()
+        events = []
+
+        async def action(name):
+            async with locks.hold(7):
+                events.append(f'{name} start')
+                await asyncio.sleep(0.01)
+                events.append(f'{name} end')
+
+        await asyncio.gather(action('take'), action('close'))
+        return locks, events
+
+    locks, events = asyncio.run(scenario())
+    assert events == ['take start', 'take end', 'close start', 'close end']
+    stats = locks.get_stats()
+    assert stats['held'] == 0
+    assert (stats['acquired'], stats['contended']) == (2, 1)
+    assert stats['hot_tickets'] == [(7, 1)]
+
+
+def test_simultaneous_takes_record_one_conflict(make_db):
+    async def scenario():
+        db = await _ready_db(make_db)
+        await db.save_lead_async('user#0', 'Name', 'ORD-1', 'Other', ticket_number=1)
+        db.record_ticket_thread(1, 10, 'ORD-1', 501)
+
+        results = []
+        for actor in (21, 22):
+            try:
+                results.append(db.transition_ticket(1, IN_PROGRESS, expected=PENDING, actor=actor))
+            except InvalidTicketTransition:
+                results.append('lost')
+
+        await _wait_for_status(db, 1, IN_PROGRESS)
+        return db, results
+
+    db, results = asyncio.run(scenario())
+    assert results == [PENDING, 'lost']
+    assert db.ticket_locks.get_stats()['conflicts'] == 1
+    assert db.tickets.get(1).taken_by == 21
+    assert db.storage.get_lead_by_ticket_number(1)['status'] == IN_PROGRESS
@@ -0,0 +1,55 @@
+"""
+Debug-mode detection of blocking calls on the event loop thread.
+With DEBUG_MODE=True every sync Sheets/Drive call made from a thread that
+runs an asyncio loop is logged once per call site, and asyncio's own
+slow-callback warnings are switched on.
+"""
+import asyncio
+import os
+import traceback
+from config import DEBUG_MODE
+from utils.logger import bot_logger
+
+# asyncio logs any callback/step that holds the loop longer than this
+SLOW_CALLBACK_SECONDS = 0.1
+
+_reported_sites = set()
+
+
+def check_blocking_call(name: str) -> None:
+    """
+    Flag a blocking network call if it runs on an event loop thread (DEBUG_MODE only).
+
+    Args:
+        name: Description of the blocking call
+    """
+    if not DEBUG_MODE:
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # CLI thread or executor worker - blocking is fine here
+        return
+
+    # Innermost frames outside this module and the scheduler, offender's caller chain included
+    frames = [
+        frame for frame in traceback.extract_stack()[:-1]
+        if not frame.filename.endswith(('blocking_guard.py', 'sheets_scheduler.py'))
+    ][-3:]
+    site = tuple((frame.filename, frame.lineno) for frame in frames)
+    if site in _reported_sites:
+        return
+    _reported_sites.add(site)
+    chain = " <- ".join(
+        f"{os.path.basename(frame.filename)}:{frame.lineno} ({frame.name})" for frame in reversed(frames)
+    )
+    bot_logger.warning(f"⚠️  Blocking call on the event loop: {name} at {chain}")
+
+
+def enable_loop_debug(loop: asyncio.AbstractEventLoop) -> None:
+    """Turn on asyncio debug mode and slow-callback logging for a loop (DEBUG_MODE only)."""
+    if not DEBUG_MODE:
+        return
+    loop.set_debug(True)
+    loop.slow_callback_duration = SLOW_CALLBACK_SECONDS
+    bot_logger.info(f"🐞 Event loop debug on: callbacks blocking > {SLOW_CALLBACK_SECONDS * 1000:.0f} ms are logged")
@@ -0,0 +1,491 @@
+"""
+In-process stand-in for Google Sheets.
+Mimics the parts of the gspread / gspread_asyncio surface used by
+GoogleSheetsManager, with configurable latency, error injection and
+quota simulation, so the bot can be load-tested offline.
+"""
+import asyncio
+import collections
+import random
+import re
+import threading
+import time
+import gspread
+from config import (
+    FAQ_TAB_NAME, LEADS_TAB_NAME, ANALYTICS_TAB_NAME,
+    FAKE_SHEETS_LATENCY, FAKE_SHEETS_ERROR_RATE,
+    FAKE_SHEETS_READ_QUOTA, FAKE_SHEETS_WRITE_QUOTA
+)
+from utils.leads_index import LEAD_COLUMNS
+from utils.storage import FAQ_COLUMNS
+
+ANALYTICS_COLUMNS = ('date', 'total_tickets', 'unresolved_queries')
+
+READ = 'read'
+WRITE = 'write'
+
+
+class FakeResponse:
+    """Minimal requests.Response look-alike so gspread.exceptions.APIError can be raised."""
+
+    def __init__(self, status_code: int, message: str):
+        self.status_code = status_code
+        self.text = message
+        self._payload = {'error': {'code': status_code, 'message': message, 'status': 'FAKE'}}
+
+    def json(self) -> dict:
+        return self._payload
+
+
+def _api_error(status_code: int, message: str) -> gspread.exceptions.APIError:
+    """Build the same exception type gspread raises for HTTP errors."""
+    return gspread.exceptions.APIError(FakeResponse(status_code, message))
+
+
+def _column_number(letters: str) -> int:
+    """Convert column letters to a 1-based column number ('A' -> 1, 'AA' -> 27)."""
+    number = 0
+    for letter in letters.upper():
+        number = number * 26 + (ord(letter) - ord('A') + 1)
+    return number
+
+
+def _parse_range(range_name: str) -> tuple:
+    """
+    Parse an A1 range like 'A5:G', 'G12' or 'A2:C10'.
+
+    Returns:
+        Tuple (first_row, first_col, last_row or None, last_col or None)
+    """
+    range_name = range_name.split('!')[-1]
+    start, _, end = range_name.partition(':')
+    match = re.fullmatch(r'([A-Za-z]+)(\d*)', start)
+    if not match:
+        raise _api_error(400, f"Unable to parse range: {range_name}")
+    first_col = _column_number(match.group(1))
+    first_row = int(match.group(2) or 1)
+    if not end:
+        return first_row, first_col, first_row, first_col
+    match = re.fullmatch(r'([A-Za-z]+)(\d*)', end)
+    if not match:
+        raise _api_error(400, f"Unable to parse range: {range_name}")
+    last_row = int(match.group(2)) if match.group(2) else None
+    return first_row, first_col, last_row, _column_number(match.group(1))
+
+
+class FakeCell:
+    """Result of FakeWorksheet.find (same attributes as gspread.Cell)."""
+
+    def __init__(self, row: int, col: int, value: str):
+        self.row = row
+        self.col = col
+        self.value = value
+
+
+class FakeSheetsBackend:
+    """Shared in-memory spreadsheet state plus the latency/error/quota knobs."""
+
+    def __init__(self, latency: float = FAKE_SHEETS_LATENCY, error_rate: float = FAKE_SHEETS_ERROR_RATE,
+                 read_quota: int = FAKE_SHEETS_READ_QUOTA, write_quota: int = FAKE_SHEETS_WRITE_QUOTA,
+                 seed: int = None):
+        """
+        Args:
+            latency: Seconds added to every API call
+            error_rate: Probability (0-1) of a call failing with a 500 error
+            read_quota: Read requests allowed per minute (0 = unlimited)
+            write_quota: Write requests allowed per minute (0 = unlimited)
+            seed: Random seed for reproducible error injection
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.quotas = {READ: read_quota, WRITE: write_quota}
+        self.tabs = {}
+        self.last_update_time = time.time()
+        self.stats = {'reads': 0, 'writes': 0, 'metadata_reads': 0, 'errors_injected': 0, 'rate_limited': 0}
+
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._calls = {READ: collections.deque(), WRITE: collections.deque()}
+
+        self.add_tab(FAQ_TAB_NAME, list(FAQ_COLUMNS))
+        self.add_tab(LEADS_TAB_NAME, list(LEAD_COLUMNS))
+        self.add_tab(ANALYTICS_TAB_NAME, list(ANALYTICS_COLUMNS))
+
+    def add_tab(self, title: str, header: list = None) -> None:
+        """Create a tab (optionally with a header row)."""
+        with self._lock:
+            self.tabs.setdefault(title, [list(header)] if header else [])
+
+    def reset(self) -> None:
+        """Clear every tab down to its header row and reset counters."""
+        with self._lock:
+            for title, rows in self.tabs.items():
+                self.tabs[title] = rows[:1]
+            self.stats = {key: 0 for key in self.stats}
+            for calls in self._calls.values():
+                calls.clear()
+
+    def admit(self, kind: str) -> None:
+        """Apply quota and error injection for one API call (raises like the real API)."""
+        with self._lock:
+            quota = self.quotas.get(kind) or 0
+            if quota:
+                now = time.monotonic()
+                calls = self._calls[kind]
+                while calls and now - calls[0] >= 60:
+                    calls.popleft()
+                if len(calls) >= quota:
+                    self.stats['rate_limited'] += 1
+                    raise _api_error(429, f"Quota exceeded for quota metric '{kind.title()} requests'")
+                calls.append(now)
+
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.stats['errors_injected'] += 1
+                raise _api_error(500, "Internal error encountered (injected)")
+
+            self.stats['reads' if kind == READ else 'writes'] += 1
+
+    def touch(self) -> None:
+        """Record a data change (drives get_lastUpdateTime)."""
+        self.last_update_time = time.time()
+
+    def client(self) -> 'FakeClient':
+        """Get a sync (gspread-style) client."""
+        return FakeClient(self)
+
+    def async_manager(self) -> 'FakeAsyncClientManager':
+        """Get an async (gspread_asyncio-style) client manager."""
+        return FakeAsyncClientManager(self)
+
+
+class FakeWorksheet:
+    """Sync worksheet with the gspread.Worksheet methods used by the bot."""
+
+    def __init__(self, backend: FakeSheetsBackend, title: str):
+        self.backend = backend
+        self.title = title
+
+    @property
+    def _rows(self) -> list:
+        return self.backend.tabs[self.title]
+
+    def _call(self, kind: str) -> None:
+        """Simulate one round trip."""
+        self.backend.admit(kind)
+        if self.backend.latency:
+            time.sleep(self.backend.latency)
+
+    def _check_exists(self) -> None:
+        if self.title not in self.backend.tabs:
+            raise _api_error(400, f"Unable to parse range: '{self.title}'")
+
+    # ----- reads -----
+
+    def _get_all_values(self) -> list:
+        self._check_exists()
+        with self.backend._lock:
+            return [[str(value) for value in row] for row in self._rows]
+
+    def _get_all_records(self, expected_headers: list = None, **kwargs) -> list:
+        values = self._get_all_values()
+        if not values:
+            return []
+        header = values[0]
+        if expected_headers:
+            missing = [column for column in expected_headers if column not in header]
+            if missing:
+                raise gspread.exceptions.GSpreadException(f"headers not found: {missing}")
+        records = []
+        for row in values[1:]:
+            row = row + [''] * (len(header) - len(row))
+            records.append({column: self._numericise(value) for column, value in zip(header, row)})
+        return records
+
+    @staticmethod
+    def _numericise(value: str):
+        """Convert numeric strings like gspread's get_all_records does."""
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                return value
+
+    def _get(self, range_name: str) -> list:
+        self._check_exists()
+        first_row, first_col, last_row, last_col = _parse_range(range_name)
+        values = self._get_all_values()
+        last_row = last_row or len(values)
+        return [
+            row[first_col - 1:last_col] if last_col else row[first_col - 1:]
+            for row in values[first_row - 1:last_row]
+        ]
+
+    def _row_values(self, row: int) -> list:
+        values = self._get_all_values()
+        return values[row - 1] if 0 < row <= len(values) else []
+
+    def _find(self, query: str, in_row: int = None, in_column: int = None):
+        for row_number, row in enumerate(self._get_all_values(), start=1):
+            if in_row and row_number != in_row:
+                continue
+            for col_number, value in enumerate(row, start=1):
+                if in_column and col_number != in_column:
+                    continue
+                if value == str(query):
+                    return FakeCell(row_number, col_number, value)
+        return None
+
+    # ----- writes -----
+
+    def _append_rows(self, rows: list, **kwargs) -> dict:
+        self._check_exists()
+        with self.backend._lock:
+            start_row = len(self._rows) + 1
+            self._rows.extend([list(row) for row in rows])
+            end_row = len(self._rows)
+        self.backend.touch()
+        width = max((len(row) for row in rows), default=1)
+        last_column = chr(ord('A') + width - 1)
+        return {'updates': {
+            'updatedRange': f"{self.title}!A{start_row}:{last_column}{end_row}",
+            'updatedRows': len(rows),
+        }}
+
+    def _set_cell(self, row: int, col: int, value) -> None:
+        """Write one cell, growing the grid as needed (caller holds the lock)."""
+        rows = self._rows
+        while len(rows) < row:
+            rows.append([])
+        cells = rows[row - 1]
+        while len(cells) < col:
+            cells.append('')
+        cells[col - 1] = value
+
+    def _update_cell(self, row: int, col: int, value) -> dict:
+        self._check_exists()
+        with self.backend._lock:
+            self._set_cell(row, col, value)
+        self.backend.touch()
+        return {'updatedCells': 1}
+
+    def _batch_update(self, data: list, **kwargs) -> dict:
+        self._check_exists()
+        updated = 0
+        with self.backend._lock:
+            for update in data:
+                first_row, first_col, _, _ = _parse_range(update['range'])
+                for row_offset, row in enumerate(update['values']):
+                    for col_offset, value in enumerate(row):
+                        if value is None:
+                            continue
+                        self._set_cell(first_row + row_offset, first_col + col_offset, value)
+                        updated += 1
+        self.backend.touch()
+        return {'totalUpdatedCells': updated}
+
+    def _delete_rows(self, start_index: int, end_index: int = None) -> dict:
+        self._check_exists()
+        end_index = end_index or start_index
+        with self.backend._lock:
+            del self._rows[start_index - 1:end_index]
+        self.backend.touch()
+        return {}
+
+    # ----- gspread.Worksheet surface -----
+
+    def get_all_values(self, **kwargs) -> list:
+        self._call(READ)
+        return self._get_all_values()
+
+    def get_all_records(self, expected_headers: list = None, **kwargs) -> list:
+        self._call(READ)
+        return self._get_all_records(expected_headers)
+
+    def get(self, range_name: str = None, **kwargs) -> list:
+        self._call(READ)
+        return self._get(range_name) if range_name else self._get_all_values()
+
+    def row_values(self, row: int, **kwargs) -> list:
+        self._call(READ)
+        return self._row_values(row)
+
+    def find(self, query: str, in_row: int = None, in_column: int = None, **kwargs):
+        self._call(READ)
+        return self._find(query, in_row, in_column)
+
+    def append_row(self, values: list, **kwargs) -> dict:
+        self._call(WRITE)
+        return self._append_rows([values])
+
+    def append_rows(self, values: list, **kwargs) -> dict:
+        self._call(WRITE)
+        return self._append_rows(values)
+
+    def update_cell(self, row: int, col: int, value) -> dict:
+        self._call(WRITE)
+        return self._update_cell(row, col, value)
+
+    def batch_update(self, data: list, **kwargs) -> dict:
+        self._call(WRITE)
+        return self._batch_update(data)
+
+    def delete_rows(self, start_index: int, end_index: int = None) -> dict:
+        self._call(WRITE)
+        return self._delete_rows(start_index, end_index)
+
+
+class FakeSpreadsheet:
+    """Sync spreadsheet (gspread.Spreadsheet surface)."""
+
+    def __init__(self, backend: FakeSheetsBackend):
+        self.backend = backend
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        self.backend.admit(READ)
+        if title not in self.backend.tabs:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return FakeWorksheet(self.backend, title)
+
+    def worksheets(self) -> list:
+        self.backend.admit(READ)
+        return [FakeWorksheet(self.backend, title) for title in self.backend.tabs]
+
+    def get_lastUpdateTime(self) -> str:
+        # Drive metadata: not counted against the Sheets quota
+        with self.backend._lock:
+            self.backend.stats['metadata_reads'] += 1
+        updated = self.backend.last_update_time
+        millis = int(updated * 1000) % 1000
+        return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(updated)) + f'.{millis:03d}Z'
+
+
+class FakeClient:
+    """Sync client (gspread.Client surface)."""
+
+    def __init__(self, backend: FakeSheetsBackend):
+        self.backend = backend
+
+    def open_by_key(self, key: str) -> FakeSpreadsheet:
+        self.backend.admit(READ)
+        return FakeSpreadsheet(self.backend)
+
+
+class FakeAsyncWorksheet:
+    """Async worksheet (gspread_asyncio.AsyncioGspreadWorksheet surface)."""
+
+    def __init__(self, backend: FakeSheetsBackend, title: str):
+        self.backend = backend
+        self.title = title
+        self.ws = FakeWorksheet(backend, title)
+
+    async def _call(self, kind: str) -> None:
+        """Simulate one round trip without blocking the event loop."""
+        self.backend.admit(kind)
+        if self.backend.latency:
+            await asyncio.sleep(self.backend.latency)
+
+    async def get_all_values(self, **kwargs) -> list:
+        await self._call(READ)
+        return self.ws._get_all_values()
+
+    async def get_all_records(self, **kwargs) -> list:
+        await self._call(READ)
+        return self.ws._get_all_records()
+
+    async def get(self, range_name: str = None, **kwargs) -> list:
+        await self._call(READ)
+        return self.ws._get(range_name) if range_name else self.ws._get_all_values()
+
+    async def row_values(self, row: int, **kwargs) -> list:
+        await self._call(READ)
+        return self.ws._row_values(row)
+
+    async def find(self, query: str, in_row: int = None, in_column: int = None, **kwargs):
+        await self._call(READ)
+        return self.ws._find(query, in_row, in_column)
+
+    async def append_row(self, values: list, **kwargs) -> dict:
+        await self._call(WRITE)
+        return self.ws._append_rows([values])
+
+    async def append_rows(self, values: list, **kwargs) -> dict:
+        await self._call(WRITE)
+        return self.ws._append_rows(values)
+
+    async def update_cell(self, row: int, col: int, value) -> dict:
+        await self._call(WRITE)
+        return self.ws._update_cell(row, col, value)
+
+    async def batch_update(self, data: list, **kwargs) -> dict:
+        await self._call(WRITE)
+        return self.ws._batch_update(data)
+
+    async def delete_rows(self, start_index: int, end_index: int = None) -> dict:
+        await self._call(WRITE)
+        return self.ws._delete_rows(start_index, end_index)
+
+
+class FakeAsyncSpreadsheet:
+    """Async spreadsheet (gspread_asyncio.AsyncioGspreadSpreadsheet surface)."""
+
+    def __init__(self, backend: FakeSheetsBackend):
+        self.backend = backend
+        self.ss = FakeSpreadsheet(backend)
+
+    async def worksheet(self, title: str) -> FakeAsyncWorksheet:
+        self.backend.admit(READ)
+        if self.backend.latency:
+            await asyncio.sleep(self.backend.latency)
+        if title not in self.backend.tabs:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return FakeAsyncWorksheet(self.backend, title)
+
+    async def worksheets(self) -> list:
+        self.backend.admit(READ)
+        if self.backend.latency:
+            await asyncio.sleep(self.backend.latency)
+        return [FakeAsyncWorksheet(self.backend, title) for title in self.backend.tabs]
+
+    async def add_worksheet(self, title: str, rows: int = 1000, cols: int = 26, **kwargs) -> FakeAsyncWorksheet:
+        self.backend.admit(WRITE)
+        if self.backend.latency:
+            await asyncio.sleep(self.backend.latency)
+        self.backend.add_tab(title)
+        return FakeAsyncWorksheet(self.backend, title)
+
+
+class FakeAsyncClient:
+    """Async client (gspread_asyncio.AsyncioGspreadClient surface)."""
+
+    def __init__(self, backend: FakeSheetsBackend):
+        self.backend = backend
+
+    async def open_by_key(self, key: str) -> FakeAsyncSpreadsheet:
+        self.backend.admit(READ)
+        if self.backend.latency:
+            await asyncio.sleep(self.backend.latency)
+        return FakeAsyncSpreadsheet(self.backend)
+
+
+class FakeAsyncClientManager:
+    """Async client manager (gspread_asyncio.AsyncioGspreadClientManager surface)."""
+
+    def __init__(self, backend: FakeSheetsBackend):
+        self.backend = backend
+        self._client = FakeAsyncClient(backend)
+
+    async def authorize(self) -> FakeAsyncClient:
+        return self._client
+
+
+# Shared instance so the bot, benchmarks and the CLI see the same data
+fake_backend = None
+
+def get_fake_backend() -> FakeSheetsBackend:
+    """Get the shared fake Sheets backend (created from config on first use)."""
+    global fake_backend
+    if fake_backend is None:
+        fake_backend = FakeSheetsBackend()
+    return fake_backend
@@ -0,0 +1,78 @@
+"""
+Immutable FAQ lookup index.
+Built once per FAQ reload and swapped in as a whole, so lookups are a
+single dict access and readers never see a half-built index.
+"""
+from types import MappingProxyType
+
+
+def normalize_trigger(trigger_id) -> str:
+    """Normalize a trigger_id for lookups (case- and whitespace-insensitive)."""
+    return str(trigger_id).strip().lower()
+
+
+class FAQIndex:
+    """Read-only snapshot of the FAQ records keyed by trigger_id."""
+
+    __slots__ = ('version', 'records', 'duplicates', '_by_trigger', '_positions')
+
+    def __init__(self, records: list, version: int = 0):
+        """
+        Build the index.
+
+        Args:
+            records: FAQ records in sheet order
+            version: Version number of this snapshot
+        """
+        by_trigger = {}
+        positions = {}
+        seen = {}
+        duplicates = []
+
+        for position, record in enumerate(records):
+            raw = str(record.get('trigger_id', ''))
+            key = normalize_trigger(raw)
+            if not key:
+                continue
+            if key in seen:
+                # First row wins (same as the old linear scan) - report the shadowed one
+                duplicates.append((key, seen[key], position))
+                continue
+            seen[key] = position
+            by_trigger[key] = record
+            positions[key] = position
+            # Exact sheet spelling as an alias so most lookups skip normalization
+            if raw != key:
+                by_trigger.setdefault(raw, record)
+                positions.setdefault(raw, position)
+
+        self.version = version
+        self.records = tuple(records)
+        self.duplicates = tuple(duplicates)
+        self._by_trigger = MappingProxyType(by_trigger)
+        self._positions = MappingProxyType(positions)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, trigger_id: str) -> dict:
+        """
+        Find a FAQ record by trigger_id.
+
+        Args:
+            trigger_id: Trigger ID (any case/surrounding whitespace)
+
+        Returns:
+            FAQ record or None if not found
+        """
+        record = self._by_trigger.get(trigger_id)
+        if record is None:
+            record = self._by_trigger.get(normalize_trigger(trigger_id))
+        return record
+
+    def position_of(self, trigger_id: str) -> int:
+        """Get the 0-based sheet position of a trigger_id, or -1 if not found."""
+        position = self._positions.get(trigger_id)
+        if position is None:
+            position = self._positions.get(normalize_trigger(trigger_id), -1)
+        return position
@@ -0,0 +1,63 @@
+"""
+In-process FAQ view counters.
+Views are counted per (hour, trigger_id) in a plain dict on the event loop
+thread (no locks, no I/O) and drained periodically into FAQ Views rows.
+"""
+import time
+from collections import Counter
+
+# Header of the FAQ Views tab (one row per hour and FAQ)
+FAQ_VIEW_COLUMNS = ('hour', 'trigger_id', 'views')
+
+
+class FAQViewCounter:
+    """Hourly FAQ view counts waiting to be flushed."""
+
+    def __init__(self):
+        self._counts = Counter()
+        self._hour_bucket = None
+        self._hour_label = ''
+        self.total_views = 0
+        self.total_flushed = 0  # Views confirmed written to Sheets
+
+    def record(self, trigger_id) -> None:
+        """
+        Count one FAQ view (called from button callbacks - must stay O(1)).
+
+        Args:
+            trigger_id: Viewed FAQ's trigger_id
+        """
+        now = time.time()
+        bucket = int(now // 3600)
+        if bucket != self._hour_bucket:
+            # Format the hour label once per hour, not once per view
+            self._hour_label = time.strftime('%Y-%m-%d %H:00', time.localtime(bucket * 3600))
+            self._hour_bucket = bucket
+        self._counts[(self._hour_label, str(trigger_id))] += 1
+        self.total_views += 1
+
+    def pending(self) -> int:
+        """Number of (hour, trigger_id) counters waiting to be flushed."""
+        return len(self._counts)
+
+    def drain(self) -> list:
+        """
+        Take all counts and start a new set (swap, so record() never waits).
+
+        Returns:
+            FAQ Views rows [hour, trigger_id, views], oldest hour first
+        """
+        counts, self._counts = self._counts, Counter()
+        return [
+            [hour, trigger_id, views]
+            for (hour, trigger_id), views in sorted(counts.items())
+        ]
+
+    def restore(self, rows: list) -> None:
+        """Put drained rows back after a failed flush so the counts are not lost."""
+        for hour, trigger_id, views in rows:
+            self._counts[(hour, trigger_id)] += views
+
+    def mark_flushed(self, rows: list) -> None:
+        """Count rows the journal flusher has written to Sheets."""
+        self.total_flushed += sum(int(views) for _, _, views in rows)
@@ -0,0 +1,77 @@
+"""
+Prefix index for FAQ autocomplete.
+Sorted array of normalized keys (full button_label, every word-start
+suffix of the label, and trigger_id) searched with bisect, so each
+keystroke costs O(log n + results) instead of a scan of the FAQ cache.
+"""
+import bisect
+import re
+
+WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def normalize_prefix(text) -> str:
+    """Lowercase and collapse whitespace (also applied to what the user types)."""
+    return ' '.join(str(text).lower().split())
+
+
+class FAQPrefixIndex:
+    """Immutable prefix index over one FAQ cache version."""
+
+    __slots__ = ('records', '_keys', '_positions')
+
+    def __init__(self, records: tuple):
+        """
+        Build the index.
+
+        Args:
+            records: FAQ records in sheet order
+        """
+        entries = set()
+        for position, record in enumerate(records):
+            label = normalize_prefix(record.get('button_label', ''))
+            if label:
+                entries.add((label, position))
+                # "refund" also finds "How do I get a refund?"
+                for match in WORD_PATTERN.finditer(label):
+                    if match.start():
+                        entries.add((label[match.start():], position))
+            trigger = normalize_prefix(record.get('trigger_id', ''))
+            if trigger:
+                entries.add((trigger, position))
+
+        # Ties sort by sheet position, so earlier FAQ are suggested first
+        ordered = sorted(entries)
+        self.records = records
+        self._keys = [key for key, _ in ordered]
+        self._positions = [position for _, position in ordered]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def complete(self, prefix: str, limit: int = 25) -> list:
+        """
+        Find FAQ whose label, a word of the label, or trigger_id starts with a prefix.
+
+        Args:
+            prefix: What the user has typed so far
+            limit: Maximum number of suggestions (Discord shows up to 25)
+
+        Returns:
+            List of FAQ positions, in alphabetical order of the matched key
+        """
+        prefix = normalize_prefix(prefix)
+        if not prefix:
+            return list(range(min(limit, len(self.records))))
+
+        found = []
+        seen = set()
+        keys = self._keys
+        idx = bisect.bisect_left(keys, prefix)
+        while idx < len(keys) and len(found) < limit and keys[idx].startswith(prefix):
+            position = self._positions[idx]
+            if position not in seen:
+                seen.add(position)
+                found.append(position)
+            idx += 1
+        return found
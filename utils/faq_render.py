@@ -0,0 +1,280 @@
+"""
+Prebuilt FAQ embeds, button specs and browser pages.
+Rendered once per FAQ cache version and reused by every !faq, View FAQ
+and FAQ button click until the next reload swaps in a new version.
+Browser pages are only rendered when someone pages to them.
+"""
+import threading
+import time
+
+import discord
+
+from utils.faq_index import FAQIndex
+from utils.faq_prefix import FAQPrefixIndex
+
+# Discord allows 25 components per view; one slot stays free
+FAQ_BUTTON_LIMIT = 24
+
+# Discord allows 25 options per select menu
+FAQ_PAGE_SIZE = 25
+
+
+class FAQButtonSpec:
+    """Label and custom_id of one FAQ button."""
+
+    __slots__ = ('position', 'label', 'custom_id')
+
+    def __init__(self, position: int, label: str, custom_id: str):
+        self.position = position
+        self.label = label
+        self.custom_id = custom_id
+
+
+class FAQPage:
+    """One browser page: select menu options plus the page embed."""
+
+    __slots__ = ('number', 'options', 'embed')
+
+    def __init__(self, number: int, options: tuple, embed: discord.Embed):
+        self.number = number
+        self.options = options
+        self.embed = embed
+
+
+class FAQArtifacts:
+    """Rendered FAQ for one cache version. Embeds are shared - never mutate them."""
+
+    def __init__(self, index: FAQIndex, stats: dict):
+        self.version = index.version
+        self.records = index.records
+        self._stats = stats
+        self._lock = threading.Lock()
+        self._answers = {}  # position -> answer embed (rendered on first view)
+        self._pages = {}    # page number -> FAQPage (rendered on first visit)
+        self._prefix_index = None
+        self._positions = {id(record): position for position, record in enumerate(self.records)}
+
+        listed = self.records[:FAQ_BUTTON_LIMIT]
+        self.buttons = tuple(
+            FAQButtonSpec(
+                position,
+                str(record.get('button_label', f'FAQ {position + 1}'))[:80],
+                f"faq_{record.get('trigger_id', f'faq_{position}')}_{position}"[:100],
+            )
+            for position, record in enumerate(listed)
+        )
+
+        # !faq command: numbered list of the buttons below
+        self.list_embed = discord.Embed(
+            title="📖 Frequently Asked Questions",
+            description="Click button to view answer",
+            color=discord.Color.green()
+        )
+        for spec in self.buttons:
+            self.list_embed.add_field(
+                name=f"{spec.position + 1}. {spec.label}",
+                value="Click button to view answer",
+                inline=False
+            )
+
+        # Support menu "View FAQ" button
+        self.menu_embed = discord.Embed(
+            title="📖 FAQ List",
+            description="Select the FAQ you want to view:",
+            color=discord.Color.green()
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def position_of(self, record: dict) -> int:
+        """Get the position of a record from this version, or -1."""
+        return self._positions.get(id(record), -1)
+
+    def button_for(self, position: int) -> FAQButtonSpec:
+        """Button spec for any position (listed ones are prebuilt)."""
+        if position < len(self.buttons):
+            return self.buttons[position]
+        record = self.records[position]
+        return FAQButtonSpec(
+            position,
+            str(record.get('button_label', f'FAQ {position + 1}'))[:80],
+            f"faq_{record.get('trigger_id', f'faq_{position}')}_{position}"[:100],
+        )
+
+    @property
+    def prefix_index(self) -> FAQPrefixIndex:
+        """Autocomplete index for this version (built on the first autocomplete request)."""
+        prefix_index = self._prefix_index
+        if prefix_index is None:
+            with self._lock:
+                if self._prefix_index is None:
+                    started = time.perf_counter()
+                    self._prefix_index = FAQPrefixIndex(self.records)
+                    self._stats['prefix_builds'] += 1
+                    self._stats['last_prefix_build_ms'] = (time.perf_counter() - started) * 1000
+                prefix_index = self._prefix_index
+        return prefix_index
+
+    @property
+    def prefix_index_ready(self) -> bool:
+        """Whether prefix_index is already built (reading it will not block)."""
+        return self._prefix_index is not None
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self.records) // FAQ_PAGE_SIZE))
+
+    def page(self, number: int) -> FAQPage:
+        """
+        Get a browser page, rendering it on first use.
+
+        Args:
+            number: 0-based page number (clamped to the valid range)
+
+        Returns:
+            Shared FAQPage
+        """
+        number = min(max(number, 0), self.page_count - 1)
+        page = self._pages.get(number)
+        if page is not None:
+            self._stats['page_hits'] += 1
+            return page
+
+        with self._lock:
+            page = self._pages.get(number)
+            if page is None:
+                page = self._build_page(number)
+                self._pages[number] = page
+                self._stats['page_builds'] += 1
+            else:
+                self._stats['page_hits'] += 1
+        return page
+
+    def _build_page(self, number: int) -> FAQPage:
+        start = number * FAQ_PAGE_SIZE
+        options = []
+        lines = []
+        for position, record in enumerate(self.records[start:start + FAQ_PAGE_SIZE], start):
+            label = str(record.get('button_label', '')) or f'FAQ {position + 1}'
+            answer = ' '.join(str(record.get('response_text', '')).split())
+            options.append(discord.SelectOption(
+                label=f"{position + 1}. {label}"[:100],
+                value=str(position),
+                description=(answer[:97] + "...") if len(answer) > 100 else (answer or None)
+            ))
+            lines.append(f"**{position + 1}.** {label[:80]}")
+
+        embed = discord.Embed(
+            title="📖 Frequently Asked Questions",
+            description="\n".join(lines) or "No FAQ available.",
+            color=discord.Color.green()
+        )
+        embed.set_footer(text=f"Page {number + 1}/{self.page_count} - pick a question from the menu, or search with !faq <question>")
+        return FAQPage(number, tuple(options), embed)
+
+    def answer_embed(self, position: int) -> discord.Embed:
+        """
+        Get the answer embed for a FAQ, rendering it on first use.
+
+        Args:
+            position: 0-based position in the FAQ records
+
+        Returns:
+            Shared answer embed
+        """
+        embed = self._answers.get(position)
+        if embed is not None:
+            self._stats['answer_hits'] += 1
+            return embed
+
+        with self._lock:
+            embed = self._answers.get(position)
+            if embed is None:
+                record = self.records[position]
+                embed = discord.Embed(
+                    title=f"❓ {record.get('button_label', 'Question')}",
+                    description=record.get('response_text', 'Answer not available.'),
+                    color=discord.Color.green()
+                )
+                embed.set_footer(text="FAQ Support Bot")
+                self._answers[position] = embed
+                self._stats['answer_builds'] += 1
+            else:
+                self._stats['answer_hits'] += 1
+        return embed
+
+
+class FAQRenderCache:
+    """Keeps the FAQArtifacts of the current FAQ cache version."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._artifacts = None
+        self.stats = {
+            'builds': 0,
+            'hits': 0,
+            'answer_builds': 0,
+            'answer_hits': 0,
+            'page_builds': 0,
+            'page_hits': 0,
+            'prefix_builds': 0,
+            'last_prefix_build_ms': 0.0,
+            'last_build_ms': 0.0,
+            'total_build_ms': 0.0,
+        }
+
+    def get(self, index: FAQIndex) -> FAQArtifacts:
+        """
+        Get the rendered FAQ for an index version (built on the first request per version).
+
+        Args:
+            index: Current FAQ index
+
+        Returns:
+            FAQArtifacts for index.version
+        """
+        artifacts = self._artifacts
+        if artifacts is not None and artifacts.version == index.version:
+            self.stats['hits'] += 1
+            return artifacts
+
+        with self._lock:
+            artifacts = self._artifacts
+            if artifacts is None or artifacts.version != index.version:
+                started = time.perf_counter()
+                artifacts = FAQArtifacts(index, self.stats)
+                duration_ms = (time.perf_counter() - started) * 1000
+                self._artifacts = artifacts
+                self.stats['builds'] += 1
+                self.stats['last_build_ms'] = duration_ms
+                self.stats['total_build_ms'] += duration_ms
+            else:
+                self.stats['hits'] += 1
+        return artifacts
+
+    def get_stats(self) -> dict:
+        """
+        Get render cache metrics.
+
+        Returns:
+            Dict with version, build counts/durations and hit ratios
+        """
+        stats = self.stats
+        lookups = stats['builds'] + stats['hits']
+        answers = stats['answer_builds'] + stats['answer_hits']
+        return {
+            'version': self._artifacts.version if self._artifacts is not None else None,
+            'builds': stats['builds'],
+            'hits': stats['hits'],
+            'hit_ratio': round(stats['hits'] / lookups, 3) if lookups else 0.0,
+            'answer_builds': stats['answer_builds'],
+            'answer_hits': stats['answer_hits'],
+            'answer_hit_ratio': round(stats['answer_hits'] / answers, 3) if answers else 0.0,
+            'page_builds': stats['page_builds'],
+            'page_hits': stats['page_hits'],
+            'prefix_builds': stats['prefix_builds'],
+            'last_prefix_build_ms': round(stats['last_prefix_build_ms'], 2),
+            'last_build_ms': round(stats['last_build_ms'], 2),
+            'avg_build_ms': round(stats['total_build_ms'] / stats['builds'], 2) if stats['builds'] else 0.0,
+        }
@@ -0,0 +1,167 @@
+"""
+Free-text FAQ search.
+Inverted index over button_label and response_text with BM25 ranking,
+updated incrementally when the FAQ cache reloads (only added, changed
+or removed entries are re-tokenized).
+"""
+import heapq
+import math
+import re
+import threading
+
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# Very common words (English and Indonesian) that only add noise to the ranking
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'can', 'do', 'does', 'for', 'from', 'how', 'i',
+    'if', 'in', 'is', 'it', 'my', 'of', 'on', 'or', 'the', 'to', 'what', 'when', 'where', 'with',
+    'you', 'your', 'ada', 'dan', 'di', 'ini', 'itu', 'ke', 'saya', 'untuk', 'yang',
+})
+
+# button_label terms count this many times (the label is the question)
+LABEL_BOOST = 2
+
+
+def tokenize(text) -> list:
+    """Lowercase, split on non-word characters and drop stopwords."""
+    return [token for token in TOKEN_PATTERN.findall(str(text).lower()) if token not in STOPWORDS]
+
+
+class FAQSearchEngine:
+    """BM25-ranked search over FAQ records."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._next_doc_id = 0
+        self._doc_ids = {}      # (trigger_id, button_label, response_text) -> doc_id
+        self._docs = {}         # doc_id -> record
+        self._doc_lengths = {}  # doc_id -> weighted token count
+        self._doc_terms = {}    # doc_id -> {term: weighted frequency}
+        self._postings = {}     # term -> {doc_id: weighted frequency}
+        self._norms = {}        # doc_id -> BM25 length normalization (recomputed on update)
+        self._total_length = 0
+        self.version = None     # FAQ cache version the index was last updated to
+        self.stats = {'builds': 0, 'docs_added': 0, 'docs_removed': 0}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    @staticmethod
+    def _doc_key(record: dict) -> tuple:
+        return (
+            str(record.get('trigger_id', '')),
+            str(record.get('button_label', '')),
+            str(record.get('response_text', '')),
+        )
+
+    def update(self, records: list, version: int = None) -> tuple:
+        """
+        Bring the index in line with the current FAQ records.
+
+        Args:
+            records: FAQ records in sheet order
+            version: FAQ cache version of the records (an older version than the indexed one is ignored)
+
+        Returns:
+            Tuple (added, removed) document counts
+        """
+        with self._lock:
+            if version is not None and self.version is not None and version <= self.version:
+                return 0, 0
+            self.version = version
+            wanted = {}
+            for record in records:
+                wanted.setdefault(self._doc_key(record), record)
+
+            removed = [key for key in self._doc_ids if key not in wanted]
+            for key in removed:
+                self._remove(self._doc_ids.pop(key))
+
+            added = 0
+            for key, record in wanted.items():
+                doc_id = self._doc_ids.get(key)
+                if doc_id is None:
+                    self._doc_ids[key] = self._add(record)
+                    added += 1
+                else:
+                    # Same content - keep the postings, point at the new record object
+                    self._docs[doc_id] = record
+
+            if added or removed:
+                self._update_norms()
+            self.stats['builds'] += 1
+            self.stats['docs_added'] += added
+            self.stats['docs_removed'] += len(removed)
+            return added, len(removed)
+
+    def _add(self, record: dict) -> int:
+        doc_id = self._next_doc_id
+        self._next_doc_id += 1
+
+        terms = {}
+        for token in tokenize(record.get('button_label', '')):
+            terms[token] = terms.get(token, 0) + LABEL_BOOST
+        for token in tokenize(record.get('response_text', '')):
+            terms[token] = terms.get(token, 0) + 1
+
+        length = sum(terms.values())
+        self._docs[doc_id] = record
+        self._doc_terms[doc_id] = terms
+        self._doc_lengths[doc_id] = length
+        self._total_length += length
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = frequency
+        return doc_id
+
+    def _update_norms(self) -> None:
+        """Precompute each document's length normalization so search does not redo it per posting."""
+        if not self._docs:
+            self._norms = {}
+            return
+        avg_length = self._total_length / len(self._docs) or 1
+        self._norms = {
+            doc_id: self.k1 * (1 - self.b + self.b * length / avg_length)
+            for doc_id, length in self._doc_lengths.items()
+        }
+
+    def _remove(self, doc_id: int) -> None:
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        del self._docs[doc_id]
+
+    def search(self, query: str, limit: int = 5) -> list:
+        """
+        Rank FAQ records against a free-text query.
+
+        Args:
+            query: User's question
+            limit: Maximum number of results
+
+        Returns:
+            List of (score, record) tuples, best match first
+        """
+        terms = set(tokenize(query))
+        with self._lock:
+            doc_count = len(self._docs)
+            if not terms or not doc_count:
+                return []
+
+            norms = self._norms
+            scale = self.k1 + 1
+            scores = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5)) * scale
+                for doc_id, frequency in postings.items():
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency / (frequency + norms[doc_id])
+
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            return [(round(score, 4), self._docs[doc_id]) for doc_id, score in best]
@@ -0,0 +1,102 @@
+"""
+On-disk FAQ snapshot.
+Written after every FAQ sync that changed the cache and loaded at startup,
+so the bot can serve FAQ before (or without) reaching Google Sheets.
+
+File layout: one JSON header line, then one JSON payload line holding the
+FAQ rows as [trigger_id, button_label, response_text] lists. The header
+carries the format version and a CRC32 checksum of the payload line
+(corruption check only - cheap enough to keep warm starts in single-digit ms).
+"""
+import json
+import os
+import time
+import zlib
+
+from utils.storage import FAQ_COLUMNS
+
+SNAPSHOT_FORMAT = 1
+
+
+class FAQSnapshot:
+    """FAQ records plus the change-detection state they were synced at."""
+
+    __slots__ = ('records', 'content_hash', 'revision', 'saved_at')
+
+    def __init__(self, records: list, content_hash: str = None, revision: str = None, saved_at: float = None):
+        self.records = records
+        self.content_hash = content_hash
+        self.revision = revision
+        self.saved_at = saved_at
+
+
+def save_snapshot(path: str, snapshot: FAQSnapshot) -> int:
+    """
+    Atomically write a FAQ snapshot (temp file + rename).
+
+    Args:
+        path: Snapshot file path
+        snapshot: Snapshot to write
+
+    Returns:
+        Size of the written file in bytes
+    """
+    rows = [[str(record.get(column, '')) for column in FAQ_COLUMNS] for record in snapshot.records]
+    payload = json.dumps(rows, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    header = json.dumps({
+        'format': SNAPSHOT_FORMAT,
+        'count': len(rows),
+        'crc32': zlib.crc32(payload),
+        'content_hash': snapshot.content_hash,
+        'revision': snapshot.revision,
+        'saved_at': snapshot.saved_at or time.time(),
+    }, separators=(',', ':')).encode('utf-8')
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(header + b'\n' + payload + b'\n')
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    return len(header) + len(payload) + 2
+
+
+def load_snapshot(path: str) -> FAQSnapshot:
+    """
+    Load and verify a FAQ snapshot.
+
+    Args:
+        path: Snapshot file path
+
+    Returns:
+        FAQSnapshot, or None if the file is missing
+
+    Raises:
+        ValueError: If the file is from another format version, truncated or corrupt
+    """
+    try:
+        with open(path, 'rb') as f:
+            header_line = f.readline()
+            payload = f.readline().rstrip(b'\n')
+    except FileNotFoundError:
+        return None
+
+    try:
+        header = json.loads(header_line)
+    except ValueError:
+        raise ValueError("FAQ snapshot header is not valid JSON")
+    if header.get('format') != SNAPSHOT_FORMAT:
+        raise ValueError(f"Unsupported FAQ snapshot format {header.get('format')!r}")
+    if zlib.crc32(payload) != header.get('crc32'):
+        raise ValueError("FAQ snapshot checksum mismatch")
+
+    rows = json.loads(payload)
+    if len(rows) != header.get('count'):
+        raise ValueError("FAQ snapshot row count mismatch")
+
+    # Dict literals are noticeably faster than dict(zip(FAQ_COLUMNS, row)) on large sets
+    records = [
+        {'trigger_id': trigger_id, 'button_label': button_label, 'response_text': response_text}
+        for trigger_id, button_label, response_text in rows
+    ]
+    return FAQSnapshot(records, header.get('content_hash'), header.get('revision'), header.get('saved_at'))
@@ -0,0 +1,160 @@
+"""
+Write-ahead journal for rows waiting to be appended to Google Sheets.
+Rows are committed to local disk first and pushed to Sheets in batches.
+"""
+import json
+import threading
+import time
+from config import LOCAL_DB_FILE
+from utils.local_db import open_local_db
+
+
+def insert_journal_entry(conn, tab_name: str, row_data: list) -> int:
+    """
+    Insert one journal row on a connection (lets callers journal inside their own transaction).
+
+    Args:
+        conn: Connection to the database that holds the write_journal table
+        tab_name: Target worksheet name
+        row_data: Row values in sheet column order
+
+    Returns:
+        Journal entry ID
+    """
+    cursor = conn.execute(
+        "INSERT INTO write_journal (tab_name, row_data, created_at) VALUES (?, ?, ?)",
+        (tab_name, json.dumps(row_data), time.time())
+    )
+    return cursor.lastrowid
+
+
+class WriteJournal:
+    """Durable journal of pending Sheets appends, grouped by tab name."""
+
+    def __init__(self, db_path: str = LOCAL_DB_FILE):
+        """Open (or create) the journal table."""
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = open_local_db(db_path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS write_journal (
+                entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                tab_name TEXT NOT NULL,
+                row_data TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+
+    def append(self, tab_name: str, row_data: list) -> int:
+        """
+        Durably record a row that must be appended to a tab.
+
+        Args:
+            tab_name: Target worksheet name
+            row_data: Row values in sheet column order
+
+        Returns:
+            Journal entry ID
+        """
+        with self._lock:
+            return insert_journal_entry(self._conn, tab_name, row_data)
+
+    def append_many(self, tab_name: str, rows: list) -> None:
+        """
+        Durably record several rows for one tab in a single transaction.
+
+        Args:
+            tab_name: Target worksheet name
+            rows: Rows of values in sheet column order
+        """
+        if not rows:
+            return
+        created_at = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO write_journal (tab_name, row_data, created_at) VALUES (?, ?, ?)",
+                    [(tab_name, json.dumps(row_data), created_at) for row_data in rows]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def get_pending(self, tab_name: str = None, limit: int = None) -> list:
+        """
+        Get rows that have not been flushed yet, oldest first.
+
+        Args:
+            tab_name: Only return rows for this tab (all tabs if None)
+            limit: Maximum number of rows to return
+
+        Returns:
+            List of (entry_id, tab_name, row_data) tuples
+        """
+        query = "SELECT entry_id, tab_name, row_data FROM write_journal"
+        params = []
+        if tab_name is not None:
+            query += " WHERE tab_name = ?"
+            params.append(tab_name)
+        query += " ORDER BY entry_id"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [(entry_id, tab, json.loads(row_data)) for entry_id, tab, row_data in rows]
+
+    def update_pending(self, entry_id: int, row_data: list) -> bool:
+        """
+        Rewrite a row that has not been flushed yet.
+
+        Args:
+            entry_id: Journal entry ID
+            row_data: New row values
+
+        Returns:
+            True if the entry was still pending and was updated
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE write_journal SET row_data = ? WHERE entry_id = ?",
+                (json.dumps(row_data), entry_id)
+            )
+            return cursor.rowcount > 0
+
+    def pending_count(self, tab_name: str = None) -> int:
+        """Count rows waiting to be flushed."""
+        with self._lock:
+            if tab_name is None:
+                row = self._conn.execute("SELECT COUNT(*) FROM write_journal").fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM write_journal WHERE tab_name = ?", (tab_name,)
+                ).fetchone()
+        return row[0]
+
+    def mark_flushed(self, entry_ids: list) -> None:
+        """
+        Remove entries that were successfully appended to Sheets.
+
+        Args:
+            entry_ids: Journal entry IDs to remove
+        """
+        if not entry_ids:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "DELETE FROM write_journal WHERE entry_id = ?",
+                    [(entry_id,) for entry_id in entry_ids]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
@@ -0,0 +1,188 @@
+"""
+In-memory index of the Leads tab.
+Maps order_id, ticket_number and discord_tag to sheet rows so lookups
+and status updates do not need to scan the sheet.
+"""
+
+# Leads tab column order (1-based sheet column = index + 1)
+LEAD_COLUMNS = ('timestamp', 'ticket_number', 'discord_tag', 'name', 'order_id', 'issue_type', 'status')
+STATUS_COLUMN = LEAD_COLUMNS.index('status') + 1
+TICKET_NUMBER_COLUMN = LEAD_COLUMNS.index('ticket_number') + 1
+
+
+def _key(value) -> str:
+    """Normalize a lookup key."""
+    return str(value).strip()
+
+
+class LeadRecord:
+    """One lead row. row_number is None while the row is still in the write journal."""
+
+    __slots__ = ('row_number', 'journal_id', 'values')
+
+    def __init__(self, values: list, row_number: int = None, journal_id: int = None):
+        # Pad short rows so every column index is valid
+        self.values = list(values) + [''] * (len(LEAD_COLUMNS) - len(values))
+        self.row_number = row_number
+        self.journal_id = journal_id
+
+    @property
+    def status(self) -> str:
+        return self.values[STATUS_COLUMN - 1]
+
+    def to_dict(self) -> dict:
+        """Map row values to column names."""
+        return {column: self.values[idx] for idx, column in enumerate(LEAD_COLUMNS)}
+
+
+class LeadsIndex:
+    """Resident index of lead rows keyed by order_id, ticket_number and discord_tag."""
+
+    def __init__(self):
+        self.loaded = False
+        self.known_row_count = 0  # Sheet rows covered by the index, header included
+        self._by_row = {}
+        self._by_journal_id = {}
+        self._by_order_id = {}
+        self._by_ticket_number = {}
+        self._by_discord_tag = {}
+        self._sheet_by_ticket_number = {}  # Only rows that already exist in the sheet
+
+    def __len__(self) -> int:
+        return len(self._by_row) + len(self._by_journal_id)
+
+    def load(self, all_values: list) -> None:
+        """
+        Rebuild the index from a full sheet download.
+
+        Args:
+            all_values: Result of get_all_values() (first row is the header)
+        """
+        self._by_row = {}
+        self._by_journal_id = {}
+        self._by_order_id = {}
+        self._by_ticket_number = {}
+        self._by_discord_tag = {}
+        self._sheet_by_ticket_number = {}
+        self.known_row_count = 1 if all_values else 0
+        self.add_rows(2, all_values[1:])
+        self.loaded = True
+
+    def add_rows(self, start_row: int, rows: list) -> int:
+        """
+        Index rows that were read from the sheet.
+
+        Args:
+            start_row: Sheet row number of the first row
+            rows: Row values
+
+        Returns:
+            Number of non-empty rows indexed
+        """
+        added = 0
+        for row_number, values in enumerate(rows, start=start_row):
+            self.known_row_count = max(self.known_row_count, row_number)
+            if not any(str(value).strip() for value in values):
+                continue
+            self._add(LeadRecord(values, row_number=row_number))
+            added += 1
+        return added
+
+    def add_pending(self, journal_id: int, values: list) -> LeadRecord:
+        """Index a row that was journaled but not yet appended to the sheet."""
+        record = LeadRecord(values, journal_id=journal_id)
+        self._add(record)
+        return record
+
+    def mark_flushed(self, journal_ids: list, start_row: int) -> None:
+        """
+        Assign sheet row numbers to journaled rows after a batch append.
+
+        Args:
+            journal_ids: Journal entry IDs in the order they were appended
+            start_row: Sheet row number of the first appended row
+        """
+        for row_number, journal_id in enumerate(journal_ids, start=start_row):
+            record = self._by_journal_id.pop(journal_id, None)
+            if record is None:
+                continue
+            record.row_number = row_number
+            record.journal_id = None
+            self._by_row[row_number] = record
+            self._sheet_by_ticket_number[_key(record.values[TICKET_NUMBER_COLUMN - 1])] = record
+        if self.loaded:
+            self.known_row_count = max(self.known_row_count, start_row + len(journal_ids) - 1)
+
+    def drop_pending(self, journal_ids: list) -> None:
+        """
+        Forget journaled rows that turned out to be in the sheet already.
+
+        Args:
+            journal_ids: Journal entry IDs to drop
+        """
+        for journal_id in journal_ids:
+            record = self._by_journal_id.pop(journal_id, None)
+            if record is None:
+                continue
+            lead = record.to_dict()
+            sheet_record = self._sheet_by_ticket_number.get(_key(lead['ticket_number']))
+            # Point the lookups back at the sheet copy of the row
+            for index, key in ((self._by_order_id, 'order_id'), (self._by_ticket_number, 'ticket_number')):
+                if index.get(_key(lead[key])) is record:
+                    if sheet_record is not None:
+                        index[_key(lead[key])] = sheet_record
+                    else:
+                        del index[_key(lead[key])]
+            tagged = self._by_discord_tag.get(_key(lead['discord_tag']), [])
+            if record in tagged:
+                tagged.remove(record)
+
+    def in_sheet(self, ticket_number) -> bool:
+        """Check whether a ticket number already has a row in the sheet."""
+        return _key(ticket_number) in self._sheet_by_ticket_number
+
+    def sheet_rows(self) -> list:
+        """Get the values of every indexed row that exists in the sheet, in row order."""
+        return [self._by_row[row_number].values for row_number in sorted(self._by_row)]
+
+    def get_by_order_id(self, order_id: str) -> LeadRecord:
+        """Get the most recent lead for an order ID."""
+        return self._by_order_id.get(_key(order_id))
+
+    def get_by_ticket_number(self, ticket_number) -> LeadRecord:
+        """Get a lead by ticket number."""
+        return self._by_ticket_number.get(_key(ticket_number))
+
+    def get_by_discord_tag(self, discord_tag: str) -> list:
+        """Get all leads opened by a Discord user, oldest first."""
+        return list(self._by_discord_tag.get(_key(discord_tag), []))
+
+    def max_ticket_number(self) -> int:
+        """Get the highest ticket number in the index."""
+        max_number = 0
+        for ticket_number in self._by_ticket_number:
+            try:
+                max_number = max(max_number, int(ticket_number))
+            except ValueError:
+                pass
+        return max_number
+
+    def set_status(self, record: LeadRecord, new_status: str) -> None:
+        """Write-through status change for an indexed lead."""
+        record.values[STATUS_COLUMN - 1] = new_status
+
+    def _add(self, record: LeadRecord) -> None:
+        """Register a record under every key."""
+        if record.row_number is not None:
+            self._by_row[record.row_number] = record
+            self._sheet_by_ticket_number[_key(record.values[TICKET_NUMBER_COLUMN - 1])] = record
+        else:
+            self._by_journal_id[record.journal_id] = record
+
+        lead = record.to_dict()
+        if _key(lead['order_id']):
+            self._by_order_id[_key(lead['order_id'])] = record
+        if _key(lead['ticket_number']):
+            self._by_ticket_number[_key(lead['ticket_number'])] = record
+        if _key(lead['discord_tag']):
+            self._by_discord_tag.setdefault(_key(lead['discord_tag']), []).append(record)
@@ -0,0 +1,24 @@
+"""
+Local SQLite helpers shared by the bot's on-disk stores.
+All stores live in a single database file inside DATA_DIR.
+"""
+import sqlite3
+from config import LOCAL_DB_FILE
+
+
+def open_local_db(db_path: str = LOCAL_DB_FILE) -> sqlite3.Connection:
+    """
+    Open a connection to the local SQLite database.
+
+    Args:
+        db_path: Path to the database file
+
+    Returns:
+        sqlite3 connection (usable from the bot thread and the CLI thread)
+    """
+    conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+    # WAL keeps readers from blocking the writer; FULL sync makes each commit durable
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=FULL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
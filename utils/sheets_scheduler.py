@@ -0,0 +1,337 @@
+"""
+Quota-aware scheduler for Google Sheets API calls.
+Token buckets are sized to the per-minute read/write quotas and waiting
+calls are served by priority lane instead of failing with 429 errors.
+Retries (429 and 5xx) go back through the buckets, so each one costs a token.
+"""
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from utils.logger import db_logger
+from utils.blocking_guard import check_blocking_call
+
+# Priority lanes (lower value is served first)
+PRIORITY_TICKET_WRITE = 0
+PRIORITY_STATUS = 1
+PRIORITY_REPORTING = 2
+PRIORITY_NAMES = {
+    PRIORITY_TICKET_WRITE: 'ticket_write',
+    PRIORITY_STATUS: 'status',
+    PRIORITY_REPORTING: 'reporting',
+}
+
+READ = 'read'
+WRITE = 'write'
+
+
+def _status_code(error: Exception):
+    """HTTP status of a gspread APIError (None for other exceptions)."""
+    code = getattr(error, 'code', None)
+    if code is None:
+        response = getattr(error, 'response', None)
+        code = getattr(response, 'status_code', None)
+    return code
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """Check whether an exception is a Sheets 429 (quota exceeded) error."""
+    return _status_code(error) == 429
+
+
+def is_server_error(error: Exception) -> bool:
+    """Check whether an exception is a transient Sheets 5xx error."""
+    code = _status_code(error)
+    return isinstance(code, int) and 500 <= code <= 599
+
+
+class SheetsRetriesExhausted(Exception):
+    """A Sheets call still failed with 429/5xx after max_retries requeues (original error as __cause__)."""
+
+    def __init__(self, kind: str, attempts: int, error: Exception):
+        self.kind = kind
+        self.attempts = attempts
+        self.error = error
+        super().__init__(f"Sheets {kind} request failed after {attempts} attempts: {error}")
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: int, capacity: int = None):
+        self.rate = per_minute / 60.0
+        self.capacity = float(capacity or per_minute)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """
+        Take one token if available.
+
+        Returns:
+            0 if a token was taken, otherwise seconds until one is expected
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._refill(now)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def release(self) -> None:
+        """Return an unused token."""
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+    def pause(self, seconds: float) -> None:
+        """Empty the bucket and stop handing out tokens for a while (after a 429)."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = 0.0
+            self._updated = now
+            self._paused_until = max(self._paused_until, now + seconds)
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self.tokens
+
+
+class SheetsRequestScheduler:
+    """Single gate for every Sheets call made by GoogleSheetsManager."""
+
+    def __init__(self, read_per_minute: int, write_per_minute: int, max_retries: int = 5,
+                 backoff_base: float = 2.0, backoff_max: float = 60.0):
+        self.buckets = {READ: TokenBucket(read_per_minute), WRITE: TokenBucket(write_per_minute)}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._seq = itertools.count()
+        self._loop = None
+        self._queues = {}
+        self._wakeups = {}
+        self._dispatchers = {}
+
+        self._stats_lock = threading.Lock()
+        self._lane_stats = {
+            name: {'requests': 0, 'waiting': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+            for name in PRIORITY_NAMES.values()
+        }
+        self.rate_limited = 0
+        self.server_errors = 0
+        self.retries = 0
+        self.exhausted = 0
+
+    # ----- async path -----
+
+    def _ensure_dispatchers(self) -> None:
+        """Create dispatcher tasks on the running loop (recreated if the bot restarts on a new loop)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queues = {READ: [], WRITE: []}
+            self._wakeups = {READ: asyncio.Event(), WRITE: asyncio.Event()}
+            self._dispatchers = {}
+        for kind in (READ, WRITE):
+            task = self._dispatchers.get(kind)
+            if task is None or task.done():
+                self._dispatchers[kind] = loop.create_task(self._dispatch(kind))
+
+    async def _dispatch(self, kind: str) -> None:
+        """Grant queued requests one token at a time, highest priority first."""
+        queue = self._queues[kind]
+        wakeup = self._wakeups[kind]
+        bucket = self.buckets[kind]
+        while True:
+            if not queue:
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+
+            wait = bucket.try_acquire()
+            if wait > 0:
+                # Sleep until a token is due (or new work arrives), then re-check the top of the queue
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+                continue
+
+            _, _, permit = heapq.heappop(queue)
+            if permit.done():
+                # Caller was cancelled while queued - give the token back to the next request
+                bucket.release()
+                continue
+            permit.set_result(None)
+
+    async def _acquire(self, kind: str, priority: int) -> None:
+        """Wait in the priority lane until a token is granted."""
+        self._ensure_dispatchers()
+        lane = self._lane_stats[PRIORITY_NAMES[priority]]
+        permit = self._loop.create_future()
+        heapq.heappush(self._queues[kind], (priority, next(self._seq), permit))
+        self._wakeups[kind].set()
+
+        queued_at = time.monotonic()
+        with self._stats_lock:
+            lane['waiting'] += 1
+        try:
+            await permit
+        finally:
+            waited = time.monotonic() - queued_at
+            with self._stats_lock:
+                lane['waiting'] -= 1
+                lane['requests'] += 1
+                lane['total_wait'] += waited
+                lane['max_wait'] = max(lane['max_wait'], waited)
+
+    async def run(self, func, *args, kind: str = READ, priority: int = PRIORITY_REPORTING, **kwargs):
+        """
+        Run an async Sheets call through the scheduler.
+
+        Args:
+            func: Coroutine function performing exactly one API call
+            kind: READ or WRITE quota
+            priority: Priority lane (PRIORITY_*)
+
+        Returns:
+            Result of func
+
+        Raises:
+            SheetsRetriesExhausted: If every attempt failed with a 429 or 5xx error
+        """
+        attempt = 0
+        while True:
+            await self._acquire(kind, priority)
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                delay = self._on_retryable_error(e, kind, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    # ----- sync path (legacy gspread client) -----
+
+    def run_sync(self, func, *args, kind: str = READ, priority: int = PRIORITY_REPORTING, **kwargs):
+        """
+        Run a blocking Sheets call through the same quota buckets.
+
+        Args:
+            func: Callable performing exactly one API call
+            kind: READ or WRITE quota
+            priority: Priority lane (only used for statistics on this path)
+
+        Returns:
+            Result of func
+
+        Raises:
+            SheetsRetriesExhausted: If every attempt failed with a 429 or 5xx error
+        """
+        check_blocking_call(f"Sheets {getattr(func, '__name__', 'call')}")
+        lane = self._lane_stats[PRIORITY_NAMES[priority]]
+        attempt = 0
+        while True:
+            queued_at = time.monotonic()
+            while True:
+                wait = self.buckets[kind].try_acquire()
+                if wait <= 0:
+                    break
+                time.sleep(wait)
+            waited = time.monotonic() - queued_at
+            with self._stats_lock:
+                lane['requests'] += 1
+                lane['total_wait'] += waited
+                lane['max_wait'] = max(lane['max_wait'], waited)
+
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = self._on_retryable_error(e, kind, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                time.sleep(delay)
+
+    # ----- shared -----
+
+    def _on_retryable_error(self, error: Exception, kind: str, attempt: int) -> float:
+        """
+        Decide whether a failed call is requeued.
+
+        Returns:
+            Backoff delay before the request waits for a token again,
+            or None if the error is not retryable
+
+        Raises:
+            SheetsRetriesExhausted: If the request already used max_retries requeues
+        """
+        if not (is_rate_limited(error) or is_server_error(error)):
+            return None
+        if attempt >= self.max_retries:
+            with self._stats_lock:
+                self.exhausted += 1
+            db_logger.error(f"Sheets {kind} request failed after {attempt + 1} attempts: {str(error)}")
+            raise SheetsRetriesExhausted(kind, attempt + 1, error) from error
+        if is_rate_limited(error):
+            return self._on_rate_limited(kind, attempt)
+        return self._on_server_error(kind, attempt, error)
+
+    def _on_rate_limited(self, kind: str, attempt: int) -> float:
+        """Record a 429, pause the bucket and return the backoff delay."""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        self.buckets[kind].pause(delay)
+        with self._stats_lock:
+            self.rate_limited += 1
+            self.retries += 1
+        db_logger.warning(f"Sheets {kind} quota exceeded, requeueing request in {delay:.1f}s")
+        return delay
+
+    def _on_server_error(self, kind: str, attempt: int, error: Exception) -> float:
+        """Record a 5xx and return the backoff delay (the bucket is not paused - it is not a quota error)."""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        with self._stats_lock:
+            self.server_errors += 1
+            self.retries += 1
+        db_logger.warning(f"Sheets {kind} server error, requeueing request in {delay:.1f}s: {str(error)}")
+        return delay
+
+    def get_stats(self) -> dict:
+        """
+        Get queue depth and wait-time statistics.
+
+        Returns:
+            Dict with per-lane stats, per-kind queue depth and retry counters
+        """
+        with self._stats_lock:
+            lanes = {}
+            for name, lane in self._lane_stats.items():
+                lanes[name] = {
+                    'queued': lane['waiting'],
+                    'requests': lane['requests'],
+                    'avg_wait_ms': round(lane['total_wait'] / lane['requests'] * 1000, 1) if lane['requests'] else 0.0,
+                    'max_wait_ms': round(lane['max_wait'] * 1000, 1),
+                }
+            return {
+                'lanes': lanes,
+                'queue_depth': {kind: len(self._queues.get(kind, [])) for kind in (READ, WRITE)},
+                'tokens_available': {kind: round(bucket.available, 1) for kind, bucket in self.buckets.items()},
+                'rate_limited': self.rate_limited,
+                'server_errors': self.server_errors,
+                'retries': self.retries,
+                'exhausted': self.exhausted,
+            }
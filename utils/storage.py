@@ -0,0 +1,335 @@
+"""
+Local storage backends for leads, FAQ and analytics.
+The backend is the system of record on the interaction path; Google Sheets
+is kept in sync as a mirror by GoogleSheetsManager.
+"""
+import threading
+from abc import ABC, abstractmethod
+from config import LOCAL_DB_FILE, STORAGE_BACKEND
+from utils.journal import insert_journal_entry
+from utils.leads_index import LEAD_COLUMNS
+from utils.local_db import open_local_db
+
+FAQ_COLUMNS = ('trigger_id', 'button_label', 'response_text')
+
+
+class StorageBackend(ABC):
+    """Interface for the local system of record."""
+
+    name = 'base'
+
+    @abstractmethod
+    def add_lead(self, row_data: list) -> None:
+        """Insert a new lead (row values in Leads column order)."""
+
+    @abstractmethod
+    def add_lead_journaled(self, row_data: list, tab_name: str) -> int:
+        """
+        Insert a new lead and its write-journal entry in one transaction.
+
+        Only valid when the write_journal table lives in this backend's database.
+
+        Returns:
+            Journal entry ID
+        """
+
+    @abstractmethod
+    def delete_lead(self, ticket_number: int) -> None:
+        """Remove a lead (undoes an add_lead whose journal write failed)."""
+
+    @abstractmethod
+    def import_leads(self, rows: list) -> int:
+        """Insert leads read from Sheets, skipping ticket numbers already stored."""
+
+    @abstractmethod
+    def get_lead(self, order_id: str) -> dict:
+        """Get the most recent lead for an order ID, or None."""
+
+    @abstractmethod
+    def update_lead_status(self, order_id: str, new_status: str) -> bool:
+        """Change the status of the most recent lead for an order ID."""
+
+    @abstractmethod
+    def get_lead_by_ticket_number(self, ticket_number: int) -> dict:
+        """Get the lead with a ticket number, or None."""
+
+    @abstractmethod
+    def update_ticket_status(self, ticket_number: int, new_status: str) -> bool:
+        """Change the status of the lead with a ticket number."""
+
+    @abstractmethod
+    def get_unsynced_leads(self) -> list:
+        """Get leads whose status has not been mirrored to Sheets yet."""
+
+    @abstractmethod
+    def mark_lead_synced(self, ticket_number: int, status: str) -> None:
+        """Mark a lead's status as mirrored (ignored if it changed again meanwhile)."""
+
+    @abstractmethod
+    def get_recent_leads(self, limit: int = 50) -> list:
+        """Get the most recent leads, oldest first."""
+
+    @abstractmethod
+    def count_leads(self) -> int:
+        """Count stored leads."""
+
+    @abstractmethod
+    def max_ticket_number(self) -> int:
+        """Get the highest stored ticket number."""
+
+    @abstractmethod
+    def get_faq(self) -> list:
+        """Get stored FAQ records in sheet order."""
+
+    @abstractmethod
+    def replace_faq(self, records: list) -> None:
+        """Replace all stored FAQ records."""
+
+    @abstractmethod
+    def add_analytics(self, row_data: list) -> None:
+        """Store an analytics row (date, total_tickets, unresolved_queries)."""
+
+
+class SQLiteStorage(StorageBackend):
+    """SQLite-backed system of record (use ':memory:' for a non-persistent store)."""
+
+    name = 'sqlite'
+
+    def __init__(self, db_path: str = LOCAL_DB_FILE):
+        """Open (or create) the storage tables."""
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = open_local_db(db_path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS leads (
+                ticket_number INTEGER PRIMARY KEY,
+                timestamp TEXT,
+                discord_tag TEXT,
+                name TEXT,
+                order_id TEXT,
+                issue_type TEXT,
+                status TEXT,
+                sheet_synced INTEGER NOT NULL DEFAULT 1
+            );
+            CREATE INDEX IF NOT EXISTS idx_leads_order_id ON leads (order_id);
+            CREATE INDEX IF NOT EXISTS idx_leads_unsynced ON leads (sheet_synced) WHERE sheet_synced = 0;
+
+            CREATE TABLE IF NOT EXISTS faq (
+                position INTEGER PRIMARY KEY,
+                trigger_id TEXT,
+                button_label TEXT,
+                response_text TEXT
+            );
+
+            CREATE TABLE IF NOT EXISTS analytics (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT,
+                total_tickets INTEGER,
+                unresolved_queries INTEGER
+            );
+            """
+        )
+
+    @staticmethod
+    def _lead_params(row_data: list) -> tuple:
+        """Convert Leads row values to insert parameters."""
+        values = list(row_data) + [''] * (len(LEAD_COLUMNS) - len(row_data))
+        lead = dict(zip(LEAD_COLUMNS, values))
+        return (
+            int(lead['ticket_number']), str(lead['timestamp']), str(lead['discord_tag']),
+            str(lead['name']), str(lead['order_id']).strip(), str(lead['issue_type']), str(lead['status'])
+        )
+
+    @staticmethod
+    def _lead_dict(row: tuple) -> dict:
+        """Map a leads table row to column names."""
+        return dict(zip(LEAD_COLUMNS, (row[1], row[0], row[2], row[3], row[4], row[5], row[6])))
+
+    def _execute_write(self, sql: str, params=()) -> int:
+        """Run a single write statement and return the affected row count."""
+        with self._lock:
+            return self._conn.execute(sql, params).rowcount
+
+    def add_lead(self, row_data: list) -> None:
+        self._execute_write(
+            """
+            INSERT INTO leads (ticket_number, timestamp, discord_tag, name, order_id, issue_type, status)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            self._lead_params(row_data)
+        )
+
+    def add_lead_journaled(self, row_data: list, tab_name: str) -> int:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(
+                    """
+                    INSERT INTO leads (ticket_number, timestamp, discord_tag, name, order_id, issue_type, status)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    self._lead_params(row_data)
+                )
+                journal_id = insert_journal_entry(self._conn, tab_name, row_data)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return journal_id
+
+    def delete_lead(self, ticket_number: int) -> None:
+        self._execute_write("DELETE FROM leads WHERE ticket_number = ?", (int(ticket_number),))
+
+    def import_leads(self, rows: list) -> int:
+        params = []
+        for row_data in rows:
+            try:
+                params.append(self._lead_params(row_data))
+            except (TypeError, ValueError):
+                # Rows without a numeric ticket_number cannot be keyed
+                continue
+
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO leads
+                        (ticket_number, timestamp, discord_tag, name, order_id, issue_type, status)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    params
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return self._conn.total_changes - before
+
+    def get_lead(self, order_id: str) -> dict:
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT ticket_number, timestamp, discord_tag, name, order_id, issue_type, status
+                FROM leads WHERE order_id = ? ORDER BY ticket_number DESC LIMIT 1
+                """,
+                (str(order_id).strip(),)
+            ).fetchone()
+        return self._lead_dict(row) if row else None
+
+    def update_lead_status(self, order_id: str, new_status: str) -> bool:
+        updated = self._execute_write(
+            """
+            UPDATE leads SET status = ?, sheet_synced = 0
+            WHERE ticket_number = (
+                SELECT MAX(ticket_number) FROM leads WHERE order_id = ?
+            )
+            """,
+            (new_status, str(order_id).strip())
+        )
+        return updated > 0
+
+    def get_lead_by_ticket_number(self, ticket_number: int) -> dict:
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT ticket_number, timestamp, discord_tag, name, order_id, issue_type, status
+                FROM leads WHERE ticket_number = ?
+                """,
+                (int(ticket_number),)
+            ).fetchone()
+        return self._lead_dict(row) if row else None
+
+    def update_ticket_status(self, ticket_number: int, new_status: str) -> bool:
+        updated = self._execute_write(
+            "UPDATE leads SET status = ?, sheet_synced = 0 WHERE ticket_number = ?",
+            (new_status, int(ticket_number))
+        )
+        return updated > 0
+
+    def get_unsynced_leads(self) -> list:
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT ticket_number, timestamp, discord_tag, name, order_id, issue_type, status
+                FROM leads WHERE sheet_synced = 0 ORDER BY ticket_number
+                """
+            ).fetchall()
+        return [self._lead_dict(row) for row in rows]
+
+    def mark_lead_synced(self, ticket_number: int, status: str) -> None:
+        self._execute_write(
+            "UPDATE leads SET sheet_synced = 1 WHERE ticket_number = ? AND status = ?",
+            (int(ticket_number), status)
+        )
+
+    def get_recent_leads(self, limit: int = 50) -> list:
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT ticket_number, timestamp, discord_tag, name, order_id, issue_type, status
+                FROM leads ORDER BY ticket_number DESC LIMIT ?
+                """,
+                (limit,)
+            ).fetchall()
+        return [self._lead_dict(row) for row in reversed(rows)]
+
+    def count_leads(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM leads").fetchone()[0]
+
+    def max_ticket_number(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(MAX(ticket_number), 0) FROM leads").fetchone()[0]
+
+    def get_faq(self) -> list:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT trigger_id, button_label, response_text FROM faq ORDER BY position"
+            ).fetchall()
+        return [dict(zip(FAQ_COLUMNS, row)) for row in rows]
+
+    def replace_faq(self, records: list) -> None:
+        params = [
+            (position, str(record.get('trigger_id', '')), str(record.get('button_label', '')),
+             str(record.get('response_text', '')))
+            for position, record in enumerate(records)
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM faq")
+                self._conn.executemany(
+                    "INSERT INTO faq (position, trigger_id, button_label, response_text) VALUES (?, ?, ?, ?)",
+                    params
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def add_analytics(self, row_data: list) -> None:
+        self._execute_write(
+            "INSERT INTO analytics (date, total_tickets, unresolved_queries) VALUES (?, ?, ?)",
+            tuple(row_data[:3])
+        )
+
+
+def create_storage_backend(backend: str = STORAGE_BACKEND) -> StorageBackend:
+    """
+    Create the configured storage backend.
+
+    Args:
+        backend: 'sqlite' (persistent, in DATA_DIR) or 'memory' (rebuilt from Sheets on every start)
+
+    Returns:
+        StorageBackend instance
+    """
+    backend = (backend or 'sqlite').lower()
+    if backend == 'sqlite':
+        return SQLiteStorage(LOCAL_DB_FILE)
+    if backend == 'memory':
+        return SQLiteStorage(':memory:')
+    raise ValueError(f"Unknown STORAGE_BACKEND '{backend}' (expected 'sqlite' or 'memory')")
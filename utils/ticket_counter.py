@@ -0,0 +1,89 @@
+"""
+Persistent ticket number allocator.
+Numbers come from an atomic counter in the local SQLite database,
+so allocating one never touches the network.
+"""
+import threading
+from config import LOCAL_DB_FILE
+from utils.local_db import open_local_db
+
+
+class TicketNumberAllocator:
+    """Atomic, restart-safe ticket number sequence."""
+
+    SEQUENCE_NAME = 'ticket_number'
+
+    def __init__(self, db_path: str = LOCAL_DB_FILE):
+        """Open (or create) the sequence table."""
+        self._lock = threading.Lock()
+        self._conn = open_local_db(db_path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sequences (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+            """
+        )
+
+    def is_seeded(self) -> bool:
+        """Check whether the sequence has been seeded."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM sequences WHERE name = ?", (self.SEQUENCE_NAME,)
+            ).fetchone()
+        return row is not None
+
+    def seed(self, last_number: int) -> int:
+        """
+        Make sure the sequence is at least last_number (never moves it backwards).
+
+        Args:
+            last_number: Highest ticket number already in use
+
+        Returns:
+            Current sequence value
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO sequences (name, value) VALUES (?, 0)",
+                    (self.SEQUENCE_NAME,)
+                )
+                self._conn.execute(
+                    "UPDATE sequences SET value = MAX(value, ?) WHERE name = ?",
+                    (int(last_number), self.SEQUENCE_NAME)
+                )
+                value = self._conn.execute(
+                    "SELECT value FROM sequences WHERE name = ?", (self.SEQUENCE_NAME,)
+                ).fetchone()[0]
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return value
+
+    def next(self) -> int:
+        """
+        Allocate the next ticket number.
+
+        Returns:
+            New ticket number (unique across concurrent callers and restarts)
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.execute(
+                    "UPDATE sequences SET value = value + 1 WHERE name = ?", (self.SEQUENCE_NAME,)
+                )
+                if cursor.rowcount == 0:
+                    raise RuntimeError("Ticket number sequence has not been seeded")
+                value = self._conn.execute(
+                    "SELECT value FROM sequences WHERE name = ?", (self.SEQUENCE_NAME,)
+                ).fetchone()[0]
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return value
@@ -0,0 +1,168 @@
+"""
+Bounded worker pool for ticket processing.
+Submissions are acknowledged as soon as they are queued; a fixed number of
+workers then run the slow part (persistence and Discord fan-out), retrying
+failed jobs with exponential backoff. Queue depth and worker utilization
+are tracked for !stats and the ticket pipeline benchmark.
+"""
+import asyncio
+import time
+from utils.logger import event_logger
+
+
+class TicketJob:
+    """One submitted ticket waiting for (or going through) processing."""
+
+    def __init__(self, ticket_number: int, payload: dict):
+        self.ticket_number = ticket_number
+        self.payload = payload
+        self.attempts = 0
+        self.enqueued_at = time.perf_counter()
+        # Progress markers so a retry does not repeat steps that already succeeded
+        self.saved = False
+        self.thread = None
+        self.steps_done = set()
+
+
+class TicketWorkerPool:
+    """Fixed-size pool of asyncio workers draining a bounded ticket queue."""
+
+    def __init__(self, handler, on_failure=None, workers: int = 4, max_queue: int = 100,
+                 max_attempts: int = 3, retry_delay: float = 1.0):
+        """
+        Create the pool (workers start on the first submit).
+
+        Args:
+            handler: Coroutine function(job) that processes a job; raising triggers a retry
+            on_failure: Optional coroutine function(job, error) called once retries are exhausted
+            workers: Number of concurrent workers
+            max_queue: Jobs that may wait before submissions are rejected
+            max_attempts: Attempts per job, including the first
+            retry_delay: Seconds before the first retry (doubled on each further retry)
+        """
+        self.handler = handler
+        self.on_failure = on_failure
+        self.worker_count = max(1, workers)
+        self.max_queue = max_queue
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self._queue = None
+        self._workers = []
+        self._busy = 0
+        self._started_at = None
+        self.stats = {
+            'submitted': 0,
+            'rejected': 0,
+            'processed': 0,
+            'failed': 0,
+            'retries': 0,
+            'peak_depth': 0,
+            'busy_seconds': 0.0,
+            'total_wait_ms': 0.0,
+            'total_process_ms': 0.0,
+        }
+
+    def _ensure_started(self):
+        """Create the queue and workers on the running loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._started_at = time.perf_counter()
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < self.worker_count:
+            self._workers.append(asyncio.create_task(self._worker_loop()))
+
+    def full(self) -> bool:
+        """Check whether a new submission would be rejected."""
+        return self._queue is not None and self._queue.full()
+
+    def submit(self, job: TicketJob) -> None:
+        """
+        Queue a job without waiting.
+
+        Args:
+            job: Ticket job
+
+        Raises:
+            asyncio.QueueFull: If max_queue jobs are already waiting
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.stats['rejected'] += 1
+            raise
+        self.stats['submitted'] += 1
+        self.stats['peak_depth'] = max(self.stats['peak_depth'], self._queue.qsize())
+
+    async def join(self) -> None:
+        """Wait until every queued job has been processed (or has failed)."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _worker_loop(self):
+        while True:
+            job = await self._queue.get()
+            self._busy += 1
+            started = time.perf_counter()
+            self.stats['total_wait_ms'] += (started - job.enqueued_at) * 1000
+            try:
+                await self._run(job)
+            finally:
+                elapsed = time.perf_counter() - started
+                self.stats['busy_seconds'] += elapsed
+                self.stats['total_process_ms'] += elapsed * 1000
+                self._busy -= 1
+                self._queue.task_done()
+
+    async def _run(self, job: TicketJob):
+        """Process a job, retrying with backoff until it succeeds or runs out of attempts."""
+        while True:
+            job.attempts += 1
+            try:
+                await self.handler(job)
+                self.stats['processed'] += 1
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if job.attempts >= self.max_attempts:
+                    self.stats['failed'] += 1
+                    event_logger.error(f"Ticket #{job.ticket_number} failed after {job.attempts} attempt(s): {str(e)}")
+                    if self.on_failure is not None:
+                        try:
+                            await self.on_failure(job, e)
+                        except Exception as failure_error:
+                            event_logger.error(f"Error reporting failed ticket #{job.ticket_number}: {str(failure_error)}")
+                    return
+                delay = self.retry_delay * (2 ** (job.attempts - 1))
+                self.stats['retries'] += 1
+                event_logger.warning(
+                    f"Ticket #{job.ticket_number} attempt {job.attempts} failed ({str(e)}), retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    def get_stats(self) -> dict:
+        """
+        Get queue and worker metrics.
+
+        Returns:
+            Dict with queue depth, busy workers, utilization, job counts and average wait/processing time
+        """
+        stats = self.stats
+        finished = stats['processed'] + stats['failed']
+        uptime = time.perf_counter() - self._started_at if self._started_at is not None else 0.0
+        return {
+            'workers': self.worker_count,
+            'busy_workers': self._busy,
+            'queue_depth': self._queue.qsize() if self._queue is not None else 0,
+            'max_queue': self.max_queue,
+            'peak_depth': stats['peak_depth'],
+            'utilization': round(stats['busy_seconds'] / (uptime * self.worker_count), 3) if uptime else 0.0,
+            'submitted': stats['submitted'],
+            'rejected': stats['rejected'],
+            'processed': stats['processed'],
+            'failed': stats['failed'],
+            'retries': stats['retries'],
+            'avg_wait_ms': round(stats['total_wait_ms'] / finished, 2) if finished else 0.0,
+            'avg_process_ms': round(stats['total_process_ms'] / finished, 2) if finished else 0.0,
+        }
@@ -0,0 +1,287 @@
+"""
+Ticket state: the local ticket state table and the in-memory state machine.
+The table keeps just enough about each ticket (user, order, thread, status)
+to rebuild its persistent Discord views after a restart without reading
+Google Sheets; the state machine answers take/close decisions from memory.
+"""
+import asyncio
+import contextlib
+import threading
+import time
+from collections import Counter
+from config import LOCAL_DB_FILE
+from utils.local_db import open_local_db
+
+
+class TicketRecord:
+    """One row of the ticket state table."""
+
+    __slots__ = ('ticket_number', 'user_id', 'order_id', 'thread_id', 'status', 'taken_by')
+
+    def __init__(self, ticket_number: int, user_id: int, order_id: str, thread_id: int, status: str,
+                 taken_by: int = None):
+        self.ticket_number = ticket_number
+        self.user_id = user_id
+        self.order_id = order_id
+        self.thread_id = thread_id
+        self.status = status
+        self.taken_by = taken_by  # Staff member who took the ticket (in memory only)
+
+
+class TicketStateStore:
+    """Compact, restart-safe table of ticket threads and their status."""
+
+    def __init__(self, db_path: str = LOCAL_DB_FILE):
+        """Open (or create) the ticket state table."""
+        self._lock = threading.Lock()
+        self._conn = open_local_db(db_path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS ticket_state (
+                ticket_number INTEGER PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                order_id TEXT NOT NULL,
+                thread_id INTEGER NOT NULL,
+                status TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_ticket_state_open
+                ON ticket_state (ticket_number) WHERE status IN ('PENDING', 'IN_PROGRESS');
+            """
+        )
+
+    def add(self, ticket_number: int, user_id: int, order_id: str, thread_id: int, status: str = 'PENDING') -> None:
+        """
+        Record a ticket once its thread exists (replaces an earlier row for the same number).
+
+        Args:
+            ticket_number: Ticket number
+            user_id: Discord ID of the user who opened the ticket
+            order_id: Order ID from the form
+            thread_id: Ticket thread ID
+            status: Initial status
+        """
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO ticket_state (ticket_number, user_id, order_id, thread_id, status)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (int(ticket_number), int(user_id), str(order_id), int(thread_id), status)
+            )
+
+    def get(self, ticket_number: int) -> TicketRecord:
+        """Get a ticket's state, or None if it is not tracked."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT ticket_number, user_id, order_id, thread_id, status FROM ticket_state WHERE ticket_number = ?",
+                (int(ticket_number),)
+            ).fetchone()
+        return TicketRecord(*row) if row else None
+
+    def set_statuses(self, statuses: dict) -> None:
+        """
+        Write several status changes in one transaction.
+
+        Args:
+            statuses: ticket_number -> status
+        """
+        if not statuses:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "UPDATE ticket_state SET status = ? WHERE ticket_number = ?",
+                    [(status, int(ticket_number)) for ticket_number, status in statuses.items()]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def open_tickets(self) -> list:
+        """
+        Get every ticket whose buttons are still live, newest first (one indexed query).
+
+        Returns:
+            List of TicketRecord
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT ticket_number, user_id, order_id, thread_id, status FROM ticket_state
+                WHERE status IN ('PENDING', 'IN_PROGRESS') ORDER BY ticket_number DESC
+                """
+            ).fetchall()
+        return [TicketRecord(*row) for row in rows]
+
+
+# Ticket statuses (same values as the Leads tab status column)
+PENDING = 'PENDING'
+IN_PROGRESS = 'IN_PROGRESS'
+RESOLVED = 'Resolved'
+CLOSED = 'Closed'
+
+# Allowed status changes: staff take a pending ticket, the user closes it while
+# nobody has taken it, staff resolve it at any point before it is finished
+TICKET_TRANSITIONS = {
+    PENDING: frozenset((IN_PROGRESS, CLOSED, RESOLVED)),
+    IN_PROGRESS: frozenset((RESOLVED,)),
+    RESOLVED: frozenset(),
+    CLOSED: frozenset(),
+}
+
+
+class InvalidTicketTransition(ValueError):
+    """Raised when a ticket cannot move from its current status to the requested one."""
+
+    def __init__(self, ticket_number: int, current: str, requested: str):
+        super().__init__(f"Ticket #{ticket_number} cannot go from {current} to {requested}")
+        self.ticket_number = ticket_number
+        self.current = current
+        self.requested = requested
+
+
+class TicketStateMachine:
+    """
+    Authoritative in-memory ticket status.
+    Decisions (can this ticket be taken/closed?) are answered from a dict;
+    callers persist accepted transitions in the background.
+    """
+
+    def __init__(self, records: list = ()):
+        """
+        Create the machine.
+
+        Args:
+            records: Initially known TicketRecord list (the open tickets at startup)
+        """
+        self._tickets = {record.ticket_number: record for record in records}
+        self.stats = {'transitions': 0, 'rejected': 0}
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+    def get(self, ticket_number: int) -> TicketRecord:
+        """Get a tracked ticket, or None."""
+        return self._tickets.get(ticket_number)
+
+    def track(self, record: TicketRecord) -> TicketRecord:
+        """Start tracking a ticket (a ticket already tracked keeps its in-memory state)."""
+        return self._tickets.setdefault(record.ticket_number, record)
+
+    def can_transition(self, ticket_number: int, new_status: str) -> bool:
+        """Check whether a tracked ticket may move to new_status."""
+        record = self._tickets.get(ticket_number)
+        return record is not None and new_status in TICKET_TRANSITIONS.get(record.status, ())
+
+    def transition(self, ticket_number: int, new_status: str, expected: str = None, actor: int = None) -> str:
+        """
+        Move a ticket to a new status (compare-and-set when expected is given).
+
+        Runs without awaiting, so of two clicks handled on the event loop
+        exactly one sees the old status and wins.
+
+        Args:
+            ticket_number: Tracked ticket number
+            new_status: Requested status
+            expected: Status the caller acted on; the change fails if it moved on
+            actor: Discord ID of the member making the change (kept as taken_by on IN_PROGRESS)
+
+        Returns:
+            The previous status
+
+        Raises:
+            KeyError: If the ticket is not tracked
+            InvalidTicketTransition: If the status is not the expected one or the change is not allowed
+        """
+        record = self._tickets[ticket_number]
+        previous = record.status
+        if (expected is not None and previous != expected) or new_status not in TICKET_TRANSITIONS.get(previous, ()):
+            self.stats['rejected'] += 1
+            raise InvalidTicketTransition(ticket_number, previous, new_status)
+        record.status = new_status
+        if new_status == IN_PROGRESS:
+            record.taken_by = actor
+        self.stats['transitions'] += 1
+        return previous
+
+    def open_tickets(self) -> list:
+        """Get tracked tickets that are still PENDING or IN_PROGRESS, newest first."""
+        return sorted(
+            (record for record in self._tickets.values() if record.status in (PENDING, IN_PROGRESS)),
+            key=lambda record: record.ticket_number,
+            reverse=True
+        )
+
+    def count_by_status(self) -> dict:
+        """Count tracked tickets per status."""
+        counts = dict.fromkeys(TICKET_TRANSITIONS, 0)
+        for record in self._tickets.values():
+            counts[record.status] = counts.get(record.status, 0) + 1
+        return counts
+
+
+class TicketLocks:
+    """
+    Per-ticket asyncio locks with contention metrics.
+    Serialize the Discord side effects of actions on the same ticket (a take's
+    thread join vs. a close archiving the thread); locks exist only while held.
+    """
+
+    def __init__(self, hot_ticket_limit: int = 5):
+        self._locks = {}
+        self._users = Counter()
+        self.hot_ticket_limit = hot_ticket_limit
+        self.hot_tickets = Counter()  # ticket_number -> lock waits + lost races
+        self.stats = {'acquired': 0, 'contended': 0, 'wait_ms': 0.0, 'conflicts': 0}
+
+    @contextlib.asynccontextmanager
+    async def hold(self, ticket_number: int):
+        """
+        Hold a ticket's lock for the duration of the block.
+
+        Args:
+            ticket_number: Ticket number
+        """
+        lock = self._locks.get(ticket_number)
+        if lock is None:
+            lock = self._locks[ticket_number] = asyncio.Lock()
+        self._users[ticket_number] += 1
+        contended = lock.locked()
+        started = time.perf_counter()
+        try:
+            async with lock:
+                self.stats['acquired'] += 1
+                if contended:
+                    self.stats['contended'] += 1
+                    self.stats['wait_ms'] += (time.perf_counter() - started) * 1000
+                    self.hot_tickets[ticket_number] += 1
+                yield
+        finally:
+            self._users[ticket_number] -= 1
+            if not self._users[ticket_number]:
+                del self._users[ticket_number]
+                del self._locks[ticket_number]
+
+    def record_conflict(self, ticket_number: int) -> None:
+        """Count an action that lost a compare-and-set on a ticket."""
+        self.stats['conflicts'] += 1
+        self.hot_tickets[ticket_number] += 1
+
+    def get_stats(self) -> dict:
+        """
+        Get lock contention metrics.
+
+        Returns:
+            Dict with held locks, acquisitions, contended waits, lost races and the hottest tickets
+        """
+        stats = self.stats
+        return {
+            'held': len(self._locks),
+            'acquired': stats['acquired'],
+            'contended': stats['contended'],
+            'avg_wait_ms': round(stats['wait_ms'] / stats['contended'], 2) if stats['contended'] else 0.0,
+            'conflicts': stats['conflicts'],
+            'hot_tickets': self.hot_tickets.most_common(self.hot_ticket_limit),
+        }